@@ -16,6 +16,9 @@ from fastapi.middleware.cors import CORSMiddleware
 # Import API routers and settings
 from app.api.v1.routes import api_router
 from app.core.config import Settings
+from app.db.session import warm_async_pool, dispose_async_engine
+from app.services.auth_service import warm_dummy_password_hash
+from app.utils.crypto import warm_hash_pool
 
 def setup_cors(app: FastAPI) -> None:
     """
@@ -94,6 +97,13 @@ def init_app() -> FastAPI:
     # Register API routes
     setup_routes(app)
     
+    # Open pooled async database connections, start the password hash
+    # workers and create the login dummy hash before serving traffic
+    app.add_event_handler("startup", warm_async_pool)
+    app.add_event_handler("startup", warm_hash_pool)
+    app.add_event_handler("startup", warm_dummy_password_hash)
+    app.add_event_handler("shutdown", dispose_async_engine)
+    
     return app
 
 # Initialize the FastAPI application
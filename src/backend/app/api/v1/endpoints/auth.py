@@ -15,11 +15,10 @@ Human Tasks:
 from typing import Dict, Any
 from fastapi import APIRouter, Depends, HTTPException, status, Response, Cookie
 from fastapi.security import SecurityScopes
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....core.auth import (
-    create_access_token,
-    create_refresh_token,
+    create_token_pair,
     verify_token,
     get_current_user
 )
@@ -41,7 +40,7 @@ router = APIRouter(prefix='/auth', tags=['Authentication'])
 async def register_user(
     user_data: UserRegister,
     auth_service: AuthService,
-    db: Session
+    db: AsyncSession
 ) -> Token:
     """
     Register a new user account with email verification.
@@ -52,12 +51,10 @@ async def register_user(
     """
     try:
         # Create new user account
-        user = auth_service.create_user(user_data)
+        user = await auth_service.create_user(user_data)
         
         # Generate tokens for automatic login
-        token_data = {"sub": str(user.id)}
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token(token_data)
+        access_token, refresh_token = create_token_pair(str(user.id))
         
         return Token(
             access_token=access_token,
@@ -87,7 +84,7 @@ async def login(
     """
     try:
         # Authenticate user and generate tokens
-        tokens = auth_service.login(credentials)
+        tokens = await auth_service.login(credentials)
         
         # Set refresh token in HTTP-only cookie
         response.set_cookie(
@@ -134,7 +131,7 @@ async def refresh_token(
     
     try:
         # Generate new token pair
-        tokens = auth_service.refresh_token(token)
+        tokens = await auth_service.refresh_token(token)
         
         # Update refresh token cookie
         response.set_cookie(
@@ -189,7 +186,7 @@ async def reset_password(
     - Security Standards (6.3 Security Protocols/6.3.1 Security Standards Compliance)
     """
     try:
-        auth_service.reset_password(reset_data.email)
+        await auth_service.reset_password(reset_data.email)
         return {"message": "Password reset instructions sent if email exists"}
         
     except Exception as e:
@@ -209,7 +206,7 @@ async def update_password(
     - Security Standards (6.3 Security Protocols/6.3.1 Security Standards Compliance)
     """
     try:
-        auth_service.change_password(
+        await auth_service.change_password(
             user_id=current_user["sub"],
             current_password=password_data.current_password,
             new_password=password_data.new_password
@@ -12,11 +12,11 @@
 from typing import List, Dict, Optional
 from uuid import UUID
 from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
 from ....services.budget_service import BudgetService
-from ....db.session import get_db
+from ....db.session import get_async_db
 from ....core.auth import get_current_user
 
 # Initialize router with prefix and tags
@@ -26,7 +26,7 @@ router = APIRouter(prefix='/budgets', tags=['budgets'])
 async def create_budget(
     budget_data: BudgetCreate,
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> BudgetResponse:
     """
     Create a new budget for the authenticated user.
@@ -39,8 +39,8 @@ async def create_budget(
     """
     try:
         budget_service = BudgetService(db)
-        return budget_service.create_budget(
-            user_id=current_user['sub'],
+        return await budget_service.create_budget(
+            user_id=UUID(current_user['sub']),
             budget_data=budget_data
         )
     except ValueError as e:
@@ -53,7 +53,7 @@ async def create_budget(
 async def get_budget(
     budget_id: int,
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> BudgetResponse:
     """
     Retrieve a specific budget by ID with progress metrics.
@@ -66,9 +66,9 @@ async def get_budget(
     """
     try:
         budget_service = BudgetService(db)
-        return budget_service.get_budget(
+        return await budget_service.get_budget(
             budget_id=budget_id,
-            user_id=current_user['sub']
+            user_id=UUID(current_user['sub'])
         )
     except Exception as e:
         raise HTTPException(
@@ -82,7 +82,7 @@ async def list_budgets(
     period: Optional[str] = None,
     alert_enabled: Optional[bool] = None,
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[BudgetResponse]:
     """
     List all budgets for the authenticated user with optional filters.
@@ -102,8 +102,8 @@ async def list_budgets(
         filters['alert_enabled'] = alert_enabled
 
     budget_service = BudgetService(db)
-    return budget_service.list_budgets(
-        user_id=current_user['sub'],
+    return await budget_service.list_budgets(
+        user_id=UUID(current_user['sub']),
         filters=filters
     )
 
@@ -112,7 +112,7 @@ async def update_budget(
     budget_id: int,
     budget_data: BudgetUpdate,
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> BudgetResponse:
     """
     Update an existing budget.
@@ -125,9 +125,9 @@ async def update_budget(
     """
     try:
         budget_service = BudgetService(db)
-        return budget_service.update_budget(
+        return await budget_service.update_budget(
             budget_id=budget_id,
-            user_id=current_user['sub'],
+            user_id=UUID(current_user['sub']),
             budget_data=budget_data
         )
     except Exception as e:
@@ -140,7 +140,7 @@ async def update_budget(
 async def delete_budget(
     budget_id: int,
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> None:
     """
     Soft delete a budget.
@@ -153,9 +153,9 @@ async def delete_budget(
     """
     try:
         budget_service = BudgetService(db)
-        budget_service.delete_budget(
+        await budget_service.delete_budget(
             budget_id=budget_id,
-            user_id=current_user['sub']
+            user_id=UUID(current_user['sub'])
         )
     except Exception as e:
         raise HTTPException(
@@ -166,7 +166,7 @@ async def delete_budget(
 @router.get('/alerts', response_model=List[Dict])
 async def check_budget_alerts(
     current_user: Dict = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ) -> List[Dict]:
     """
     Check budgets for threshold alerts.
@@ -178,6 +178,6 @@ async def check_budget_alerts(
       Implements role-based access control
     """
     budget_service = BudgetService(db)
-    return budget_service.check_budget_alerts(
-        user_id=current_user['sub']
+    return await budget_service.check_budget_alerts(
+        user_id=UUID(current_user['sub'])
     )
\ No newline at end of file
@@ -14,7 +14,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from uuid import UUID
 from typing import List
 from decimal import Decimal
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from ....models.goal import Goal
 from ....schemas.goal import (
@@ -25,7 +25,7 @@ from ....schemas.goal import (
 )
 from ....services.goal_service import GoalService
 from ....core.auth import get_current_user
-from ....db.session import get_db
+from ....db.session import get_async_db
 
 # Initialize router with prefix and tags
 router = APIRouter(prefix='/goals', tags=['goals'])
@@ -33,7 +33,7 @@ router = APIRouter(prefix='/goals', tags=['goals'])
 @router.post('/', response_model=GoalInDB, status_code=status.HTTP_201_CREATED)
 async def create_goal(
     goal_data: GoalCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> GoalInDB:
     """
@@ -47,7 +47,7 @@ async def create_goal(
     goal_data.user_id = UUID(current_user['sub'])
     
     try:
-        return goal_service.create_goal(goal_data)
+        return await goal_service.create_goal(goal_data)
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -57,7 +57,7 @@ async def create_goal(
 @router.get('/{goal_id}', response_model=GoalResponse)
 async def get_goal(
     goal_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> GoalResponse:
     """
@@ -68,7 +68,7 @@ async def get_goal(
     - REST API Services (2.1): Provides RESTful endpoint for goal retrieval
     """
     goal_service = GoalService(db)
-    goal = goal_service.get_goal(goal_id, UUID(current_user['sub']))
+    goal = await goal_service.get_goal(goal_id, UUID(current_user['sub']))
     
     if not goal:
         raise HTTPException(
@@ -80,7 +80,7 @@ async def get_goal(
 
 @router.get('/', response_model=List[GoalResponse])
 async def list_goals(
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> List[GoalResponse]:
     """
@@ -91,13 +91,13 @@ async def list_goals(
     - REST API Services (2.1): Provides RESTful endpoint for goal listing
     """
     goal_service = GoalService(db)
-    return goal_service.list_goals(UUID(current_user['sub']))
+    return await goal_service.list_goals(UUID(current_user['sub']))
 
 @router.put('/{goal_id}', response_model=GoalInDB)
 async def update_goal(
     goal_id: UUID,
     goal_data: GoalUpdate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> GoalInDB:
     """
@@ -108,7 +108,7 @@ async def update_goal(
     - REST API Services (2.1): Provides RESTful endpoint for goal updates
     """
     goal_service = GoalService(db)
-    updated_goal = goal_service.update_goal(
+    updated_goal = await goal_service.update_goal(
         goal_id,
         UUID(current_user['sub']),
         goal_data
@@ -125,7 +125,7 @@ async def update_goal(
 @router.delete('/{goal_id}', status_code=status.HTTP_204_NO_CONTENT)
 async def delete_goal(
     goal_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> None:
     """
@@ -136,7 +136,7 @@ async def delete_goal(
     - REST API Services (2.1): Provides RESTful endpoint for goal deletion
     """
     goal_service = GoalService(db)
-    if not goal_service.delete_goal(goal_id, UUID(current_user['sub'])):
+    if not await goal_service.delete_goal(goal_id, UUID(current_user['sub'])):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Goal not found"
@@ -146,7 +146,7 @@ async def delete_goal(
 async def update_goal_progress(
     goal_id: UUID,
     amount: Decimal,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     current_user: dict = Depends(get_current_user)
 ) -> GoalResponse:
     """
@@ -157,7 +157,7 @@ async def update_goal_progress(
     - REST API Services (2.1): Provides RESTful endpoint for progress updates
     """
     goal_service = GoalService(db)
-    updated_goal = goal_service.update_goal_progress(
+    updated_goal = await goal_service.update_goal_progress(
         goal_id,
         UUID(current_user['sub']),
         amount
@@ -1,15 +1,18 @@
 # FastAPI v0.68.0
-from fastapi import APIRouter, Depends, HTTPException, Query, Path
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Path, Response
 from fastapi.responses import JSONResponse
 
 # Standard library imports
-from typing import List, Optional
+import asyncio
+from functools import lru_cache
+from typing import Iterator, List, Optional
 from uuid import UUID
 from datetime import datetime
 
 # Internal imports
 from ....models.transaction import Transaction
-from ....services.transaction_service import TransactionService
+from ....services.plaid_service import PlaidService
+from ....services.transaction_service import TransactionService, encode_transaction_cursor
 from ....schemas.transaction import (
     TransactionCreate,
     TransactionUpdate,
@@ -17,6 +20,9 @@ from ....schemas.transaction import (
     TransactionResponse
 )
 from ....core.auth import get_current_user
+from ....core.config import get_settings
+from ....core.encryption import EncryptionManager
+from ....db.session import get_db
 
 # Human Tasks:
 # 1. Configure rate limiting settings for production environment
@@ -25,13 +31,35 @@ from ....core.auth import get_current_user
 # 4. Configure logging for transaction operations
 # 5. Set up alerts for high error rates or latency spikes
 
+# Response header carrying the keyset cursor for the next page
+NEXT_CURSOR_HEADER = 'X-Next-Cursor'
+
 # Initialize router with prefix and tags
 router = APIRouter(prefix='/transactions', tags=['transactions'])
 
+@lru_cache()
+def get_plaid_service() -> PlaidService:
+    """
+    Process-wide PlaidService, so the Plaid client and the encryption data
+    key are created once rather than per request.
+    """
+    return PlaidService(get_settings(), EncryptionManager())
+
+def get_transaction_service() -> Iterator[TransactionService]:
+    """
+    Dependency providing a TransactionService bound to a request-scoped session.
+
+    Requirements addressed:
+    - Financial Tracking (1.2): Service initialization for transaction operations
+    """
+    with get_db() as db:
+        yield TransactionService(db, get_plaid_service())
+
 @router.get('/{transaction_id}', response_model=TransactionResponse)
 async def get_transaction(
     transaction_id: UUID = Path(..., description="Transaction UUID"),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> TransactionResponse:
     """
     Get a single transaction by ID.
@@ -42,7 +70,7 @@ async def get_transaction(
     - Security Controls (6.3.3): Implements user authentication and validation
     """
     try:
-        transaction = TransactionService.get_transaction(transaction_id)
+        transaction = await asyncio.to_thread(transaction_service.get_transaction, transaction_id)
         if not transaction:
             raise HTTPException(
                 status_code=404,
@@ -63,14 +91,20 @@ async def get_transaction(
 
 @router.get('/', response_model=List[TransactionResponse])
 async def get_transactions(
+    response: Response,
     filters: TransactionFilter = Depends(),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
-    current_user: dict = Depends(get_current_user)
+    cursor: Optional[str] = Query(None, description="Keyset cursor from the X-Next-Cursor header; overrides page"),
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> List[TransactionResponse]:
     """
     Get filtered list of transactions with pagination.
 
+    Every full page sets an X-Next-Cursor header; passing it back as cursor
+    fetches the next page by keyset instead of OFFSET.
+
     Requirements addressed:
     - Financial Tracking (1.2): Implements transaction filtering and pagination
     - REST API Services (2.1): Implements RESTful endpoint for transaction listing
@@ -84,14 +118,31 @@ async def get_transactions(
                 detail="Access denied to this account"
             )
 
-        transactions, total_count = TransactionService.get_transactions(
-            account_id=filters.account_id,
-            start_date=filters.start_date,
-            end_date=filters.end_date,
-            category_id=filters.category_id,
-            page=page,
-            page_size=page_size
-        )
+        if cursor:
+            transactions, next_cursor = transaction_service.get_transactions_page(
+                account_id=filters.account_id,
+                start_date=filters.start_date,
+                end_date=filters.end_date,
+                category_id=filters.category_id,
+                cursor=cursor,
+                page_size=page_size
+            )
+        else:
+            transactions, total_count = transaction_service.get_transactions(
+                account_id=filters.account_id,
+                start_date=filters.start_date,
+                end_date=filters.end_date,
+                category_id=filters.category_id,
+                page=page,
+                page_size=page_size
+            )
+            next_cursor = (
+                encode_transaction_cursor(transactions[-1])
+                if len(transactions) == page_size else None
+            )
+
+        if next_cursor:
+            response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
         return [TransactionResponse.from_orm(t) for t in transactions]
 
@@ -101,7 +152,8 @@ async def get_transactions(
 @router.post('/', response_model=TransactionResponse, status_code=201)
 async def create_transaction(
     transaction_data: TransactionCreate,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> TransactionResponse:
     """
     Create a new transaction.
@@ -119,7 +171,7 @@ async def create_transaction(
                 detail="Access denied to this account"
             )
 
-        transaction = TransactionService.create_transaction(transaction_data)
+        transaction = transaction_service.create_transaction(transaction_data)
         return TransactionResponse.from_orm(transaction)
 
     except ValueError as e:
@@ -129,7 +181,8 @@ async def create_transaction(
 async def update_transaction(
     transaction_id: UUID = Path(..., description="Transaction UUID"),
     update_data: TransactionUpdate = None,
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> TransactionResponse:
     """
     Update an existing transaction.
@@ -141,7 +194,7 @@ async def update_transaction(
     """
     try:
         # Verify transaction exists and user has access
-        transaction = TransactionService.get_transaction(transaction_id)
+        transaction = await asyncio.to_thread(transaction_service.get_transaction, transaction_id)
         if not transaction:
             raise HTTPException(
                 status_code=404,
@@ -154,7 +207,7 @@ async def update_transaction(
                 detail="Access denied to this transaction"
             )
 
-        updated_transaction = TransactionService.update_transaction(
+        updated_transaction = transaction_service.update_transaction(
             transaction_id,
             update_data
         )
@@ -167,7 +220,9 @@ async def update_transaction(
 async def sync_transactions(
     account_id: UUID = Query(..., description="Account UUID"),
     cursor: Optional[str] = Query(None, description="Sync cursor for pagination"),
-    current_user: dict = Depends(get_current_user)
+    access_token: str = Body(..., embed=True, description="Encrypted Plaid access token for the account's item"),
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> dict:
     """
     Synchronize transactions with Plaid for an account.
@@ -185,8 +240,9 @@ async def sync_transactions(
                 detail="Access denied to this account"
             )
 
-        new_transactions, updated_cursor = await TransactionService.sync_transactions(
+        new_transactions, updated_cursor = await transaction_service.sync_transactions(
             account_id=account_id,
+            access_token=access_token,
             cursor=cursor
         )
 
@@ -195,6 +251,8 @@ async def sync_transactions(
             "cursor": updated_cursor
         }
 
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -202,7 +260,8 @@ async def sync_transactions(
 async def categorize_transaction(
     transaction_id: UUID = Path(..., description="Transaction UUID"),
     category_id: int = Query(..., description="Category ID"),
-    current_user: dict = Depends(get_current_user)
+    current_user: dict = Depends(get_current_user),
+    transaction_service: TransactionService = Depends(get_transaction_service)
 ) -> TransactionResponse:
     """
     Update transaction category.
@@ -214,7 +273,7 @@ async def categorize_transaction(
     """
     try:
         # Verify transaction exists and user has access
-        transaction = TransactionService.get_transaction(transaction_id)
+        transaction = await asyncio.to_thread(transaction_service.get_transaction, transaction_id)
         if not transaction:
             raise HTTPException(
                 status_code=404,
@@ -227,7 +286,7 @@ async def categorize_transaction(
                 detail="Access denied to this transaction"
             )
 
-        updated_transaction = TransactionService.categorize_transaction(
+        updated_transaction = transaction_service.categorize_transaction(
             transaction_id,
             category_id
         )
@@ -13,6 +13,7 @@ Human Tasks:
 from .auth import (
     create_access_token,
     create_refresh_token,
+    create_token_pair,
     verify_token,
     get_current_user
 )
@@ -36,6 +37,7 @@ __all__ = [
     # Authentication exports
     'create_access_token',
     'create_refresh_token',
+    'create_token_pair',
     'verify_token',
     'get_current_user',
     
@@ -11,8 +11,14 @@ Human Tasks:
 # python-jwt: ^2.6.0
 # fastapi: ^0.95.0
 
+import base64
+import calendar
+import hashlib
+import hmac
+import json
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any, List
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple
 import jwt
 from fastapi import HTTPException, Request
 from fastapi.security import SecurityScopes, HTTPBearer
@@ -27,6 +33,42 @@ ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
 REFRESH_TOKEN_EXPIRE_DAYS: int = 30
 ALGORITHM: str = 'HS256'
 
+# Decode settings built once; every token we issue carries these claims,
+# so PyJWT enforces their presence instead of per-call .get checks
+DECODE_ALGORITHMS: List[str] = [ALGORITHM]
+DECODE_OPTIONS: Dict[str, Any] = {"require": ["exp", "sub", "type"]}
+
+def _b64url(data: bytes) -> bytes:
+    """Unpadded base64url encoding as required by RFC 7515."""
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+# Every issued token shares this header, so its encoded segment is built once
+_JWT_HEADER_SEGMENT: bytes = _b64url(
+    json.dumps({"alg": ALGORITHM, "typ": "JWT"}, separators=(',', ':')).encode('utf-8')
+)
+
+@lru_cache(maxsize=1)
+def _get_signing_mac() -> hmac.HMAC:
+    """HMAC-SHA256 state keyed with SECRET_KEY once; copied for each signature."""
+    return hmac.new(get_settings().SECRET_KEY.encode('utf-8'), digestmod=hashlib.sha256)
+
+def _sign_token(payload: Dict[str, Any]) -> str:
+    """
+    Encode and sign an HS256 JWT, serializing only the payload per call.
+    
+    Requirement: Data Security - 6.2.1 Encryption Implementation
+    """
+    claims = dict(payload)
+    if isinstance(claims.get("exp"), datetime):
+        claims["exp"] = calendar.timegm(claims["exp"].utctimetuple())
+    
+    signing_input = _JWT_HEADER_SEGMENT + b'.' + _b64url(
+        json.dumps(claims, separators=(',', ':')).encode('utf-8')
+    )
+    mac = _get_signing_mac().copy()
+    mac.update(signing_input)
+    return (signing_input + b'.' + _b64url(mac.digest())).decode('ascii')
+
 class OAuth2PasswordBearerWithCookie(HTTPBearer):
     """
     Custom OAuth2 scheme supporting both header and cookie-based authentication.
@@ -101,14 +143,7 @@ def create_access_token(
         "type": "access"
     })
     
-    settings = get_settings()
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=ALGORITHM
-    )
-    
-    return encoded_jwt
+    return _sign_token(to_encode)
 
 def create_refresh_token(data: Dict[str, Any]) -> str:
     """
@@ -124,14 +159,30 @@ def create_refresh_token(data: Dict[str, Any]) -> str:
         "type": "refresh"
     })
     
-    settings = get_settings()
-    encoded_jwt = jwt.encode(
-        to_encode,
-        settings.SECRET_KEY,
-        algorithm=ALGORITHM
-    )
+    return _sign_token(to_encode)
+
+def create_token_pair(sub: str) -> Tuple[str, str]:
+    """
+    Create an access and refresh token for a subject in one pass, sharing the
+    issue time and the cached signing state.
+    
+    Requirement: Authentication Flow - 6.1 Authentication and Authorization/6.1.1 Authentication Flow
     
-    return encoded_jwt
+    Returns:
+        Tuple of (access_token, refresh_token)
+    """
+    now = datetime.utcnow()
+    access_token = _sign_token({
+        "sub": sub,
+        "exp": now + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+        "type": "access"
+    })
+    refresh_token = _sign_token({
+        "sub": sub,
+        "exp": now + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS),
+        "type": "refresh"
+    })
+    return access_token, refresh_token
 
 def verify_token(
     token: str,
@@ -143,22 +194,13 @@ def verify_token(
     Requirement: Security Standards - 6.3 Security Protocols/6.3.1 Security Standards Compliance
     """
     try:
-        settings = get_settings()
         payload = jwt.decode(
             token,
-            settings.SECRET_KEY,
-            algorithms=[ALGORITHM]
+            get_settings().SECRET_KEY,
+            algorithms=DECODE_ALGORITHMS,
+            options=DECODE_OPTIONS
         )
         
-        # Verify token type
-        token_type = payload.get("type")
-        if not token_type:
-            raise HTTPException(
-                status_code=401,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-            
         # Verify scopes if required
         if required_scopes:
             token_scopes = payload.get("scopes", [])
@@ -178,7 +220,7 @@ def verify_token(
             detail="Token has expired",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    except jwt.JWTError:
+    except jwt.InvalidTokenError:
         raise HTTPException(
             status_code=401,
             detail="Could not validate credentials",
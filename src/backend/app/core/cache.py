@@ -11,12 +11,13 @@ Human Tasks:
 
 # Library versions:
 # redis: ^4.0.0
-# json: built-in
+# orjson: ^3.8.0
 # typing: built-in
 # asyncio: built-in
 
-import json
-from typing import Any, Optional
+import orjson
+import secrets
+from typing import Any, Dict, List, Optional, Set
 import asyncio
 from redis import Redis
 from redis.exceptions import RedisError, ConnectionError
@@ -24,6 +25,18 @@ from redis.exceptions import RedisError, ConnectionError
 from core.config import get_redis_settings
 from core.errors import ValidationError
 
+# Non-string dict keys are stringified, matching the json module's behaviour
+CACHE_JSON_OPTIONS: int = orjson.OPT_NON_STR_KEYS
+
+# Deletes a lock only while it still holds the caller's token, so a holder
+# whose lock already expired can't release someone else's
+RELEASE_LOCK_SCRIPT: str = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
 class RedisCache:
     """
     Redis cache implementation providing thread-safe caching functionality with 
@@ -71,6 +84,9 @@ class RedisCache:
             # Set default TTL for cache entries
             self.default_ttl = default_ttl
             
+            # Registered once; runs via EVALSHA afterwards
+            self._release_lock_script = self._client.register_script(RELEASE_LOCK_SCRIPT)
+            
             # Test connection to Redis server
             self._client.ping()
             
@@ -96,23 +112,55 @@ class RedisCache:
             
         try:
             # Get raw value from Redis
-            value = self._client.get(key)
-            
-            if value is None:
-                return None
-                
-            # Deserialize JSON value with error handling
-            try:
-                return json.loads(value)
-            except json.JSONDecodeError:
-                # Return raw value if not JSON
-                return value
+            return self._deserialize(self._client.get(key))
                 
         except RedisError as e:
             # Log error and return None on Redis errors
             print(f"Redis error in get(): {str(e)}")
             return None
 
+    def mget(self, keys: List[str]) -> List[Any]:
+        """
+        Retrieve many values in a single round trip with JSON deserialization.
+        
+        Args:
+            keys (List[str]): Cache keys to retrieve
+            
+        Returns:
+            List[Any]: Deserialized values in key order, None for misses
+            
+        Raises:
+            ValidationError: If any key parameter is invalid
+        """
+        # Validate key parameters
+        for key in keys:
+            if not isinstance(key, str) or not key.strip():
+                raise ValidationError("Invalid cache key")
+        
+        if not keys:
+            return []
+            
+        try:
+            return [self._deserialize(value) for value in self._client.mget(keys)]
+            
+        except RedisError as e:
+            # Log error and treat every key as a miss on Redis errors
+            print(f"Redis error in mget(): {str(e)}")
+            return [None] * len(keys)
+
+    @staticmethod
+    def _deserialize(value: Optional[str]) -> Any:
+        """Deserialize a raw Redis value, returning non-JSON values unchanged."""
+        if value is None:
+            return None
+            
+        # Deserialize JSON value with error handling
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            # Return raw value if not JSON
+            return value
+
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> bool:
         """
         Store JSON serialized value in cache with optional TTL.
@@ -138,7 +186,7 @@ class RedisCache:
         try:
             # Serialize value to JSON with error handling
             if not isinstance(value, (str, bytes)):
-                value = json.dumps(value)
+                value = orjson.dumps(value, option=CACHE_JSON_OPTIONS)
                 
             # Use default TTL if none provided
             if ttl is None:
@@ -147,11 +195,82 @@ class RedisCache:
             # Store in Redis with TTL
             return bool(self._client.setex(key, ttl, value))
             
-        except (RedisError, TypeError, json.JSONDecodeError) as e:
+        except (RedisError, TypeError) as e:
             # Log error and return False on errors
             print(f"Redis error in set(): {str(e)}")
             return False
 
+    def set_many(self, mapping: Dict[str, Any], ttl: Optional[int] = None) -> bool:
+        """
+        Store many JSON serialized values with a shared TTL in one pipelined round trip.
+        
+        Args:
+            mapping (Dict[str, Any]): Cache keys and values (values will be JSON serialized)
+            ttl (Optional[int]): Time-to-live in seconds, defaults to self.default_ttl
+            
+        Returns:
+            bool: Success status of cache operation
+            
+        Raises:
+            ValidationError: If any key or value parameter is invalid
+        """
+        # Validate key and value parameters
+        for key, value in mapping.items():
+            if not isinstance(key, str) or not key.strip():
+                raise ValidationError("Invalid cache key")
+            if value is None:
+                raise ValidationError("Cache value cannot be None")
+        
+        if not mapping:
+            return True
+            
+        try:
+            if ttl is None:
+                ttl = self.default_ttl
+            
+            # One SETEX per key, sent without waiting on individual replies
+            pipe = self._client.pipeline(transaction=False)
+            for key, value in mapping.items():
+                if not isinstance(value, (str, bytes)):
+                    value = orjson.dumps(value, option=CACHE_JSON_OPTIONS)
+                pipe.setex(key, ttl, value)
+            return all(pipe.execute())
+            
+        except (RedisError, TypeError) as e:
+            # Log error and return False on errors
+            print(f"Redis error in set_many(): {str(e)}")
+            return False
+
+    def incr(self, key: str, ttl: Optional[int] = None) -> Optional[int]:
+        """
+        Atomically increment an integer counter and refresh its TTL in one round trip.
+        
+        Args:
+            key (str): Counter key
+            ttl (Optional[int]): Time-to-live in seconds, defaults to self.default_ttl
+            
+        Returns:
+            Optional[int]: New counter value, or None on Redis errors
+            
+        Raises:
+            ValidationError: If key parameter is invalid
+        """
+        # Validate key parameter
+        if not isinstance(key, str) or not key.strip():
+            raise ValidationError("Invalid cache key")
+            
+        try:
+            pipe = self._client.pipeline(transaction=True)
+            pipe.incr(key)
+            pipe.expire(key, self.default_ttl if ttl is None else ttl)
+            value, _ = pipe.execute()
+            return value
+            
+        except RedisError as e:
+            # Log error and return None on Redis errors
+            print(f"Redis error in incr(): {str(e)}")
+            return None
+
     def delete(self, key: str) -> bool:
         """
         Remove value from cache by key.
@@ -204,6 +323,120 @@ class RedisCache:
             print(f"Redis error in exists(): {str(e)}")
             return False
 
+    def set_and_index(self, key: str, value: str, index_key: str, member: str, ttl: Optional[int] = None) -> bool:
+        """
+        Store a string value and add a member to an index set in one atomic round trip.
+        
+        Args:
+            key (str): Cache key for the value
+            value (str): Value to store as-is
+            index_key (str): Key of the Redis set tracking stored members
+            member (str): Member to add to the index set
+            ttl (Optional[int]): Time-to-live in seconds for the value, defaults to self.default_ttl
+            
+        Returns:
+            bool: Success status of cache operation
+            
+        Raises:
+            ValidationError: If key parameters are invalid
+        """
+        # Validate key parameters
+        for cache_key in (key, index_key):
+            if not isinstance(cache_key, str) or not cache_key.strip():
+                raise ValidationError("Invalid cache key")
+        
+        try:
+            # SETEX and SADD queued in a single MULTI/EXEC pipeline
+            pipe = self._client.pipeline(transaction=True)
+            pipe.setex(key, self.default_ttl if ttl is None else ttl, value)
+            pipe.sadd(index_key, member)
+            stored, _ = pipe.execute()
+            return bool(stored)
+            
+        except RedisError as e:
+            # Log error and return False on Redis errors
+            print(f"Redis error in set_and_index(): {str(e)}")
+            return False
+
+    def smembers(self, key: str) -> Set[str]:
+        """
+        Retrieve all members of a Redis set.
+        
+        Args:
+            key (str): Cache key of the set
+            
+        Returns:
+            Set[str]: Set members, empty if the key is missing
+            
+        Raises:
+            ValidationError: If key parameter is invalid
+        """
+        # Validate key parameter
+        if not isinstance(key, str) or not key.strip():
+            raise ValidationError("Invalid cache key")
+            
+        try:
+            return self._client.smembers(key)
+            
+        except RedisError as e:
+            # Log error and return empty set on Redis errors
+            print(f"Redis error in smembers(): {str(e)}")
+            return set()
+
+    def acquire_lock(self, key: str, ttl_ms: int) -> Optional[str]:
+        """
+        Try to take a short-lived lock with SET NX PX.
+        
+        Args:
+            key (str): Lock key
+            ttl_ms (int): Lock expiry in milliseconds, bounding how long a
+                crashed holder can block others
+            
+        Returns:
+            Optional[str]: Token to pass to release_lock, or None if the lock is held
+            
+        Raises:
+            ValidationError: If key parameter is invalid
+        """
+        # Validate key parameter
+        if not isinstance(key, str) or not key.strip():
+            raise ValidationError("Invalid cache key")
+            
+        token = secrets.token_hex(8)
+        try:
+            return token if self._client.set(key, token, nx=True, px=ttl_ms) else None
+            
+        except RedisError as e:
+            # Log error and return None on Redis errors
+            print(f"Redis error in acquire_lock(): {str(e)}")
+            return None
+
+    def release_lock(self, key: str, token: str) -> bool:
+        """
+        Release a lock taken with acquire_lock if it is still held by token.
+        
+        Args:
+            key (str): Lock key
+            token (str): Token returned by acquire_lock
+            
+        Returns:
+            bool: True if the lock was released
+            
+        Raises:
+            ValidationError: If key parameter is invalid
+        """
+        # Validate key parameter
+        if not isinstance(key, str) or not key.strip():
+            raise ValidationError("Invalid cache key")
+            
+        try:
+            return bool(self._release_lock_script(keys=[key], args=[token]))
+            
+        except RedisError as e:
+            # Log error and return False on Redis errors
+            print(f"Redis error in release_lock(): {str(e)}")
+            return False
+
     def clear(self) -> bool:
         """
         Clear all cache entries.
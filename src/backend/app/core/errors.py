@@ -83,6 +83,15 @@ class NotFoundError(BaseAppException):
     def __init__(self, message: str, details: Optional[Dict] = None) -> None:
         super().__init__(message=message, status_code=404, details=details)
 
+class DatabaseError(BaseAppException):
+    """
+    Exception for failed database operations.
+    
+    Requirement: Error Handling - Standardized error handling and reporting across all system components
+    """
+    def __init__(self, message: str, details: Optional[Dict] = None) -> None:
+        super().__init__(message=message, status_code=500, details=details)
+
 def format_error_response(message: str, status_code: int, details: Optional[Dict] = None) -> Dict:
     """
     Format error responses in a standardized structure.
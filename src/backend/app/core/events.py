@@ -10,11 +10,12 @@ Human Tasks:
 """
 
 # asyncio: built-in
-# json: built-in
+# orjson: ^3.8.0
 # typing: built-in
 
 import asyncio
-import json
+
+import orjson
 from typing import Dict, Set, List, Optional
 
 from .websockets import WebSocketManager
@@ -94,7 +95,8 @@ class EventManager:
             channel = create_event_channel(event_type)
             await self._cache.set(
                 key=channel,
-                value=json.dumps(event_message),
+                # orjson handles the date/datetime values in transaction payloads
+                value=orjson.dumps(event_message, option=orjson.OPT_NAIVE_UTC),
                 ttl=EVENT_TTL
             )
             
@@ -136,7 +138,7 @@ class EventManager:
                 channel = create_event_channel(event_type)
                 await self._cache.set(
                     key=f"sub:{user_id}:{event_type}",
-                    value=json.dumps({
+                    value=orjson.dumps({
                         'user_id': user_id,
                         'event_type': event_type,
                         'subscribed_at': asyncio.get_event_loop().time()
@@ -191,7 +193,7 @@ class EventManager:
         """
         try:
             # Parse event message
-            event_data = json.loads(message)
+            event_data = orjson.loads(message)
             event_type = event_data.get('type')
             target_users = event_data.get('target_users')
             
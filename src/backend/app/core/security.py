@@ -17,7 +17,14 @@ from typing import Dict, Any, Optional
 
 import jwt
 
-from ..utils.crypto import hash_password, verify_password, generate_token
+from ..utils.crypto import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+    password_needs_rehash,
+    generate_token
+)
 from .config import SECRET_KEY
 
 # Global constants for token configuration
@@ -109,31 +116,77 @@ def verify_token(token: str) -> Dict[str, Any]:
 
 def get_password_hash(password: str) -> str:
     """
-    Creates a password hash using bcrypt with configurable rounds.
+    Creates a password hash using Argon2id with host-calibrated parameters.
     
     Requirement: Data Security - 6.2.2 Sensitive Data Handling
-    Implementation of secure password hashing using bcrypt.
+    Implementation of secure password hashing using Argon2id.
     
     Args:
         password: Plain text password to hash
         
     Returns:
-        Bcrypt hashed password string
+        Argon2id hashed password string
     """
     return hash_password(password)
 
 def verify_password_hash(plain_password: str, hashed_password: str) -> bool:
     """
-    Verifies a password against its bcrypt hash.
+    Verifies a password against its Argon2id (or legacy bcrypt) hash.
     
     Requirement: Data Security - 6.2.2 Sensitive Data Handling
     Implementation of secure password verification.
     
     Args:
         plain_password: Plain text password to verify
-        hashed_password: Bcrypt hash to verify against
+        hashed_password: Argon2id or legacy bcrypt hash to verify against
         
     Returns:
         True if password matches hash, False otherwise
     """
-    return verify_password(plain_password, hashed_password)
\ No newline at end of file
+    return verify_password(plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    """
+    Creates an Argon2id password hash in the hash process pool.
+    
+    Requirement: Data Security - 6.2.2 Sensitive Data Handling
+    Keeps the KDF's CPU time off the event loop during async requests.
+    
+    Args:
+        password: Plain text password to hash
+        
+    Returns:
+        Argon2id hashed password string
+    """
+    return await hash_password_async(password)
+
+async def verify_password_hash_async(plain_password: str, hashed_password: str) -> bool:
+    """
+    Verifies a password against its stored hash in the hash process pool.
+    
+    Requirement: Data Security - 6.2.2 Sensitive Data Handling
+    Keeps the KDF's CPU time off the event loop during async requests.
+    
+    Args:
+        plain_password: Plain text password to verify
+        hashed_password: Argon2id or legacy bcrypt hash to verify against
+        
+    Returns:
+        True if password matches hash, False otherwise
+    """
+    return await verify_password_async(plain_password, hashed_password)
+
+def password_hash_needs_rehash(hashed_password: str) -> bool:
+    """
+    Checks whether a stored password hash should be regenerated.
+    
+    Requirement: Data Security - 6.2.2 Sensitive Data Handling
+    Migrates legacy bcrypt hashes and outdated Argon2id parameters on login.
+    
+    Args:
+        hashed_password: Stored password hash
+        
+    Returns:
+        True if the hash should be replaced with a fresh Argon2id hash
+    """
+    return password_needs_rehash(hashed_password)
\ No newline at end of file
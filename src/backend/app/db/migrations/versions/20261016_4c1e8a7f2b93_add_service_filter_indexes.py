@@ -0,0 +1,141 @@
+# SQLAlchemy v1.4.0
+# Alembic v1.7.0
+
+"""add service filter indexes
+
+Revision ID: 4c1e8a7f2b93
+Revises: 
+Create Date: 2026-10-16 06:00:00.000000
+
+Requirements addressed:
+- Database Schema Management (5.2.1 Schema Design): Bring existing databases up to
+  the indexes declared in the models' __table_args__
+- Data Storage (2.1 Data Layer): Build the indexes without blocking writes on
+  live tables
+"""
+
+# Human Tasks:
+# 1. Review migration script before applying changes
+# 2. Ensure database backup before running migrations
+# 3. Test migrations in development environment first
+# 4. Verify PostgreSQL permissions for schema modifications
+# 5. Schedule migration deployment during low-traffic periods
+
+from typing import Optional
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic
+revision = '4c1e8a7f2b93'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _index_valid(name: str) -> Optional[bool]:
+    """
+    Returns None when the index is missing, otherwise whether it is valid.
+    
+    Databases built with create_all already have these indexes; an invalid
+    one is left behind by an interrupted CONCURRENTLY build.
+    """
+    return op.get_bind().execute(
+        sa.text(
+            "SELECT i.indisvalid FROM pg_index i "
+            "JOIN pg_class c ON c.oid = i.indexrelid "
+            "WHERE c.relname = :name"
+        ),
+        {'name': name}
+    ).scalar()
+
+
+def _create_index(name: str, table: str, columns: list, **kw) -> None:
+    """Creates an index concurrently unless a valid one already exists."""
+    valid = _index_valid(name)
+    if valid:
+        return
+    if valid is False:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+    op.create_index(name, table, columns, postgresql_concurrently=True, **kw)
+
+
+def _drop_index(name: str, table: str) -> None:
+    """Drops an index concurrently if it exists."""
+    if _index_valid(name) is not None:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def upgrade():
+    """
+    Creates the partial and covering indexes used by the service filters
+    and widens the transactions account/date index with id.
+    
+    CREATE INDEX CONCURRENTLY cannot run inside a transaction, so every
+    operation runs in an autocommit block.
+    """
+    with op.get_context().autocommit_block():
+        # Budget reads always filter on the owner and skip soft-deleted rows
+        _create_index(
+            'ix_budget_user_active', 'budget', ['user_id'],
+            postgresql_where=sa.text('is_active')
+        )
+        _create_index(
+            'ix_budget_alerts', 'budget', ['user_id'],
+            postgresql_where=sa.text(
+                'is_active AND alert_enabled AND alert_threshold IS NOT NULL'
+            )
+        )
+        
+        # Ownership guards by primary key are answered index-only
+        _create_index(
+            'ix_budget_pk_cover', 'budget', ['id'],
+            postgresql_include=['user_id', 'is_active']
+        )
+        
+        # Investment reads skip inactive positions; the portfolio sums are
+        # served from the included columns
+        _create_index(
+            'ix_investment_account_active', 'investments', ['account_id'],
+            postgresql_where=sa.text('is_active'),
+            postgresql_include=['current_value', 'cost_basis']
+        )
+        _create_index(
+            'ix_investment_id_active', 'investments', ['id'],
+            postgresql_where=sa.text('is_active')
+        )
+        
+        # Case-insensitive uniqueness behind the lowered-email lookup and the
+        # ON CONFLICT DO NOTHING registration insert
+        _create_index(
+            'ix_users_email_lower', 'users', [sa.text('lower(email)')],
+            unique=True
+        )
+        
+        # Adding id lets keyset pagination on (transaction_date, id) use a
+        # backward scan; the new index is built before the one it replaces
+        # is dropped so account reads always have one
+        _create_index(
+            'ix_transactions_account_date_id', 'transactions',
+            ['account_id', 'transaction_date', 'id']
+        )
+        _drop_index('ix_transactions_account_date', 'transactions')
+
+
+def downgrade():
+    """
+    Reverts upgrade in reverse order, restoring the original transactions
+    account/date index before its replacement is dropped.
+    """
+    with op.get_context().autocommit_block():
+        _create_index(
+            'ix_transactions_account_date', 'transactions',
+            ['account_id', 'transaction_date']
+        )
+        _drop_index('ix_transactions_account_date_id', 'transactions')
+        _drop_index('ix_users_email_lower', 'users')
+        _drop_index('ix_investment_id_active', 'investments')
+        _drop_index('ix_investment_account_active', 'investments')
+        _drop_index('ix_budget_pk_cover', 'budget')
+        _drop_index('ix_budget_alerts', 'budget')
+        _drop_index('ix_budget_user_active', 'budget')
@@ -10,9 +10,17 @@ Human Tasks:
 """
 
 # sqlalchemy: ^1.4.0
-from sqlalchemy import create_engine
+# asyncpg: ^0.27.0
+# fastapi: ^0.95.0
+import asyncio
+from fastapi import HTTPException
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import QueuePool
 from contextlib import contextmanager
+from typing import AsyncIterator
+from urllib.parse import urlparse
 import logging
 
 from ..core.config import Settings
@@ -22,15 +30,34 @@ from .base import Base
 # Initialize logger
 logger = logging.getLogger(__name__)
 
+settings = Settings()
+
+def _uses_pgbouncer(database_url: str) -> bool:
+    """Detects a PgBouncer endpoint by its conventional port or host name."""
+    parsed = urlparse(database_url)
+    return parsed.port == 6432 or 'pgbouncer' in (parsed.hostname or '')
+
+# Pre-ping by default, except behind PgBouncer where the extra round trip
+# leaves server connections idle in transaction
+_pool_pre_ping = (
+    settings.DB_POOL_PRE_PING
+    if settings.DB_POOL_PRE_PING is not None
+    else not _uses_pgbouncer(settings.DATABASE_URL)
+)
+
 # Create database engine with connection pooling
 # Requirement: Database Architecture - Configure PostgreSQL for primary data storage
 # with proper session management and connection pooling
 engine = create_engine(
-    Settings().get_database_settings()['DATABASE_URL'],
-    pool_size=5,  # Number of permanent connections
-    max_overflow=10,  # Additional connections when pool is full
+    settings.DATABASE_URL,
+    poolclass=QueuePool,
+    pool_size=settings.DB_POOL_SIZE,  # Number of permanent connections
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Additional connections when pool is full
     pool_timeout=30,  # Seconds to wait for available connection
-    pool_pre_ping=True,  # Enable connection health checks
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections before server/LB idle cutoffs
+    pool_use_lifo=True,  # Reuse warm connections so idle extras can expire
+    pool_pre_ping=_pool_pre_ping,  # Enable connection health checks
+    query_cache_size=1200,  # Compiled SQL cache entries shared by all service statements
     echo=False  # Set to True for SQL query logging
 )
 
@@ -43,6 +70,30 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+# Async engine for FastAPI request handlers; concurrency is bounded by this
+# pool instead of Starlette's worker threadpool
+# Requirement: Database Architecture - Non-blocking connection pooling
+async_engine = create_async_engine(
+    settings.DATABASE_URL.replace('postgresql://', 'postgresql+asyncpg://', 1),
+    pool_size=settings.DB_POOL_SIZE,  # Number of permanent connections
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Additional connections when pool is full
+    pool_timeout=30,  # Seconds to wait for available connection
+    pool_recycle=settings.DB_POOL_RECYCLE,  # Replace connections before server/LB idle cutoffs
+    pool_use_lifo=True,  # Reuse warm connections so idle extras can expire
+    pool_pre_ping=_pool_pre_ping,  # Enable connection health checks
+    query_cache_size=1200,  # Compiled SQL cache entries shared by all service statements
+    echo=False  # Set to True for SQL query logging
+)
+
+# Objects stay loaded after commit so responses can be built without
+# implicit (and, under asyncio, illegal) lazy refreshes
+AsyncSessionLocal = sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
+)
+
 @contextmanager
 def get_db() -> Session:
     """
@@ -61,6 +112,10 @@ def get_db() -> Session:
     try:
         yield session
         session.commit()
+    except HTTPException:
+        # Deliberate API errors from the endpoint keep their status code
+        session.rollback()
+        raise
     except Exception as e:
         session.rollback()
         logger.error(f"Database transaction failed: {str(e)}")
@@ -68,6 +123,49 @@ def get_db() -> Session:
     finally:
         session.close()
 
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Get async database session from the connection pool with automatic
+    transaction management.
+    
+    Requirement: Data Security - Implement secure database connections and session
+    handling with proper resource cleanup
+    
+    Yields:
+        AsyncSession: Async database session instance with active transaction
+        
+    Raises:
+        DatabaseError: If database operations fail
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+            await session.commit()
+        except HTTPException:
+            # Deliberate API errors from the endpoint keep their status code
+            await session.rollback()
+            raise
+        except Exception as e:
+            await session.rollback()
+            logger.error(f"Database transaction failed: {str(e)}")
+            raise DatabaseError(f"Database operation failed: {str(e)}")
+
+async def warm_async_pool() -> None:
+    """
+    Open the permanent async connections at startup so the first requests do
+    not pay connection setup cost.
+    
+    Requirement: Database Architecture - Configure connection pooling
+    """
+    async def _ping() -> None:
+        async with async_engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+    
+    # Connections are checked out concurrently, otherwise the pool would
+    # hand the same connection back for every ping
+    await asyncio.gather(*(_ping() for _ in range(async_engine.pool.size())))
+    logger.info("Async database pool warmed")
+
 def init_db() -> None:
     """
     Initialize database schema and tables using SQLAlchemy Base metadata.
@@ -108,4 +206,18 @@ def dispose_engine() -> None:
         logger.info("Database engine disposed successfully")
     except Exception as e:
         logger.error(f"Failed to dispose database engine: {str(e)}")
-        raise DatabaseError(f"Failed to cleanup database resources: {str(e)}")
\ No newline at end of file
+        raise DatabaseError(f"Failed to cleanup database resources: {str(e)}")
+
+async def dispose_async_engine() -> None:
+    """
+    Dispose async database engine connections on application shutdown.
+    
+    Requirement: Data Security - Implement proper resource cleanup for database
+    connections
+    """
+    try:
+        await async_engine.dispose()
+        logger.info("Async database engine disposed successfully")
+    except Exception as e:
+        logger.error(f"Failed to dispose async database engine: {str(e)}")
+        raise DatabaseError(f"Failed to cleanup database resources: {str(e)}")
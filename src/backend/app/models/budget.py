@@ -1,6 +1,7 @@
 # SQLAlchemy v1.4.0
 from decimal import Decimal
-from sqlalchemy import Column, Integer, Numeric, String, Boolean, DateTime, UUID, JSON, ForeignKey
+from sqlalchemy import Column, Integer, Numeric, String, Boolean, DateTime, JSON, ForeignKey, Index, and_
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
 from app.db.base import Base
@@ -25,7 +26,7 @@ class Budget(Base):
     
     # Primary key and relationships
     id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(UUID, ForeignKey('users.id'), nullable=False, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id'), nullable=False, index=True)
     category_id = Column(Integer, ForeignKey('categories.id'), nullable=False, index=True)
     
     # Budget configuration
@@ -51,6 +52,32 @@ class Budget(Base):
     user = relationship('User', back_populates='budgets')
     category = relationship('Category', back_populates='budgets')
     
+    # Partial indexes matching the service filters, so soft-deleted and
+    # alert-disabled budgets are never scanned
+    __table_args__ = (
+        Index('ix_budget_user_active', user_id, postgresql_where=is_active),
+        Index(
+            'ix_budget_alerts',
+            user_id,
+            postgresql_where=and_(is_active, alert_enabled, alert_threshold.isnot(None))
+        ),
+        # Ownership guards by primary key can be answered index-only
+        Index('ix_budget_pk_cover', id, postgresql_include=['user_id', 'is_active']),
+    )
+    
+    # Spent amount preloaded by an aggregate query (not a mapped column)
+    _spent_amount = None
+    
+    def preload_spent_amount(self, spent_amount: Decimal) -> None:
+        """
+        Stores the period spend computed by a batched aggregate query so that
+        calculate_progress does not issue its own SUM query.
+        
+        Args:
+            spent_amount: Total expense amount for the current period
+        """
+        self._spent_amount = spent_amount
+    
     def calculate_progress(self) -> dict:
         """
         Calculates current spending progress against budget amount for the configured period.
@@ -62,27 +89,32 @@ class Budget(Base):
         - Budget Management (1.2 Scope/Budget Management):
           Enables progress monitoring with precise calculations
         """
-        # Import here to avoid circular dependencies
-        from app.models import Transaction
-        from sqlalchemy import func
-        from sqlalchemy.sql import and_
-        
-        # Get current period date range
-        from app.utils.datetime import get_date_range
-        period_start, period_end = get_date_range(self.period, get_current_datetime())
-        
-        # Query total spent amount for current period
-        spent_amount = db.session.query(
-            func.sum(Transaction.amount)
-        ).filter(
-            and_(
-                Transaction.category_id == self.category_id,
-                Transaction.user_id == self.user_id,
-                Transaction.date >= period_start,
-                Transaction.date < period_end,
-                Transaction.type == 'expense'
-            )
-        ).scalar() or Decimal('0.00')
+        if self._spent_amount is not None:
+            spent_amount = self._spent_amount
+        else:
+            # Import here to avoid circular dependencies
+            from app.models import Account, Transaction
+            from sqlalchemy import func
+            from sqlalchemy.sql import and_
+            
+            # Get current period date range
+            from app.utils.datetime import get_date_range
+            period_start, period_end = get_date_range(self.period, get_current_datetime())
+            
+            # Query total spent amount for current period
+            spent_amount = db.session.query(
+                func.sum(Transaction.amount)
+            ).join(
+                Account, Transaction.account_id == Account.id
+            ).filter(
+                and_(
+                    Transaction.category_id == self.category_id,
+                    Account.user_id == self.user_id,
+                    Transaction.transaction_date >= period_start,
+                    Transaction.transaction_date < period_end,
+                    Transaction.transaction_type == 'expense'
+                )
+            ).scalar() or Decimal('0.00')
         
         # Calculate remaining amount and percentage
         remaining_amount = max(self.amount - spent_amount, Decimal('0.00'))
@@ -110,7 +142,12 @@ class Budget(Base):
         if not self.alert_enabled or self.alert_threshold is None:
             return False
             
-        progress = self.calculate_progress()
+        return self._threshold_crossed(self.calculate_progress())
+    
+    def _threshold_crossed(self, progress: dict) -> bool:
+        """Compares an already-computed progress dict against the alert threshold."""
+        if not self.alert_enabled or self.alert_threshold is None:
+            return False
         return progress['percentage'] >= self.alert_threshold
     
     def to_dict(self) -> dict:
@@ -144,5 +181,5 @@ class Budget(Base):
             'created_at': self.created_at.isoformat(),
             'updated_at': self.updated_at.isoformat(),
             'progress': progress,
-            'alert_triggered': self.check_alert_threshold()
+            'alert_triggered': self._threshold_crossed(progress)
         }
\ No newline at end of file
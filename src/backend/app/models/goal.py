@@ -34,9 +34,9 @@ class Goal(Base):
     __tablename__ = 'goals'
 
     # Primary key and relationships
-    id = Column(UUID, primary_key=True, default=uuid4, index=True)
-    user_id = Column(UUID, ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
-    account_id = Column(UUID, ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
+    user_id = Column(UUID(as_uuid=True), ForeignKey('users.id', ondelete='CASCADE'), nullable=False, index=True)
+    account_id = Column(UUID(as_uuid=True), ForeignKey('accounts.id', ondelete='CASCADE'), nullable=False, index=True)
     
     # Goal details
     name = Column(String(255), nullable=False)
@@ -1,5 +1,5 @@
 # SQLAlchemy: ^1.4.0
-from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Boolean
+from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from uuid import uuid4
@@ -60,6 +60,19 @@ class Investment(Base):
     # Relationships
     account = relationship("Account", back_populates="investments")
 
+    # Partial indexes over active rows only, since every service read filters
+    # on is_active. The per-account one covers the portfolio totals so
+    # calculate_portfolio_metrics can be served index-only.
+    __table_args__ = (
+        Index(
+            'ix_investment_account_active',
+            account_id,
+            postgresql_where=is_active,
+            postgresql_include=['current_value', 'cost_basis']
+        ),
+        Index('ix_investment_id_active', id, postgresql_where=is_active),
+    )
+
     def __init__(
         self,
         account_id: UUID,
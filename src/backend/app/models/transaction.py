@@ -2,10 +2,12 @@
 from sqlalchemy import Column, String, Numeric, DateTime, ForeignKey, Boolean, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.dialects.postgresql import UUID, JSONB
+from dataclasses import dataclass
+from types import SimpleNamespace
 from uuid import uuid4
 from decimal import Decimal
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Any, Optional, Dict
 
 from ..db.base import Base
 from .account import Account
@@ -65,7 +67,8 @@ class Transaction(Base):
     
     # Create indices for common query patterns
     __table_args__ = (
-        Index('ix_transactions_account_date', 'account_id', 'transaction_date'),
+        # Also serves keyset pagination on (transaction_date, id) DESC via a backward scan
+        Index('ix_transactions_account_date_id', 'account_id', 'transaction_date', 'id'),
         Index('ix_transactions_category_date', 'category_id', 'transaction_date'),
         Index('ix_transactions_status_date', 'status', 'transaction_date'),
     )
@@ -214,4 +217,72 @@ class Transaction(Base):
         if self.category:
             result['category'] = self.category.to_dict()
             
-        return result
\ No newline at end of file
+        return result
+
+
+@dataclass(frozen=True)
+class TransactionView:
+    """
+    Read-only transaction snapshot rebuilt from a cached Transaction.to_dict().
+    
+    Cache hits return this instead of a mapped Transaction, skipping ORM
+    instance state and attribute instrumentation. It exposes the same
+    attributes the read paths and TransactionResponse.from_orm use; it is
+    not attached to a session and can't be modified or saved.
+    
+    Requirements addressed:
+    - Financial Tracking (1.2): Provides cached transaction data representation
+    """
+    __slots__ = (
+        'id', 'account_id', 'category_id', 'transaction_date', 'post_date',
+        'amount', 'description', 'merchant_name', 'transaction_type', 'status',
+        'is_pending', 'metadata', 'created_at', 'updated_at', 'category'
+    )
+    
+    id: str
+    account_id: str
+    category_id: Optional[int]
+    transaction_date: datetime
+    post_date: Optional[datetime]
+    amount: Decimal
+    description: str
+    merchant_name: Optional[str]
+    transaction_type: str
+    status: str
+    is_pending: bool
+    metadata: Dict
+    created_at: datetime
+    updated_at: datetime
+    category: Optional[Any]
+    
+    @classmethod
+    def from_cache(cls, data: Dict) -> 'TransactionView':
+        """
+        Build a view from Transaction.to_dict() output.
+        
+        Args:
+            data: Cached transaction dictionary
+            
+        Returns:
+            TransactionView with the ORM attribute types restored; ids stay
+            str as the UUID columns load them
+        """
+        post_date = data.get('post_date')
+        category = data.get('category')
+        return cls(
+            id=data['id'],
+            account_id=data['account_id'],
+            category_id=data.get('category_id'),
+            transaction_date=datetime.fromisoformat(data['transaction_date']),
+            post_date=datetime.fromisoformat(post_date) if post_date else None,
+            amount=Decimal(data['amount']),
+            description=data['description'],
+            merchant_name=data.get('merchant_name'),
+            transaction_type=data['transaction_type'],
+            status=data['status'],
+            is_pending=data['is_pending'],
+            metadata=data.get('metadata') or {},
+            created_at=datetime.fromisoformat(data['created_at']),
+            updated_at=datetime.fromisoformat(data['updated_at']),
+            category=SimpleNamespace(**category) if category else None
+        )
@@ -9,13 +9,21 @@ Human Tasks:
 """
 
 # SQLAlchemy: ^1.4.0
-from sqlalchemy import Column, String, Boolean, DateTime, UUID
+from sqlalchemy import Column, String, Boolean, DateTime, Index, func
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from datetime import datetime
+from typing import Optional
 from uuid import uuid4
 
 from ..db.base import Base
-from ..core.security import get_password_hash, verify_password_hash
+from ..core.security import (
+    get_password_hash,
+    get_password_hash_async,
+    verify_password_hash,
+    verify_password_hash_async,
+    password_hash_needs_rehash
+)
 
 class User(Base):
     """
@@ -28,7 +36,7 @@ class User(Base):
     """
     
     # Primary key using UUID for enhanced security and scalability
-    id = Column(UUID, primary_key=True, default=uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4, index=True)
     
     # User profile and authentication fields
     email = Column(String(255), unique=True, index=True, nullable=False)
@@ -50,12 +58,17 @@ class User(Base):
     goals = relationship("Goal", back_populates="user", cascade="all, delete-orphan")
     transactions = relationship("Transaction", back_populates="user", cascade="all, delete-orphan")
     
+    # Case-insensitive uniqueness backing the single-statement registration insert
+    __table_args__ = (
+        Index('ix_users_email_lower', func.lower(email), unique=True),
+    )
+    
     def __init__(
         self,
         email: str,
         first_name: str,
         last_name: str,
-        password: str,
+        password: Optional[str] = None,
         is_active: bool = True,
         is_superuser: bool = False
     ):
@@ -66,7 +79,8 @@ class User(Base):
             email: User's email address
             first_name: User's first name
             last_name: User's last name
-            password: Plain text password (will be hashed)
+            password: Plain text password (will be hashed); omit when the
+                caller sets password_hash from an async hash instead
             is_active: Account status flag
             is_superuser: Administrative privileges flag
         """
@@ -74,7 +88,8 @@ class User(Base):
         self.email = email.lower().strip()
         self.first_name = first_name.strip()
         self.last_name = last_name.strip()
-        self.password_hash = get_password_hash(password)
+        if password is not None:
+            self.password_hash = get_password_hash(password)
         self.is_active = is_active
         self.is_superuser = is_superuser
         self.created_at = datetime.utcnow()
@@ -82,7 +97,7 @@ class User(Base):
     
     def verify_password(self, password: str) -> bool:
         """
-        Verify a password against the stored hash using bcrypt.
+        Verify a password against the stored Argon2id (or legacy bcrypt) hash.
         
         Requirement addressed:
         - Data Security (6.2.2): Secure verification of user credentials
@@ -95,9 +110,36 @@ class User(Base):
         """
         return verify_password_hash(password, self.password_hash)
     
+    async def verify_password_async(self, password: str) -> bool:
+        """
+        Verify a password in the hash process pool, for async request handlers.
+        
+        Requirement addressed:
+        - Data Security (6.2.2): Secure verification of user credentials
+        
+        Args:
+            password: Plain text password to verify
+            
+        Returns:
+            bool: True if password matches hash, False otherwise
+        """
+        return await verify_password_hash_async(password, self.password_hash)
+    
+    def password_needs_rehash(self) -> bool:
+        """
+        Check whether the stored hash is legacy bcrypt or uses outdated Argon2id parameters.
+        
+        Requirement addressed:
+        - Data Security (6.2.2): Transparent migration of stored credentials
+        
+        Returns:
+            bool: True if the password should be rehashed on next successful login
+        """
+        return password_hash_needs_rehash(self.password_hash)
+    
     def set_password(self, password: str) -> None:
         """
-        Update the user's password with a new bcrypt hash.
+        Update the user's password with a new Argon2id hash.
         
         Requirement addressed:
         - Data Security (6.2.2): Secure handling of password updates
@@ -106,4 +148,17 @@ class User(Base):
             password: New plain text password to hash and store
         """
         self.password_hash = get_password_hash(password)
-        self.updated_at = datetime.utcnow()
\ No newline at end of file
+        self.updated_at = datetime.utcnow()
+    
+    async def set_password_async(self, password: str) -> None:
+        """
+        Update the user's password, hashing it in the hash process pool.
+        
+        Requirement addressed:
+        - Data Security (6.2.2): Secure handling of password updates
+        
+        Args:
+            password: New plain text password to hash and store
+        """
+        self.password_hash = await get_password_hash_async(password)
+        self.updated_at = datetime.utcnow()
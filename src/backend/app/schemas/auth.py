@@ -14,6 +14,10 @@ from app.models.user import User
 # 3. Set up monitoring for failed authentication attempts
 # 4. Review token expiration policies with security team
 
+def normalize_email(email: str) -> str:
+    """Lowercases and trims an email once at the API boundary."""
+    return email.strip().lower() if isinstance(email, str) else email
+
 class TokenPayload(BaseModel):
     """
     Schema for JWT token payload data.
@@ -49,6 +53,8 @@ class UserLogin(BaseModel):
     email: EmailStr = Field(..., description="User email address")
     password: str = Field(..., min_length=8, description="User password")
 
+    _normalize_email = validator('email', pre=True, allow_reuse=True)(normalize_email)
+
     @validator('password')
     def validate_password(cls, password: str) -> str:
         """Validates password length and complexity."""
@@ -135,6 +141,8 @@ class PasswordReset(BaseModel):
     """
     email: EmailStr = Field(..., description="User email address")
 
+    _normalize_email = validator('email', pre=True, allow_reuse=True)(normalize_email)
+
 class PasswordUpdate(BaseModel):
     """
     Schema for password update.
@@ -176,4 +176,46 @@ class BudgetResponse(BaseModel):
             progress=progress,
             created_at=db_budget.created_at,
             updated_at=db_budget.updated_at
-        )
\ No newline at end of file
+        )
+
+    @classmethod
+    def from_orm_trusted(
+        cls,
+        db_budget: Budget,
+        category: Optional[CategoryResponse] = None
+    ) -> 'BudgetResponse':
+        """
+        Creates response model from a freshly loaded budget without re-running
+        field validation, for list responses built from database rows.
+        
+        Args:
+            db_budget: Database budget model instance with spend preloaded
+            category: Already-built category response shared between budgets
+            
+        Returns:
+            BudgetResponse: Unvalidated response model instance
+        
+        Requirements addressed:
+        - Budget Management (1.2 Scope/Budget Management):
+          Transforms ORM model to API response with progress metrics
+        """
+        if category is None:
+            category = CategoryResponse.from_orm(db_budget.category)
+        
+        return cls.construct(
+            id=db_budget.id,
+            user_id=db_budget.user_id,
+            name=db_budget.name,
+            amount=float(db_budget.amount),
+            period=db_budget.period,
+            category=category,
+            start_date=db_budget.start_date,
+            end_date=db_budget.end_date,
+            alert_threshold=db_budget.alert_threshold,
+            alert_enabled=db_budget.alert_enabled,
+            is_active=db_budget.is_active,
+            rules=db_budget.rules,
+            progress=db_budget.calculate_progress(),
+            created_at=db_budget.created_at,
+            updated_at=db_budget.updated_at
+        )
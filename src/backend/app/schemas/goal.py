@@ -128,4 +128,12 @@ class GoalResponse(GoalInDB):
         data = super().from_orm(obj)
         data.progress_percentage = obj.calculate_progress_percentage()
         data.days_remaining = data.calculate_days_remaining()
-        return data
\ No newline at end of file
+        return data
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Goal) -> 'GoalResponse':
+        """Build the response from a loaded Goal without re-running field validators."""
+        data = {name: getattr(obj, name) for name in GoalInDB.__fields__}
+        data['progress_percentage'] = obj.calculate_progress_percentage()
+        data['days_remaining'] = max(0, (obj.target_date.date() - date.today()).days)
+        return cls.construct(**data)
@@ -11,16 +11,64 @@ Human Tasks:
 # fastapi: ^0.95.0
 # sqlalchemy: ^1.4.0
 
+import asyncio
+import hashlib
+import hmac
+import secrets
 from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Union
 from uuid import UUID
 from fastapi import HTTPException
-from sqlalchemy.orm import Session
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
-from ..core.auth import create_access_token, create_refresh_token, verify_token
+from ..core.auth import create_access_token, create_token_pair, verify_token
+from ..core.cache import cache
+from ..core.config import get_settings
+from ..core.security import get_password_hash_async, verify_password_hash_async
 from ..models.user import User
 from ..schemas.auth import TokenPayload, Token, UserLogin, UserRegister
 
+# Lookup statement is built once at import; only the bound parameter changes per call
+_USER_BY_EMAIL_STMT = select(User).where(User.email == bindparam('email'))
+
+# Hash verified for unknown emails so every login pays exactly one KDF. It is
+# created at startup; creating it on first use would make that unknown-email
+# login pay two KDFs and stand out by its timing
+_dummy_password_hash: Optional[str] = None
+
+async def warm_dummy_password_hash() -> None:
+    """Creates the process-wide dummy hash before the app serves logins."""
+    await _get_dummy_password_hash()
+
+async def _get_dummy_password_hash() -> str:
+    """Returns the process-wide hash of a random password."""
+    global _dummy_password_hash
+    if _dummy_password_hash is None:
+        _dummy_password_hash = await get_password_hash_async(secrets.token_urlsafe(16))
+    return _dummy_password_hash
+
+# Logins verified within this window skip the password KDF. Entries are keyed
+# by an HMAC over the email, the stored hash and the password, so Redis never
+# sees anything password-derived without the server secret, and any password
+# change or rehash invalidates them
+VERIFIED_LOGIN_PREFIX: str = 'auth_verified:'
+VERIFIED_LOGIN_TTL: int = 60  # seconds
+
+def _verified_login_key(email: str, password_hash: Union[str, bytes], password: str) -> str:
+    """Cache key marking (email, stored hash, password) as recently verified."""
+    # Legacy rows may still hold the hash as bytes; key on its text form
+    if isinstance(password_hash, bytes):
+        password_hash = password_hash.decode('ascii')
+    mac = hmac.new(get_settings().SECRET_KEY.encode('utf-8'), b'login-verify', hashlib.sha256)
+    for part in (email, password_hash, password):
+        encoded = part.encode('utf-8')
+        # Length-prefixed so field boundaries can't be shifted between parts
+        mac.update(len(encoded).to_bytes(4, 'big') + encoded)
+    return f"{VERIFIED_LOGIN_PREFIX}{mac.hexdigest()}"
+
 class AuthService:
     """
     Service class handling user authentication, token management, and session handling.
@@ -28,61 +76,111 @@ class AuthService:
     Requirement: Authentication Flow - 6.1 Authentication and Authorization/6.1.1 Authentication Flow
     """
     
-    def __init__(self, db_session: Session):
+    def __init__(self, db_session: AsyncSession):
         """Initialize auth service with database session."""
         self._db = db_session
+        # Request-scoped email -> User lookups; the service lives for one request
+        self._users_by_email: Dict[str, Optional[User]] = {}
+
+    async def _user_by_email(self, email_norm: str) -> Optional[User]:
+        """Resolve a normalized email to a User, querying at most once per request."""
+        if email_norm not in self._users_by_email:
+            result = await self._db.execute(
+                _USER_BY_EMAIL_STMT,
+                {'email': email_norm}
+            )
+            self._users_by_email[email_norm] = result.scalar_one_or_none()
+        return self._users_by_email[email_norm]
 
-    def authenticate_user(self, email: str, password: str) -> Optional[User]:
+    async def authenticate_user(self, email: str, password: str) -> Optional[User]:
         """
-        Authenticates a user with email and password.
+        Authenticates a user with email and password. The email is expected
+        already normalized by the UserLogin schema.
         
         Requirement: Security Standards - 6.3 Security Protocols/6.3.1 Security Standards Compliance
         """
         # Query user by email
-        user = self._db.query(User).filter(User.email == email.lower().strip()).first()
+        user = await self._user_by_email(email)
         
-        if not user:
-            return None
-            
-        # Verify password
-        if not user.verify_password(password):
+        # Unknown emails check a dummy hash, both in the verified-login cache
+        # and the KDF, so response time does not reveal which addresses are
+        # registered. The dummy key is never set, so it always misses
+        stored_hash = user.password_hash if user else await _get_dummy_password_hash()
+        
+        # Repeat logins inside VERIFIED_LOGIN_TTL skip the KDF; the cache
+        # client is blocking, so its calls run off the event loop
+        if await asyncio.to_thread(cache.exists, _verified_login_key(email, stored_hash, password)):
+            return user
+        
+        # Verify password in the hash process pool
+        password_valid = await verify_password_hash_async(password, stored_hash)
+        if not user or not password_valid:
             return None
+        
+        # Migrate legacy bcrypt or outdated Argon2id hashes while the plain password is known
+        if user.password_needs_rehash():
+            await user.set_password_async(password)
+            await self._db.commit()
+        
+        # Keyed by the hash now stored, so the window never outlives it; hits
+        # don't extend the window
+        await asyncio.to_thread(
+            cache.set,
+            _verified_login_key(email, user.password_hash, password),
+            '1',
+            ttl=VERIFIED_LOGIN_TTL
+        )
             
         return user
 
-    def create_user(self, user_data: UserRegister) -> User:
+    async def create_user(self, user_data: UserRegister) -> User:
         """
         Creates a new user account with validated registration data.
         
         Requirement: Security Standards - 6.3 Security Protocols/6.3.1 Security Standards Compliance
         """
-        # Check if email already exists
-        existing_user = self._db.query(User).filter(
-            User.email == user_data.email.lower().strip()
-        ).first()
+        # Hash in the process pool; the model's constructor would run the
+        # KDF on the event loop
+        password_hash = await get_password_hash_async(user_data.password)
         
-        if existing_user:
-            raise HTTPException(
-                status_code=400,
-                detail="Email already registered"
-            )
-            
-        # Create new user instance
+        # Create new user instance (normalizes email)
         user = User(
             email=user_data.email,
             first_name=user_data.first_name,
-            last_name=user_data.last_name,
-            password=user_data.password
+            last_name=user_data.last_name
         )
+        user.password_hash = password_hash
+        
+        # Existence check and insert in one round trip; the unique email
+        # indexes make concurrent registrations for the same address safe
+        stmt = pg_insert(User).values(
+            id=user.id,
+            email=user.email,
+            first_name=user.first_name,
+            last_name=user.last_name,
+            password_hash=user.password_hash,
+            is_active=user.is_active,
+            is_superuser=user.is_superuser,
+            created_at=user.created_at,
+            updated_at=user.updated_at
+        ).on_conflict_do_nothing().returning(User.id)
         
-        # Save to database
+        if (await self._db.execute(stmt)).scalar() is None:
+            await self._db.rollback()
+            raise HTTPException(
+                status_code=400,
+                detail="Email already registered"
+            )
+        await self._db.commit()
+        
+        # Attach the already-inserted row without another SELECT
+        make_transient_to_detached(user)
         self._db.add(user)
-        self._db.commit()
-        self._db.refresh(user)
+        self._users_by_email[user.email] = user
         
         return user
 
-    def login(self, credentials: UserLogin) -> Token:
+    async def login(self, credentials: UserLogin) -> Token:
         """
         Handles user login and generates access/refresh tokens.
         
@@ -91,7 +189,7 @@ class AuthService:
         - Session Management - 6.3 Security Controls/6.3.3 Security Controls
         """
         # Authenticate user
-        user = self.authenticate_user(credentials.email, credentials.password)
+        user = await self.authenticate_user(credentials.email, credentials.password)
         
         if not user:
             raise HTTPException(
@@ -101,17 +199,14 @@ class AuthService:
             )
             
         # Generate tokens
-        token_data = {"sub": str(user.id)}
-        
-        access_token = create_access_token(token_data)
-        refresh_token = create_refresh_token(token_data)
+        access_token, refresh_token = create_token_pair(str(user.id))
         
         return Token(
             access_token=access_token,
             refresh_token=refresh_token
         )
 
-    def refresh_token(self, refresh_token: str) -> Token:
+    async def refresh_token(self, refresh_token: str) -> Token:
         """
         Refreshes access token using valid refresh token.
         
@@ -121,26 +216,16 @@ class AuthService:
             # Verify refresh token
             payload = verify_token(refresh_token)
             
-            if not payload.get("type") == "refresh":
+            # verify_token guarantees the type and sub claims are present
+            if payload["type"] != "refresh":
                 raise HTTPException(
                     status_code=401,
                     detail="Invalid refresh token",
                     headers={"WWW-Authenticate": "Bearer"},
                 )
                 
-            # Extract user ID
-            user_id = payload.get("sub")
-            if not user_id:
-                raise HTTPException(
-                    status_code=401,
-                    detail="Invalid token payload",
-                    headers={"WWW-Authenticate": "Bearer"},
-                )
-                
             # Generate new tokens
-            token_data = {"sub": user_id}
-            access_token = create_access_token(token_data)
-            new_refresh_token = create_refresh_token(token_data)
+            access_token, new_refresh_token = create_token_pair(payload["sub"])
             
             return Token(
                 access_token=access_token,
@@ -154,14 +239,15 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-    def reset_password(self, email: str) -> bool:
+    async def reset_password(self, email: str) -> bool:
         """
-        Initiates password reset process for user.
+        Initiates password reset process for user. The email is expected
+        already normalized by the PasswordReset schema.
         
         Requirement: Security Standards - 6.3 Security Protocols/6.3.1 Security Standards Compliance
         """
         # Find user
-        user = self._db.query(User).filter(User.email == email.lower().strip()).first()
+        user = await self._user_by_email(email)
         
         if not user:
             # Return True to prevent email enumeration
@@ -180,14 +266,14 @@ class AuthService:
         
         return True
 
-    def change_password(self, user_id: UUID, current_password: str, new_password: str) -> bool:
+    async def change_password(self, user_id: UUID, current_password: str, new_password: str) -> bool:
         """
         Changes user password after validation.
         
         Requirement: Security Standards - 6.3 Security Protocols/6.3.1 Security Standards Compliance
         """
-        # Find user
-        user = self._db.query(User).filter(User.id == user_id).first()
+        # Find user (served from the session identity map when already loaded)
+        user = await self._db.get(User, user_id)
         
         if not user:
             raise HTTPException(
@@ -196,14 +282,14 @@ class AuthService:
             )
             
         # Verify current password
-        if not user.verify_password(current_password):
+        if not await user.verify_password_async(current_password):
             raise HTTPException(
                 status_code=401,
                 detail="Invalid current password"
             )
             
         # Update password
-        user.set_password(new_password)
-        self._db.commit()
+        await user.set_password_async(new_password)
+        await self._db.commit()
         
         return True
\ No newline at end of file
@@ -11,16 +11,58 @@
 # 4. Configure logging levels for budget-related operations
 
 from datetime import datetime
+from decimal import Decimal
 from typing import List, Dict, Optional
 from uuid import UUID
 
-from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only, selectinload
+from sqlalchemy import and_, bindparam, case, func, select, update
 
+from app.models.account import Account
 from app.models.budget import Budget
 from app.models.category import Category
+from app.models.transaction import Transaction
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
+from app.schemas.category import CategoryResponse
 from app.core.errors import NotFoundError, ValidationError
+from app.utils.datetime import get_current_datetime, get_date_range
+
+# Module-level statements so SQLAlchemy compiles them once and serves every
+# request from the engine's compiled cache
+_ACTIVE_BUDGET_STMT = select(Budget).where(
+    and_(
+        Budget.id == bindparam('budget_id'),
+        Budget.user_id == bindparam('user_id'),
+        Budget.is_active == True
+    )
+)
+# Updates only assign attributes and then reload, so the JSON rules
+# column and the rest of the row need not be fetched up front
+_ACTIVE_BUDGET_FOR_UPDATE_STMT = _ACTIVE_BUDGET_STMT.options(load_only(Budget.id))
+# Existence check only: selecting the id skips the row width and the
+# joined-eager Category.parent load
+_ACTIVE_CATEGORY_ID_STMT = select(Category.id).where(
+    and_(
+        Category.id == bindparam('category_id'),
+        Category.is_active == True
+    )
+)
+
+# Soft delete in one round trip; owner_id avoids clashing with the
+# user_id column name that UPDATE reserves for SET parameters
+_DEACTIVATE_BUDGET_STMT = update(Budget).where(
+    and_(
+        Budget.id == bindparam('budget_id'),
+        Budget.user_id == bindparam('owner_id'),
+        Budget.is_active == True
+    )
+).values(is_active=False).returning(Budget.id).execution_options(
+    synchronize_session=False
+)
+
+# Budget periods supported by get_date_range
+BUDGET_PERIODS = ('daily', 'weekly', 'monthly', 'yearly')
 
 class BudgetService:
     """
@@ -35,11 +77,11 @@ class BudgetService:
       Implements customizable alerts for budget thresholds
     """
 
-    def __init__(self, db: Session):
+    def __init__(self, db: AsyncSession):
         """Initialize budget service with database session."""
         self._db = db
 
-    def create_budget(self, user_id: UUID, budget_data: BudgetCreate) -> BudgetResponse:
+    async def create_budget(self, user_id: UUID, budget_data: BudgetCreate) -> BudgetResponse:
         """
         Creates a new budget for a user with category validation.
         
@@ -52,14 +94,12 @@ class BudgetService:
             raise ValidationError("Invalid budget dates")
 
         # Verify category exists and is active
-        category = self._db.query(Category).filter(
-            and_(
-                Category.id == budget_data.category_id,
-                Category.is_active == True
-            )
-        ).first()
+        result = await self._db.execute(
+            _ACTIVE_CATEGORY_ID_STMT,
+            {'category_id': budget_data.category_id}
+        )
         
-        if not category:
+        if result.scalar_one_or_none() is None:
             raise ValidationError(f"Category {budget_data.category_id} not found or inactive")
 
         # Create new budget instance
@@ -76,18 +116,17 @@ class BudgetService:
             rules=budget_data.rules
         )
 
-        # Calculate initial progress
-        budget.calculate_progress()
-
         # Save to database
         self._db.add(budget)
-        self._db.commit()
-        self._db.refresh(budget)
+        await self._db.commit()
+
+        # Reload with category and initial progress
+        budget = await self._load_budget(budget.id)
 
         # Return response
         return BudgetResponse.from_orm(budget)
 
-    def update_budget(self, budget_id: int, user_id: UUID, budget_data: BudgetUpdate) -> BudgetResponse:
+    async def update_budget(self, budget_id: int, user_id: UUID, budget_data: BudgetUpdate) -> BudgetResponse:
         """
         Updates an existing budget with validation.
         
@@ -95,14 +134,12 @@ class BudgetService:
         - Budget Management (1.2 Scope/Budget Management):
           Enables modification of budget parameters and alert settings
         """
-        # Query existing budget
-        budget = self._db.query(Budget).filter(
-            and_(
-                Budget.id == budget_id,
-                Budget.user_id == user_id,
-                Budget.is_active == True
-            )
-        ).first()
+        # Query existing budget; the full row is reloaded after commit
+        result = await self._db.execute(
+            _ACTIVE_BUDGET_FOR_UPDATE_STMT,
+            {'budget_id': budget_id, 'user_id': user_id}
+        )
+        budget = result.scalar_one_or_none()
 
         if not budget:
             raise NotFoundError(f"Budget {budget_id} not found")
@@ -123,16 +160,15 @@ class BudgetService:
         if budget_data.rules is not None:
             budget.rules = budget_data.rules
 
-        # Recalculate progress
-        budget.calculate_progress()
-
         # Save changes
-        self._db.commit()
-        self._db.refresh(budget)
+        await self._db.commit()
+
+        # Reload to recalculate progress for the (possibly new) period
+        budget = await self._load_budget(budget.id)
 
         return BudgetResponse.from_orm(budget)
 
-    def get_budget(self, budget_id: int, user_id: UUID) -> BudgetResponse:
+    async def get_budget(self, budget_id: int, user_id: UUID) -> BudgetResponse:
         """
         Retrieves a specific budget by ID with progress.
         
@@ -140,23 +176,19 @@ class BudgetService:
         - Budget Progress Monitoring (1.2 Scope/Budget Management):
           Provides detailed budget status with progress metrics
         """
-        budget = self._db.query(Budget).filter(
-            and_(
-                Budget.id == budget_id,
-                Budget.user_id == user_id,
-                Budget.is_active == True
-            )
-        ).first()
-
-        if not budget:
+        # Budget and its current progress in one query
+        budgets = await self._query_budgets_with_spent([
+            Budget.id == budget_id,
+            Budget.user_id == user_id,
+            Budget.is_active == True
+        ])
+
+        if not budgets:
             raise NotFoundError(f"Budget {budget_id} not found")
 
-        # Calculate current progress
-        budget.calculate_progress()
+        return BudgetResponse.from_orm(budgets[0])
 
-        return BudgetResponse.from_orm(budget)
-
-    def list_budgets(self, user_id: UUID, filters: Optional[Dict] = None) -> List[BudgetResponse]:
+    async def list_budgets(self, user_id: UUID, filters: Optional[Dict] = None) -> List[BudgetResponse]:
         """
         Lists all budgets for a user with optional filters.
         
@@ -164,31 +196,35 @@ class BudgetService:
         - Budget Management (1.2 Scope/Budget Management):
           Provides comprehensive budget listing with filtering
         """
-        query = self._db.query(Budget).filter(
-            and_(
-                Budget.user_id == user_id,
-                Budget.is_active == True
-            )
-        )
+        criteria = [
+            Budget.user_id == user_id,
+            Budget.is_active == True
+        ]
 
         # Apply additional filters if provided
         if filters:
             if 'category_id' in filters:
-                query = query.filter(Budget.category_id == filters['category_id'])
+                criteria.append(Budget.category_id == filters['category_id'])
             if 'period' in filters:
-                query = query.filter(Budget.period == filters['period'])
+                criteria.append(Budget.period == filters['period'])
             if 'alert_enabled' in filters:
-                query = query.filter(Budget.alert_enabled == filters['alert_enabled'])
+                criteria.append(Budget.alert_enabled == filters['alert_enabled'])
 
-        budgets = query.all()
+        # Load budgets with their period spend in a single aggregate query
+        budgets = await self._query_budgets_with_spent(criteria)
 
-        # Calculate progress for each budget
+        # Build each category response once and skip revalidating trusted rows
+        categories: Dict[int, CategoryResponse] = {}
+        responses = []
         for budget in budgets:
-            budget.calculate_progress()
-
-        return [BudgetResponse.from_orm(budget) for budget in budgets]
+            if budget.category_id not in categories:
+                categories[budget.category_id] = CategoryResponse.from_orm(budget.category)
+            responses.append(
+                BudgetResponse.from_orm_trusted(budget, categories[budget.category_id])
+            )
+        return responses
 
-    def delete_budget(self, budget_id: int, user_id: UUID) -> bool:
+    async def delete_budget(self, budget_id: int, user_id: UUID) -> bool:
         """
         Soft deletes a budget by setting is_active to False.
         
@@ -196,23 +232,19 @@ class BudgetService:
         - Budget Management (1.2 Scope/Budget Management):
           Enables safe removal of budgets while preserving history
         """
-        budget = self._db.query(Budget).filter(
-            and_(
-                Budget.id == budget_id,
-                Budget.user_id == user_id,
-                Budget.is_active == True
-            )
-        ).first()
+        result = await self._db.execute(
+            _DEACTIVATE_BUDGET_STMT,
+            {'budget_id': budget_id, 'owner_id': user_id}
+        )
 
-        if not budget:
+        if result.scalar_one_or_none() is None:
             raise NotFoundError(f"Budget {budget_id} not found")
 
-        budget.is_active = False
-        self._db.commit()
+        await self._db.commit()
 
         return True
 
-    def check_budget_alerts(self, user_id: UUID) -> List[Dict]:
+    async def check_budget_alerts(self, user_id: UUID) -> List[Dict]:
         """
         Checks all active budgets for threshold alerts.
         
@@ -220,19 +252,84 @@ class BudgetService:
         - Budget Alerts (1.2 Scope/Budget Management):
           Implements threshold-based budget alerts
         """
-        budgets = self._db.query(Budget).filter(
-            and_(
+        # Threshold filtering happens in SQL, so every returned budget is alerting
+        budgets = await self._query_budgets_with_spent(
+            [
                 Budget.user_id == user_id,
                 Budget.is_active == True,
                 Budget.alert_enabled == True,
                 Budget.alert_threshold.isnot(None)
-            )
-        ).all()
+            ],
+            alerts_only=True
+        )
 
-        alerts = []
-        for budget in budgets:
-            if budget.check_alert_threshold():
-                budget.calculate_progress()
-                alerts.append(budget.to_dict())
+        return [budget.to_dict() for budget in budgets]
+
+    async def _load_budget(self, budget_id: int) -> Budget:
+        """Reloads a just-committed budget with its category and period spend."""
+        budgets = await self._query_budgets_with_spent([Budget.id == budget_id])
+        return budgets[0]
+
+    async def _query_budgets_with_spent(self, criteria: List, alerts_only: bool = False) -> List[Budget]:
+        """
+        Loads budgets together with their current-period spend in one
+        GROUP BY query and preloads the spend onto each budget, so that
+        calculate_progress does not issue a SUM query per budget.
+        
+        Args:
+            criteria: Filter expressions applied to the budget rows
+            alerts_only: Only return budgets whose spend has crossed alert_threshold
+            
+        Returns:
+            List of budgets with spent amounts preloaded
+        """
+        # Period boundaries are the same for every budget sharing a period type
+        # transaction_date is a naive UTC column, so the bounds are bound naive
+        now = get_current_datetime()
+        bounds = {
+            period: tuple(bound.replace(tzinfo=None) for bound in get_date_range(period, now))
+            for period in BUDGET_PERIODS
+        }
+        period_start = case({p: b[0] for p, b in bounds.items()}, value=Budget.period)
+        period_end = case({p: b[1] for p, b in bounds.items()}, value=Budget.period)
+
+        spent = func.coalesce(func.sum(Transaction.amount), 0)
+        # Transactions are owned through their account, so the spend join
+        # goes via Account; the inner join stays inside the outer join so
+        # budgets without spend are still returned
+        spend = Transaction.__table__.join(
+            Account.__table__,
+            Transaction.account_id == Account.id
+        )
+        stmt = select(Budget, spent.label('spent')).outerjoin(
+            spend,
+            and_(
+                Transaction.category_id == Budget.category_id,
+                Account.user_id == Budget.user_id,
+                Transaction.transaction_date >= period_start,
+                Transaction.transaction_date < period_end,
+                Transaction.transaction_type == 'expense'
+            )
+        ).where(and_(*criteria)).group_by(Budget.id).options(
+            # Responses read budget.category and its subcategories; lazy loads
+            # are not possible under asyncio (parent is already joined-eager)
+            selectinload(Budget.category)
+            .selectinload(Category.subcategories)
+            .selectinload(Category.subcategories)
+        ).execution_options(populate_existing=True)
+
+        if alerts_only:
+            # min(spent / amount * 100, 100) >= threshold, without dividing in
+            # SQL; capped like calculate_progress so thresholds above 100 agree
+            stmt = stmt.having(
+                and_(
+                    Budget.amount > 0,
+                    func.least(spent, Budget.amount) * 100 >= Budget.amount * Budget.alert_threshold
+                )
+            )
 
-        return alerts
\ No newline at end of file
+        budgets = []
+        for budget, spent_amount in await self._db.execute(stmt):
+            budget.preload_spent_amount(Decimal(spent_amount))
+            budgets.append(budget)
+        return budgets
\ No newline at end of file
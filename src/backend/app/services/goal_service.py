@@ -18,11 +18,45 @@ from decimal import Decimal
 # typing: ^3.9+
 from typing import Optional, List
 
+# sqlalchemy: ^1.4.0
+from sqlalchemy import Numeric, and_, bindparam, case, delete, not_, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.models.goal import Goal
 from app.schemas.goal import GoalCreate, GoalUpdate, GoalInDB, GoalResponse
 from app.db.session import get_db
 from app.core.errors import DatabaseError
 
+# Built once so every goal lookup reuses the same compiled SQL
+_USER_GOAL_STMT = select(Goal).where(
+    Goal.id == bindparam('goal_id'),
+    Goal.user_id == bindparam('user_id')
+)
+_DELETE_USER_GOAL_STMT = delete(Goal).where(
+    Goal.id == bindparam('goal_id'),
+    Goal.user_id == bindparam('user_id')
+).execution_options(synchronize_session=False)
+
+# Progress update computed by the database in a single UPDATE ... RETURNING.
+# Completion is sticky and completed_at is only stamped on the transition,
+# mirroring Goal.update_progress. owner_id avoids the reserved user_id name.
+_progress_amount = bindparam('amount', type_=Numeric(20, 2))
+_reaches_target = _progress_amount >= Goal.__table__.c.target_amount
+_UPDATE_GOAL_PROGRESS_STMT = select(Goal).from_statement(
+    update(Goal.__table__).where(
+        Goal.__table__.c.id == bindparam('goal_id'),
+        Goal.__table__.c.user_id == bindparam('owner_id')
+    ).values(
+        current_amount=_progress_amount,
+        updated_at=bindparam('now'),
+        is_completed=or_(Goal.__table__.c.is_completed, _reaches_target),
+        completed_at=case(
+            (and_(not_(Goal.__table__.c.is_completed), _reaches_target), bindparam('now')),
+            else_=Goal.__table__.c.completed_at
+        )
+    ).returning(*Goal.__table__.c)
+).execution_options(populate_existing=True)
+
 class GoalService:
     """
     Service class for managing financial goals with database operations and business logic.
@@ -32,11 +66,11 @@ class GoalService:
     - Data Flow Architecture (2.3): Implements goal service for processing goal-related business logic
     """
 
-    def __init__(self, db_session):
+    def __init__(self, db_session: AsyncSession):
         """Initialize goal service with database session."""
         self._db = db_session
 
-    def create_goal(self, goal_data: GoalCreate) -> GoalInDB:
+    async def create_goal(self, goal_data: GoalCreate) -> GoalInDB:
         """
         Create a new financial goal.
         
@@ -64,19 +98,19 @@ class GoalService:
                 target_date=goal_data.target_date
             )
             
-            # Add to database and commit
+            # Add to database and commit; every column default is applied
+            # client-side and sessions keep state after commit, so no refresh
             self._db.add(goal)
-            self._db.commit()
-            self._db.refresh(goal)
+            await self._db.commit()
             
             # Convert to schema and return
             return GoalInDB.from_orm(goal)
             
         except Exception as e:
-            self._db.rollback()
+            await self._db.rollback()
             raise DatabaseError(f"Failed to create goal: {str(e)}")
 
-    def get_goal(self, goal_id: UUID, user_id: UUID) -> Optional[GoalResponse]:
+    async def get_goal(self, goal_id: UUID, user_id: UUID) -> Optional[GoalResponse]:
         """
         Retrieve a goal by ID and user ID.
         
@@ -90,17 +124,18 @@ class GoalService:
         Returns:
             Goal data with progress metrics if found, None otherwise
         """
-        goal = self._db.query(Goal).filter(
-            Goal.id == goal_id,
-            Goal.user_id == user_id
-        ).first()
+        result = await self._db.execute(
+            _USER_GOAL_STMT,
+            {'goal_id': goal_id, 'user_id': user_id}
+        )
+        goal = result.scalar_one_or_none()
         
         if not goal:
             return None
             
         return GoalResponse.from_orm(goal)
 
-    def list_goals(self, user_id: UUID) -> List[GoalResponse]:
+    async def list_goals(self, user_id: UUID) -> List[GoalResponse]:
         """
         List all goals for a user with progress tracking.
         
@@ -113,10 +148,12 @@ class GoalService:
         Returns:
             List of user's goals with progress metrics
         """
-        goals = self._db.query(Goal).filter(Goal.user_id == user_id).all()
-        return [GoalResponse.from_orm(goal) for goal in goals]
+        result = await self._db.execute(select(Goal).where(Goal.user_id == user_id))
+        goals = result.scalars().all()
+        # Rows come straight from the database, so skip per-field revalidation
+        return [GoalResponse.from_orm_trusted(goal) for goal in goals]
 
-    def update_goal(self, goal_id: UUID, user_id: UUID, goal_data: GoalUpdate) -> Optional[GoalInDB]:
+    async def update_goal(self, goal_id: UUID, user_id: UUID, goal_data: GoalUpdate) -> Optional[GoalInDB]:
         """
         Update an existing goal.
         
@@ -135,10 +172,11 @@ class GoalService:
             DatabaseError: If goal update fails
         """
         try:
-            goal = self._db.query(Goal).filter(
-                Goal.id == goal_id,
-                Goal.user_id == user_id
-            ).first()
+            result = await self._db.execute(
+                _USER_GOAL_STMT,
+                {'goal_id': goal_id, 'user_id': user_id}
+            )
+            goal = result.scalar_one_or_none()
             
             if not goal:
                 return None
@@ -155,16 +193,15 @@ class GoalService:
             if goal_data.account_id is not None:
                 goal.account_id = goal_data.account_id
                 
-            self._db.commit()
-            self._db.refresh(goal)
+            await self._db.commit()
             
             return GoalInDB.from_orm(goal)
             
         except Exception as e:
-            self._db.rollback()
+            await self._db.rollback()
             raise DatabaseError(f"Failed to update goal: {str(e)}")
 
-    def delete_goal(self, goal_id: UUID, user_id: UUID) -> bool:
+    async def delete_goal(self, goal_id: UUID, user_id: UUID) -> bool:
         """
         Delete a goal by ID and user ID.
         
@@ -182,19 +219,19 @@ class GoalService:
             DatabaseError: If goal deletion fails
         """
         try:
-            result = self._db.query(Goal).filter(
-                Goal.id == goal_id,
-                Goal.user_id == user_id
-            ).delete()
+            result = await self._db.execute(
+                _DELETE_USER_GOAL_STMT,
+                {'goal_id': goal_id, 'user_id': user_id}
+            )
             
-            self._db.commit()
-            return result > 0
+            await self._db.commit()
+            return result.rowcount > 0
             
         except Exception as e:
-            self._db.rollback()
+            await self._db.rollback()
             raise DatabaseError(f"Failed to delete goal: {str(e)}")
 
-    def update_goal_progress(self, goal_id: UUID, user_id: UUID, amount: Decimal) -> Optional[GoalResponse]:
+    async def update_goal_progress(self, goal_id: UUID, user_id: UUID, amount: Decimal) -> Optional[GoalResponse]:
         """
         Update goal progress amount and check completion.
         
@@ -213,22 +250,28 @@ class GoalService:
             DatabaseError: If progress update fails
         """
         try:
-            goal = self._db.query(Goal).filter(
-                Goal.id == goal_id,
-                Goal.user_id == user_id
-            ).first()
+            if amount < Decimal('0'):
+                raise ValueError("Amount cannot be negative")
+            
+            # Update progress and check completion in one round trip
+            result = await self._db.execute(
+                _UPDATE_GOAL_PROGRESS_STMT,
+                {
+                    'goal_id': goal_id,
+                    'owner_id': user_id,
+                    'amount': amount,
+                    'now': datetime.utcnow()
+                }
+            )
+            goal = result.scalars().one_or_none()
             
             if not goal:
                 return None
-                
-            # Update progress and check completion
-            goal.update_progress(amount)
             
-            self._db.commit()
-            self._db.refresh(goal)
+            await self._db.commit()
             
-            return GoalResponse.from_orm(goal)
+            return GoalResponse.from_orm_trusted(goal)
             
         except Exception as e:
-            self._db.rollback()
+            await self._db.rollback()
             raise DatabaseError(f"Failed to update goal progress: {str(e)}")
\ No newline at end of file
@@ -1,15 +1,20 @@
 # SQLAlchemy: ^1.4.0
 # Python: 3.9+
+from sqlalchemy import String, case, cast, column, func, select, update, values
 from sqlalchemy.orm import Session
 from uuid import UUID
 from decimal import Decimal
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 
 from app.models.investment import Investment
 from app.schemas.investment import InvestmentCreate, InvestmentUpdate, InvestmentResponse, InvestmentInDB
 from app.db.session import get_db
 
+# Columns backing InvestmentResponse, read as plain rows for read-only
+# endpoints so no ORM instances or identity-map entries are created
+_RESPONSE_COLUMNS = [Investment.__table__.c[name] for name in InvestmentResponse.__fields__]
+
 # Human Tasks:
 # 1. Configure database connection pool size based on expected load
 # 2. Set up monitoring for investment value sync operations
@@ -90,15 +95,17 @@ class InvestmentService:
         Raises:
             ValueError: If investment not found or inactive
         """
-        investment = self.db.query(Investment).filter(
-            Investment.id == investment_id,
-            Investment.is_active == True
-        ).first()
+        row = self.db.execute(
+            select(*_RESPONSE_COLUMNS).where(
+                Investment.id == investment_id,
+                Investment.is_active == True
+            )
+        ).mappings().first()
         
-        if not investment:
+        if not row:
             raise ValueError(f"Investment {investment_id} not found or inactive")
             
-        return InvestmentResponse.from_orm(investment)
+        return InvestmentResponse(**row)
 
     def update_investment(
         self,
@@ -201,12 +208,14 @@ class InvestmentService:
         Returns:
             List[InvestmentResponse]: List of investment details
         """
-        investments = self.db.query(Investment).filter(
-            Investment.account_id == account_id,
-            Investment.is_active == True
-        ).offset(skip).limit(limit).all()
+        rows = self.db.execute(
+            select(*_RESPONSE_COLUMNS).where(
+                Investment.account_id == account_id,
+                Investment.is_active == True
+            ).offset(skip).limit(limit)
+        ).mappings().all()
         
-        return [InvestmentResponse.from_orm(inv) for inv in investments]
+        return [InvestmentResponse(**row) for row in rows]
 
     def sync_investment_values(
         self,
@@ -247,6 +256,97 @@ class InvestmentService:
         
         return InvestmentResponse.from_orm(investment)
 
+    def sync_investment_values_bulk(
+        self,
+        updates: List[Tuple[UUID, Decimal, Optional[Decimal]]]
+    ) -> List[InvestmentResponse]:
+        """
+        Update values for many investments in a single UPDATE statement and one commit.
+        
+        Requirements addressed:
+        - Investment Tracking (1.2): Implements real-time value updates
+        
+        Args:
+            updates: (investment_id, current_value, quantity) tuples; quantity may be None
+            
+        Returns:
+            List[InvestmentResponse]: Updated investment details in input order
+            
+        Raises:
+            ValueError: If any investment is not found or inactive, or appears twice
+        """
+        if not updates:
+            return []
+            
+        # A repeated id would join one row to several VALUES rows, and
+        # PostgreSQL would apply an arbitrary one of them
+        seen = set()
+        duplicates = []
+        for investment_id, _, _ in updates:
+            key = str(investment_id)
+            if key in seen:
+                duplicates.append(key)
+            seen.add(key)
+        if duplicates:
+            raise ValueError(f"Investments {', '.join(duplicates)} appear more than once")
+            
+        # Same validation as Investment.update_value, done up front since the
+        # ORM method is bypassed
+        for _, current_value, quantity in updates:
+            if not isinstance(current_value, Decimal) or current_value < Decimal('0'):
+                raise ValueError("Current value must be a non-negative Decimal value")
+            if quantity is not None and (not isinstance(quantity, Decimal) or quantity < Decimal('0')):
+                raise ValueError("Quantity must be a non-negative Decimal value")
+                
+        table = Investment.__table__
+        incoming = values(
+            column('id', table.c.id.type),
+            column('current_value', table.c.current_value.type),
+            column('quantity', table.c.quantity.type),
+            name='incoming'
+        ).data([
+            (str(investment_id), current_value, quantity)
+            for investment_id, current_value, quantity in updates
+        ])
+        
+        # VALUES literals are untyped on the server, so cast before mixing
+        # them with uuid/numeric columns
+        new_value = cast(incoming.c.current_value, table.c.current_value.type)
+        new_quantity = cast(incoming.c.quantity, table.c.quantity.type)
+        synced_at = datetime.utcnow()
+        
+        # One UPDATE ... FROM (VALUES ...) RETURNING round-trip for the whole
+        # batch; gain/loss and return mirror Investment.update_value
+        rows = self.db.execute(
+            update(table)
+            .where(
+                table.c.id == cast(incoming.c.id, table.c.id.type),
+                table.c.is_active == True
+            )
+            .values(
+                current_value=new_value,
+                quantity=func.coalesce(new_quantity, table.c.quantity),
+                unrealized_gain_loss=new_value - table.c.cost_basis,
+                return_percentage=case(
+                    (table.c.cost_basis > 0, (new_value - table.c.cost_basis) / table.c.cost_basis * 100),
+                    else_=0
+                ),
+                last_synced_at=synced_at,
+                updated_at=synced_at
+            )
+            .returning(*_RESPONSE_COLUMNS)
+        ).mappings().all()
+        
+        responses = {str(row['id']): InvestmentResponse(**row) for row in rows}
+        missing = [str(investment_id) for investment_id, _, _ in updates if str(investment_id) not in responses]
+        if missing:
+            self.db.rollback()
+            raise ValueError(f"Investments {', '.join(missing)} not found or inactive")
+            
+        self.db.commit()
+        
+        return [responses[str(investment_id)] for investment_id, _, _ in updates]
+
     def calculate_portfolio_metrics(self, account_id: UUID) -> Dict:
         """
         Calculate aggregate portfolio metrics.
@@ -264,25 +364,26 @@ class InvestmentService:
             - total_gain_loss: Unrealized gain/loss
             - return_percentage: Overall return percentage
         """
-        investments = self.db.query(Investment).filter(
-            Investment.account_id == account_id,
-            Investment.is_active == True
-        ).all()
-        
-        total_value = sum(inv.current_value for inv in investments)
-        total_cost_basis = sum(inv.cost_basis for inv in investments)
+        # Aggregate and derive everything in SQL (NUMERIC arithmetic) and
+        # return the final strings straight from the single result row
+        total_value = func.coalesce(func.sum(Investment.current_value), 0)
+        total_cost_basis = func.coalesce(func.sum(Investment.cost_basis), 0)
         total_gain_loss = total_value - total_cost_basis
-        
-        # Calculate return percentage, handling division by zero
-        return_percentage = (
-            (total_gain_loss / total_cost_basis * Decimal('100'))
-            if total_cost_basis > Decimal('0')
-            else Decimal('0')
+        return_percentage = case(
+            (total_cost_basis > 0, func.round(total_gain_loss * 100 / total_cost_basis, 2)),
+            else_=0
         )
         
-        return {
-            "total_value": str(total_value),
-            "total_cost_basis": str(total_cost_basis),
-            "total_gain_loss": str(total_gain_loss),
-            "return_percentage": str(return_percentage)
-        }
\ No newline at end of file
+        row = self.db.execute(
+            select(
+                cast(total_value, String).label("total_value"),
+                cast(total_cost_basis, String).label("total_cost_basis"),
+                cast(total_gain_loss, String).label("total_gain_loss"),
+                cast(return_percentage, String).label("return_percentage")
+            ).where(
+                Investment.account_id == account_id,
+                Investment.is_active == True
+            )
+        ).mappings().one()
+        
+        return dict(row)
@@ -7,22 +7,34 @@ Human Tasks:
 3. Configure VAPID keys for Web Push notifications
 4. Set up Redis instance for notification queuing
 5. Configure AWS credentials for cloud services
+6. Migrate legacy device_tokens:{user_id}:{platform} sets into the per-user
+   device_tokens:{user_id} hashes, then drop the legacy read in
+   _get_user_devices_bulk
 """
 
 # Library versions:
 # aioapns: ^2.1.0
-# firebase-admin: ^5.0.0
+# httpx[http2]: ^0.23.0
+# google-auth: ^2.6.0
 # pywebpush: ^1.14.0
+# py-vapid: ^1.8.2
 # aioredis: ^2.0.0
+# orjson: ^3.8.0
 
 import asyncio
-import json
-from typing import Dict, List, Any, Optional
+import random
+import time
+from typing import Dict, FrozenSet, List, Any, Optional, Set, Tuple
+from urllib.parse import urlparse
 
 import aioapns
-import firebase_admin
-from firebase_admin import credentials, messaging
-from pywebpush import webpush, WebPushException
+from aioapns import NotificationRequest
+import httpx
+import orjson
+from google.auth.transport.requests import Request as GoogleAuthRequest
+from google.oauth2 import service_account
+from py_vapid import Vapid
+from pywebpush import WebPusher
 import aioredis
 
 from app.core.config import Settings, get_aws_settings
@@ -43,7 +55,81 @@ PLATFORM_TYPES: Dict[str, str] = {
     'WEB': 'web'
 }
 
+# Hashed membership sets for input validation on the hot paths
+VALID_NOTIFICATION_TYPES: FrozenSet[str] = frozenset(NOTIFICATION_TYPES.values())
+VALID_PLATFORMS: FrozenSet[str] = frozenset(PLATFORM_TYPES.values())
+
 MAX_RETRIES: int = 3
+MAX_BACKOFF_SECONDS: int = 30
+
+# FCM HTTP v1 API; sends are one message per token, issued concurrently in
+# chunks so a large audience doesn't open unbounded streams at once
+FCM_SEND_URL: str = 'https://fcm.googleapis.com/v1/projects/{project_id}/messages:send'
+FCM_SCOPE: str = 'https://www.googleapis.com/auth/firebase.messaging'
+FCM_BATCH_SIZE: int = 500
+PUSH_TIMEOUT_SECONDS: float = 10.0
+
+# VAPID JWTs are signed once per push service origin and reused until close to expiry
+VAPID_TOKEN_TTL_SECONDS: int = 12 * 60 * 60
+VAPID_REFRESH_MARGIN_SECONDS: int = 5 * 60
+
+# Upper bound on in-flight APNS/Web Push sends, kept under APNS HTTP/2 stream limits
+MAX_CONCURRENT_SENDS: int = 256
+
+# Device tokens live in one hash per user (platform -> JSON token list) so a
+# single HGETALL returns every platform. The script appends a token only if
+# it is absent, atomically on the Redis side.
+DEVICE_TOKENS_KEY: str = 'device_tokens:{user_id}'
+# Earlier layout, one set per (user, platform). Devices registered under it
+# are still read, in the same pipeline, until those sets are migrated
+LEGACY_DEVICE_TOKENS_KEY: str = 'device_tokens:{user_id}:{platform}'
+ADD_DEVICE_TOKEN_SCRIPT: str = """
+local raw = redis.call('HGET', KEYS[1], ARGV[1])
+local tokens = {}
+if raw then
+    tokens = cjson.decode(raw)
+    for _, token in ipairs(tokens) do
+        if token == ARGV[2] then
+            return 0
+        end
+    end
+end
+table.insert(tokens, ARGV[2])
+redis.call('HSET', KEYS[1], ARGV[1], cjson.encode(tokens))
+return 1
+"""
+# Drops the tokens in ARGV[2..] from one platform's list, removing the field
+# once it is empty; returns how many were removed
+REMOVE_DEVICE_TOKENS_SCRIPT: str = """
+local raw = redis.call('HGET', KEYS[1], ARGV[1])
+if not raw then
+    return 0
+end
+local gone = {}
+for i = 2, #ARGV do
+    gone[ARGV[i]] = true
+end
+local tokens = cjson.decode(raw)
+local kept = {}
+for _, token in ipairs(tokens) do
+    if not gone[token] then
+        table.insert(kept, token)
+    end
+end
+if #kept == 0 then
+    redis.call('HDEL', KEYS[1], ARGV[1])
+else
+    redis.call('HSET', KEYS[1], ARGV[1], cjson.encode(kept))
+end
+return #tokens - #kept
+"""
+
+# Provider responses meaning a token will never be delivered to again. Such
+# tokens are removed from the owner's devices rather than kept and re-sent
+FCM_UNREGISTERED_STATUS: int = 404
+APNS_UNREGISTERED_STATUS: int = 410
+APNS_BAD_TOKEN_REASON: str = 'BadDeviceToken'
+WEB_PUSH_GONE_STATUSES: FrozenSet[int] = frozenset({404, 410})
 
 def format_notification(platform: str, notification_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -51,15 +137,15 @@ def format_notification(platform: str, notification_type: str, payload: Dict[str
     
     Requirement: Push Notification Integration - Platform-specific formatting
     """
-    if platform not in PLATFORM_TYPES.values():
+    if platform not in VALID_PLATFORMS:
         raise ValueError(f"Invalid platform type: {platform}")
     
-    if notification_type not in NOTIFICATION_TYPES.values():
+    if notification_type not in VALID_NOTIFICATION_TYPES:
         raise ValueError(f"Invalid notification type: {notification_type}")
     
     formatted_payload = {
         'type': notification_type,
-        'timestamp': asyncio.get_event_loop().time()
+        'timestamp': time.time()
     }
     
     if platform == PLATFORM_TYPES['IOS']:
@@ -112,6 +198,14 @@ def format_notification(platform: str, notification_type: str, payload: Dict[str
     
     return formatted_payload
 
+def retry_delay(retry_count: int) -> float:
+    """Exponential backoff with jitter so correlated provider outages don't cause herd retries."""
+    return min(2 ** retry_count, MAX_BACKOFF_SECONDS) + random.random()
+
+def is_transient_status(status_code: int) -> bool:
+    """Whether a push provider HTTP status is worth retrying (throttling or server error)."""
+    return status_code == 429 or status_code >= 500
+
 class NotificationService:
     """
     Manages cross-platform notification delivery and preferences.
@@ -131,6 +225,11 @@ class NotificationService:
             encoding='utf-8',
             decode_responses=True
         )
+        self._add_device_token = self._redis.register_script(ADD_DEVICE_TOKEN_SCRIPT)
+        self._remove_device_tokens_script = self._redis.register_script(REMOVE_DEVICE_TOKENS_SCRIPT)
+        
+        # Strong references to fire-and-forget sends so they aren't garbage collected mid-flight
+        self._background_tasks: Set[asyncio.Task] = set()
         
         # Initialize APNS client
         self._apns_client = aioapns.APNs(
@@ -141,17 +240,20 @@ class NotificationService:
             use_sandbox=settings.ENVIRONMENT != 'production'
         )
         
-        # Initialize Firebase client
-        cred = credentials.Certificate(aws_settings['fcm_credentials_path'])
-        self._fcm_client = firebase_admin.initialize_app(cred)
+        # Initialize FCM HTTP v1 client; the OAuth token is cached on the
+        # credentials object and only refreshed once it expires
+        self._fcm_credentials = service_account.Credentials.from_service_account_file(
+            aws_settings['fcm_credentials_path'],
+            scopes=[FCM_SCOPE]
+        )
+        self._fcm_url = FCM_SEND_URL.format(project_id=self._fcm_credentials.project_id)
+        # Shared by FCM and Web Push; keeps TLS connections alive per origin
+        self._http_client = httpx.AsyncClient(http2=True, timeout=PUSH_TIMEOUT_SECONDS)
         
         # Initialize Web Push client
-        self._web_push_client = {
-            'vapid_private_key': aws_settings['vapid_private_key'],
-            'vapid_claims': {
-                'sub': f"mailto:{aws_settings['vapid_contact_email']}"
-            }
-        }
+        self._vapid = Vapid.from_string(private_key=aws_settings['vapid_private_key'])
+        self._vapid_claims = {'sub': f"mailto:{aws_settings['vapid_contact_email']}"}
+        self._vapid_headers: Dict[str, Tuple[int, Dict[str, str]]] = {}
     
     async def send_notification(
         self,
@@ -165,7 +267,7 @@ class NotificationService:
         
         Requirement: Real-time Updates - Event-driven notification delivery
         """
-        if notification_type not in NOTIFICATION_TYPES.values():
+        if notification_type not in VALID_NOTIFICATION_TYPES:
             raise ValueError(f"Invalid notification type: {notification_type}")
         
         delivery_status = {}
@@ -184,44 +286,15 @@ class NotificationService:
                 if platforms:
                     device_tokens = {k: v for k, v in device_tokens.items() if k in platforms}
                 
-                # Send to each platform
+                # Send to each platform; transient per-token failures are
+                # retried inside _deliver, and platforms already attempted are
+                # not re-sent if a later step forces another attempt
                 for platform, tokens in device_tokens.items():
+                    if platform in delivery_status:
+                        continue
                     formatted_payload = format_notification(platform, notification_type, payload)
-                    
-                    if platform == PLATFORM_TYPES['IOS']:
-                        for token in tokens:
-                            try:
-                                await self._apns_client.send_notification(token, formatted_payload)
-                                delivery_status[platform] = True
-                            except Exception as e:
-                                self._logger.error(f"APNS delivery failed: {str(e)}")
-                                delivery_status[platform] = False
-                    
-                    elif platform == PLATFORM_TYPES['ANDROID']:
-                        message = messaging.MulticastMessage(
-                            tokens=tokens,
-                            data=formatted_payload['data'],
-                            notification=messaging.Notification(
-                                title=formatted_payload['notification']['title'],
-                                body=formatted_payload['notification']['body']
-                            )
-                        )
-                        response = messaging.send_multicast(message)
-                        delivery_status[platform] = response.success_count > 0
-                    
-                    elif platform == PLATFORM_TYPES['WEB']:
-                        for subscription in tokens:
-                            try:
-                                webpush(
-                                    subscription_info=json.loads(subscription),
-                                    data=json.dumps(formatted_payload),
-                                    vapid_private_key=self._web_push_client['vapid_private_key'],
-                                    vapid_claims=self._web_push_client['vapid_claims']
-                                )
-                                delivery_status[platform] = True
-                            except WebPushException as e:
-                                self._logger.error(f"Web Push delivery failed: {str(e)}")
-                                delivery_status[platform] = False
+                    results = await self._deliver(platform, tokens, formatted_payload, [user_id] * len(tokens))
+                    delivery_status[platform] = any(results)
                 
                 # Publish notification event
                 await self._event_manager.publish_event(
@@ -239,7 +312,7 @@ class NotificationService:
                 self._logger.error(f"Notification delivery attempt {retry_count + 1} failed: {str(e)}")
                 retry_count += 1
                 if retry_count < MAX_RETRIES:
-                    await asyncio.sleep(1 * retry_count)  # Exponential backoff
+                    await asyncio.sleep(retry_delay(retry_count))
         
         return delivery_status
     
@@ -254,7 +327,7 @@ class NotificationService:
         
         Requirement: Alert Management - Bulk notification delivery
         """
-        if notification_type not in NOTIFICATION_TYPES.values():
+        if notification_type not in VALID_NOTIFICATION_TYPES:
             raise ValueError(f"Invalid notification type: {notification_type}")
         
         delivery_results = {}
@@ -266,22 +339,28 @@ class NotificationService:
             PLATFORM_TYPES['WEB']: []
         }
         
-        for user_id in user_ids:
-            devices = await self._get_user_devices(user_id)
+        # One pipelined round-trip for every user's device tokens; the result
+        # is the request-scoped cache shared by all platform senders, so
+        # duplicate user ids are fetched (and notified) only once
+        user_devices = await self._get_user_devices_bulk(list(dict.fromkeys(user_ids)))
+        for user_id, devices in user_devices.items():
             for platform, tokens in devices.items():
                 if tokens:
                     platform_groups[platform].append(user_id)
         
         # Send notifications in parallel for each platform
+        task_platforms = []
         tasks = []
         for platform, platform_users in platform_groups.items():
             if platform_users:
                 formatted_payload = format_notification(platform, notification_type, payload)
+                task_platforms.append(platform)
                 tasks.append(
                     self._send_platform_bulk_notification(
                         platform,
                         platform_users,
-                        formatted_payload
+                        formatted_payload,
+                        user_devices
                     )
                 )
         
@@ -289,7 +368,7 @@ class NotificationService:
         platform_results = await asyncio.gather(*tasks, return_exceptions=True)
         
         # Combine results
-        for platform, results in zip(platform_groups.keys(), platform_results):
+        for platform, results in zip(task_platforms, platform_results):
             if isinstance(results, Exception):
                 self._logger.error(f"Bulk notification failed for {platform}: {str(results)}")
                 continue
@@ -313,17 +392,17 @@ class NotificationService:
         
         Requirement: Push Notification Integration - Device registration
         """
-        if platform not in PLATFORM_TYPES.values():
+        if platform not in VALID_PLATFORMS:
             raise ValueError(f"Invalid platform type: {platform}")
         
         try:
             # Store device token in Redis
-            key = f"device_tokens:{user_id}:{platform}"
-            tokens = await self._redis.smembers(key) or set()
+            added = await self._add_device_token(
+                keys=[DEVICE_TOKENS_KEY.format(user_id=user_id)],
+                args=[platform, device_token]
+            )
             
-            if device_token not in tokens:
-                await self._redis.sadd(key, device_token)
-                
+            if added:
                 # Log device registration
                 self._logger.info(
                     "Device registered",
@@ -333,18 +412,10 @@ class NotificationService:
                     }
                 )
                 
-                # Test device registration
-                test_payload = {
-                    'title': 'Registration Successful',
-                    'message': 'You will now receive notifications',
-                    'data': {'type': 'registration'}
-                }
-                await self.send_notification(
-                    user_id,
-                    NOTIFICATION_TYPES['SECURITY_ALERT'],
-                    test_payload,
-                    [platform]
-                )
+                # Test only the new device, off the registration latency path
+                task = asyncio.create_task(self._send_single_device_test(user_id, platform, device_token))
+                self._background_tasks.add(task)
+                task.add_done_callback(self._background_tasks.discard)
                 
                 return True
             
@@ -362,7 +433,7 @@ class NotificationService:
         """
         try:
             # Validate preference settings
-            invalid_types = set(preferences.keys()) - set(NOTIFICATION_TYPES.values())
+            invalid_types = preferences.keys() - VALID_NOTIFICATION_TYPES
             if invalid_types:
                 raise ValueError(f"Invalid notification types: {invalid_types}")
             
@@ -385,78 +456,289 @@ class NotificationService:
             self._logger.error(f"Preference update failed: {str(e)}")
             return False
     
+    async def _send_single_device_test(self, user_id: str, platform: str, device_token: str) -> None:
+        """Send the registration confirmation to one newly registered device."""
+        test_payload = {
+            'title': 'Registration Successful',
+            'message': 'You will now receive notifications',
+            'data': {'type': 'registration'}
+        }
+        try:
+            formatted_payload = format_notification(platform, NOTIFICATION_TYPES['SECURITY_ALERT'], test_payload)
+            await self._deliver(platform, [device_token], formatted_payload, [user_id])
+        except Exception as e:
+            self._logger.error(f"Registration test notification failed: {str(e)}")
+    
     async def _get_user_devices(self, user_id: str) -> Dict[str, List[str]]:
         """Get user's registered devices for each platform."""
-        devices = {}
-        for platform in PLATFORM_TYPES.values():
-            key = f"device_tokens:{user_id}:{platform}"
-            tokens = await self._redis.smembers(key)
-            if tokens:
-                devices[platform] = list(tokens)
+        return (await self._get_user_devices_bulk([user_id]))[user_id]
+    
+    async def _get_user_devices_bulk(self, user_ids: List[str]) -> Dict[str, Dict[str, List[str]]]:
+        """Get registered devices for many users in a single pipelined Redis round-trip."""
+        platforms = list(PLATFORM_TYPES.values())
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id in user_ids:
+                pipe.hgetall(DEVICE_TOKENS_KEY.format(user_id=user_id))
+                for platform in platforms:
+                    pipe.smembers(LEGACY_DEVICE_TOKENS_KEY.format(user_id=user_id, platform=platform))
+            replies = await pipe.execute()
+        
+        # Each user's replies are one HGETALL followed by one SMEMBERS per platform
+        stride = 1 + len(platforms)
+        devices: Dict[str, Dict[str, List[str]]] = {}
+        for index, user_id in enumerate(user_ids):
+            token_hash = replies[index * stride]
+            legacy_sets = replies[index * stride + 1:(index + 1) * stride]
+            user_devices = {}
+            for platform, encoded_tokens in token_hash.items():
+                tokens = orjson.loads(encoded_tokens)
+                if tokens:
+                    user_devices[platform] = tokens
+            for platform, legacy_tokens in zip(platforms, legacy_sets):
+                if legacy_tokens:
+                    tokens = user_devices.setdefault(platform, [])
+                    tokens.extend(token for token in sorted(legacy_tokens) if token not in tokens)
+            devices[user_id] = user_devices
         return devices
     
+    async def _remove_device_tokens(self, platform: str, tokens_by_user: Dict[str, List[str]]) -> None:
+        """Forget tokens a provider reported as unregistered, in one pipelined round-trip."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for user_id, tokens in tokens_by_user.items():
+                await self._remove_device_tokens_script(
+                    keys=[DEVICE_TOKENS_KEY.format(user_id=user_id)],
+                    args=[platform, *tokens],
+                    client=pipe
+                )
+                pipe.srem(LEGACY_DEVICE_TOKENS_KEY.format(user_id=user_id, platform=platform), *tokens)
+            await pipe.execute()
+        
+        self._logger.info(
+            "Unregistered devices removed",
+            extra={'platform': platform, 'user_ids': list(tokens_by_user)}
+        )
+    
+    async def close(self) -> None:
+        """Close the pooled FCM and Web Push HTTP/2 connections."""
+        await self._http_client.aclose()
+    
+    async def _get_fcm_access_token(self) -> str:
+        """Return the cached FCM OAuth token, refreshing it off the event loop when expired."""
+        if not self._fcm_credentials.valid:
+            await asyncio.to_thread(self._fcm_credentials.refresh, GoogleAuthRequest())
+        return self._fcm_credentials.token
+    
+    async def _deliver(
+        self,
+        platform: str,
+        tokens: List[str],
+        payload: Dict[str, Any],
+        owners: List[str]
+    ) -> List[bool]:
+        """
+        Send to every token on a platform, retrying only tokens whose failure was transient.
+        
+        owners holds the user ID of each token; tokens the provider reports
+        as unregistered are removed from that user's devices.
+        
+        Requirement: Push Notification Integration - Reliable delivery
+        """
+        outcomes: List[Optional[bool]] = [None] * len(tokens)
+        pending = list(range(len(tokens)))
+        unregistered: Set[str] = set()
+        
+        for attempt in range(MAX_RETRIES):
+            if attempt:
+                await asyncio.sleep(retry_delay(attempt))
+            pending_tokens = [tokens[index] for index in pending]
+            if platform == PLATFORM_TYPES['ANDROID']:
+                sent = await self._send_fcm_multicast(pending_tokens, payload, unregistered)
+            else:
+                sent = await self._send_concurrently(platform, pending_tokens, payload, unregistered)
+            for index, outcome in zip(pending, sent):
+                outcomes[index] = outcome
+            pending = [index for index in pending if outcomes[index] is None]
+            if not pending:
+                break
+        
+        if unregistered:
+            tokens_by_user: Dict[str, List[str]] = {}
+            for token, owner in zip(tokens, owners):
+                if token in unregistered:
+                    tokens_by_user.setdefault(owner, []).append(token)
+            try:
+                await self._remove_device_tokens(platform, tokens_by_user)
+            except Exception as e:
+                self._logger.error(f"Removing unregistered devices failed: {str(e)}")
+        
+        return [bool(outcome) for outcome in outcomes]
+    
+    async def _send_fcm_multicast(
+        self,
+        tokens: List[str],
+        payload: Dict[str, Any],
+        unregistered: Set[str]
+    ) -> List[Optional[bool]]:
+        """
+        Send one FCM v1 message per token over the shared HTTP/2 client.
+        Each outcome is True/False, or None when the failure is transient;
+        tokens FCM reports as UNREGISTERED are added to unregistered.
+        
+        Requirement: Push Notification Integration - Non-blocking FCM delivery
+        """
+        headers = {
+            'Authorization': f"Bearer {await self._get_fcm_access_token()}",
+            'Content-Type': 'application/json'
+        }
+        notification = {
+            'title': payload['notification']['title'],
+            'body': payload['notification']['body']
+        }
+        # FCM v1 only accepts string values in the data map
+        data = {key: str(value) for key, value in payload['data'].items()}
+        
+        results: List[Optional[bool]] = []
+        for start in range(0, len(tokens), FCM_BATCH_SIZE):
+            batch = tokens[start:start + FCM_BATCH_SIZE]
+            responses = await asyncio.gather(
+                *(
+                    self._http_client.post(
+                        self._fcm_url,
+                        content=orjson.dumps({'message': {'token': token, 'notification': notification, 'data': data}}),
+                        headers=headers
+                    )
+                    for token in batch
+                ),
+                return_exceptions=True
+            )
+            for token, response in zip(batch, responses):
+                if isinstance(response, Exception):
+                    self._logger.error(f"FCM delivery failed: {str(response)}")
+                    results.append(None if isinstance(response, httpx.TransportError) else False)
+                elif response.status_code != 200:
+                    self._logger.error(f"FCM delivery failed: {response.status_code} {response.text}")
+                    if response.status_code == FCM_UNREGISTERED_STATUS:
+                        unregistered.add(token)
+                    results.append(None if is_transient_status(response.status_code) else False)
+                else:
+                    results.append(True)
+        return results
+    
     async def _send_platform_bulk_notification(
         self,
         platform: str,
         user_ids: List[str],
-        payload: Dict[str, Any]
+        payload: Dict[str, Any],
+        user_devices: Dict[str, Dict[str, List[str]]]
     ) -> Dict[str, Dict[str, bool]]:
-        """Send bulk notifications for a specific platform."""
+        """Send bulk notifications for a specific platform using pre-fetched device tokens."""
         results = {}
         
+        all_tokens = []
+        token_owners = []
+        for user_id in user_ids:
+            for token in user_devices[user_id].get(platform, []):
+                all_tokens.append(token)
+                token_owners.append(user_id)
+        
+        if not all_tokens:
+            return results
+        
+        sent = await self._deliver(platform, all_tokens, payload, token_owners)
+        
+        # A user counts as delivered if any of their devices accepted the push
+        for user_id, success in zip(token_owners, sent):
+            previous = results.get(user_id, {}).get(platform, False)
+            results[user_id] = {platform: previous or success}
+        
+        return results
+    
+    async def _send_concurrently(
+        self,
+        platform: str,
+        tokens: List[str],
+        payload: Dict[str, Any],
+        unregistered: Set[str]
+    ) -> List[Optional[bool]]:
+        """
+        Send APNS or Web Push messages to all tokens concurrently, bounded by MAX_CONCURRENT_SENDS.
+        Each outcome is True/False, or None when the failure is transient;
+        tokens reported as gone are added to unregistered.
+        
+        Requirement: Push Notification Integration - Parallel delivery
+        """
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_SENDS)
         if platform == PLATFORM_TYPES['IOS']:
-            for user_id in user_ids:
-                devices = await self._get_user_devices(user_id)
-                if platform in devices:
-                    success = False
-                    for token in devices[platform]:
-                        try:
-                            await self._apns_client.send_notification(token, payload)
-                            success = True
-                        except Exception as e:
-                            self._logger.error(f"APNS bulk delivery failed for {user_id}: {str(e)}")
-                    results[user_id] = {platform: success}
-        
-        elif platform == PLATFORM_TYPES['ANDROID']:
-            all_tokens = []
-            token_to_user = {}
-            for user_id in user_ids:
-                devices = await self._get_user_devices(user_id)
-                if platform in devices:
-                    for token in devices[platform]:
-                        all_tokens.append(token)
-                        token_to_user[token] = user_id
-            
-            if all_tokens:
-                message = messaging.MulticastMessage(
-                    tokens=all_tokens,
-                    data=payload['data'],
-                    notification=messaging.Notification(
-                        title=payload['notification']['title'],
-                        body=payload['notification']['body']
-                    )
-                )
-                response = messaging.send_multicast(message)
-                for idx, result in enumerate(response.responses):
-                    user_id = token_to_user[all_tokens[idx]]
-                    results[user_id] = {platform: result.success}
+            send_one, message = self._send_apns_one, payload
+        else:
+            # Serialize once for every subscription instead of once per recipient
+            send_one, message = self._send_webpush_one, orjson.dumps(payload, default=str)
         
-        elif platform == PLATFORM_TYPES['WEB']:
-            for user_id in user_ids:
-                devices = await self._get_user_devices(user_id)
-                if platform in devices:
-                    success = False
-                    for subscription in devices[platform]:
-                        try:
-                            webpush(
-                                subscription_info=json.loads(subscription),
-                                data=json.dumps(payload),
-                                vapid_private_key=self._web_push_client['vapid_private_key'],
-                                vapid_claims=self._web_push_client['vapid_claims']
-                            )
-                            success = True
-                        except WebPushException as e:
-                            self._logger.error(f"Web Push bulk delivery failed for {user_id}: {str(e)}")
-                    results[user_id] = {platform: success}
-        
-        return results
\ No newline at end of file
+        async def bounded_send(token: str) -> Optional[bool]:
+            async with semaphore:
+                return await send_one(token, message, unregistered)
+        
+        return list(await asyncio.gather(*(bounded_send(token) for token in tokens)))
+    
+    async def _send_apns_one(self, token: str, payload: Dict[str, Any], unregistered: Set[str]) -> Optional[bool]:
+        """Send a single APNS notification, returning whether it was accepted (None if retryable)."""
+        try:
+            # Concurrent calls share the client's HTTP/2 connections as multiplexed streams
+            result = await self._apns_client.send_notification(
+                NotificationRequest(device_token=token, message=payload)
+            )
+            if result.is_successful:
+                return True
+            self._logger.error(f"APNS delivery rejected: {result.status} {result.description}")
+            status = int(result.status)
+            if status == APNS_UNREGISTERED_STATUS or result.description == APNS_BAD_TOKEN_REASON:
+                unregistered.add(token)
+            return None if is_transient_status(status) else False
+        except Exception as e:
+            # aioapns surfaces connection-level problems as exceptions
+            self._logger.error(f"APNS delivery failed: {str(e)}")
+            return None
+    
+    def _get_vapid_headers(self, audience: str) -> Dict[str, str]:
+        """Return cached VAPID authorization headers for a push service origin, re-signing near expiry."""
+        now = time.time()
+        cached = self._vapid_headers.get(audience)
+        if cached and cached[0] - VAPID_REFRESH_MARGIN_SECONDS > now:
+            return cached[1]
+        
+        expires_at = int(now) + VAPID_TOKEN_TTL_SECONDS
+        headers = self._vapid.sign({**self._vapid_claims, 'aud': audience, 'exp': expires_at})
+        self._vapid_headers[audience] = (expires_at, headers)
+        return headers
+    
+    async def _send_webpush_one(self, subscription: str, body: bytes, unregistered: Set[str]) -> Optional[bool]:
+        """
+        Send a single Web Push message over the shared async HTTP client.
+        
+        Requirement: Push Notification Integration - Non-blocking Web Push delivery
+        """
+        try:
+            subscription_info = orjson.loads(subscription)
+            endpoint = subscription_info['endpoint']
+            endpoint_url = urlparse(endpoint)
+            
+            # Payload encryption is local CPU work; only the POST touches the network
+            encoded = WebPusher(subscription_info).encode(body, content_encoding='aes128gcm')
+            headers = {
+                **self._get_vapid_headers(f"{endpoint_url.scheme}://{endpoint_url.netloc}"),
+                'Content-Encoding': 'aes128gcm',
+                'TTL': '0'
+            }
+            response = await self._http_client.post(endpoint, content=encoded['body'], headers=headers)
+            if response.status_code >= 300:
+                self._logger.error(f"Web Push delivery failed: {response.status_code} {response.text}")
+                if response.status_code in WEB_PUSH_GONE_STATUSES:
+                    unregistered.add(subscription)
+                return None if is_transient_status(response.status_code) else False
+            return True
+        except httpx.TransportError as e:
+            self._logger.error(f"Web Push delivery failed: {str(e)}")
+            return None
+        except Exception as e:
+            self._logger.error(f"Web Push delivery failed: {str(e)}")
+            return False
\ No newline at end of file
@@ -17,22 +17,97 @@ from plaid.model.transactions_sync_request import TransactionsSyncRequest
 from plaid.model.accounts_get_request import AccountsGetRequest
 from plaid.model.transactions_get_request import TransactionsGetRequest
 
-# aiohttp: ^3.8.0
-import aiohttp
-from aiohttp import ClientSession
+# urllib3: installed with plaid-python (its HTTP transport)
+from urllib3.util import Retry
+
+# cachetools: ^5.2.0
+from cachetools import TTLCache
+
+# tenacity: ^8.1.0
+from tenacity import retry, retry_if_exception, stop_after_attempt, wait_exponential_jitter
 
 # pydantic: ^1.8.2
 from pydantic import ValidationError
 
+import asyncio
+import hashlib
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Optional, Tuple
-import json
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# orjson: ^3.8.0
+import orjson
 
 # Internal imports
 from ..core.config import Settings
 from ..core.encryption import EncryptionManager
 from ..core.logging import get_logger
 
+# Connection reuse for outbound HTTP: the Plaid SDK's urllib3 pool is sized so
+# concurrent calls keep their keep-alive connections instead of reconnecting
+PLAID_POOL_MAXSIZE: int = 32  # urllib3 connections held by the Plaid SDK
+# Threads running blocking SDK calls; matches the SDK pool so workers never wait on a connection
+PLAID_EXECUTOR_WORKERS: int = PLAID_POOL_MAXSIZE
+
+# Decrypted access tokens, keyed by a digest of the ciphertext, so a sync
+# cycle decrypts each item's token once rather than once per API call
+TOKEN_CACHE_MAXSIZE: int = 10_000
+TOKEN_CACHE_TTL: int = 900  # seconds
+
+# Raw accounts_get responses shared by get_accounts and get_balances, so a
+# sync followed by a dashboard read costs one Plaid round trip instead of two
+ACCOUNTS_CACHE_MAXSIZE: int = 5000
+ACCOUNTS_CACHE_TTL: int = 30  # seconds
+
+# urllib3 only retries failed connects; status retries are left to the
+# tenacity policy below so the two never stack their backoffs
+PLAID_CONNECT_RETRIES: int = 2
+
+# Retry policy for throttled (429) and transient (5xx) Plaid responses
+PLAID_MAX_ATTEMPTS: int = 8
+PLAID_RETRY_INITIAL_WAIT: float = 0.5  # seconds
+PLAID_RETRY_MAX_WAIT: float = 30  # seconds
+
+# Payload projections; attrgetter resolves every field in one C call per
+# record, and the keys/getters are built once at import
+TRANSACTION_KEYS: Tuple[str, ...] = (
+    'id', 'account_id', 'amount', 'date', 'name', 'merchant_name', 'category', 'pending'
+)
+_transaction_fields = attrgetter(
+    'transaction_id', 'account_id', 'amount', 'date', 'name', 'merchant_name', 'category', 'pending'
+)
+ACCOUNT_KEYS: Tuple[str, ...] = ('id', 'name', 'type', 'subtype', 'mask')
+_account_fields = attrgetter('account_id', 'name', 'type', 'subtype', 'mask')
+BALANCE_KEYS: Tuple[str, ...] = ('current', 'available', 'limit')
+_balance_fields = attrgetter('balances.current', 'balances.available', 'balances.limit')
+_account_id = attrgetter('account_id')
+
+LINK_CLIENT_NAME: str = "Mint Replica Lite"
+LINK_COUNTRY_CODES: Tuple[str, ...] = ("US",)
+LINK_LANGUAGE: str = "en"
+
+@lru_cache(maxsize=32)
+def _link_token_template(products: Tuple[str, ...]) -> Dict[str, Any]:
+    """
+    Shared, read-only LinkTokenCreateRequest fields for a product set; only
+    the user differs between onboarding calls.
+    """
+    return {
+        "client_name": LINK_CLIENT_NAME,
+        "products": list(products),
+        "country_codes": list(LINK_COUNTRY_CODES),
+        "language": LINK_LANGUAGE
+    }
+
+def _is_retryable_plaid_error(error: BaseException) -> bool:
+    """Whether a Plaid SDK error is a rate limit or transient server failure."""
+    if not isinstance(error, plaid.ApiException):
+        return False
+    status = error.status or 0
+    return status == 429 or status >= 500
+
 class PlaidService:
     """
     Service class for managing Plaid API integration with secure token handling.
@@ -51,9 +126,20 @@ class PlaidService:
                 'secret': settings.PLAID_SECRET,
             }
         )
+        # Size the SDK's urllib3 pool so concurrent calls reuse connections
+        # instead of opening (and discarding) extra ones
+        configuration.connection_pool_maxsize = PLAID_POOL_MAXSIZE
+        configuration.retries = Retry(
+            total=PLAID_CONNECT_RETRIES,
+            connect=PLAID_CONNECT_RETRIES,
+            read=0,
+            status=0,
+            redirect=0,
+            raise_on_status=False
+        )
         
         # Set up API client with secure configuration
-        self._client = plaid_api.PlaidApi(configuration)
+        self._client = plaid_api.PlaidApi(plaid.ApiClient(configuration))
         
         # Initialize encryption manager for secure token handling
         self._encryption_manager = encryption_manager
@@ -61,14 +147,85 @@ class PlaidService:
         # Set up logging
         self._logger = get_logger(__name__)
         
-        # Initialize async HTTP client for API calls
-        self._http_session = None
+        # Only touched from coroutines on the event loop thread, so no lock is needed
+        self._token_cache: TTLCache = TTLCache(maxsize=TOKEN_CACHE_MAXSIZE, ttl=TOKEN_CACHE_TTL)
+        # Holds in-flight futures too, so concurrent callers share one request
+        self._accounts_cache: TTLCache = TTLCache(maxsize=ACCOUNTS_CACHE_MAXSIZE, ttl=ACCOUNTS_CACHE_TTL)
+        
+        # The Plaid SDK is blocking (urllib3); its calls run here, off the event loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=PLAID_EXECUTOR_WORKERS,
+            thread_name_prefix='plaid'
+        )
+    
+    @staticmethod
+    def _token_key(access_token: str) -> bytes:
+        """Cache key for a stored access token; the ciphertext itself is never kept."""
+        return hashlib.blake2b(access_token.encode(), digest_size=16).digest()
+    
+    def _decrypt_token(self, access_token: str) -> str:
+        """Decrypt a stored access token, reusing the plaintext for TOKEN_CACHE_TTL seconds."""
+        key = self._token_key(access_token)
+        decrypted_token = self._token_cache.get(key)
+        if decrypted_token is None:
+            decrypted_token = self._encryption_manager.decrypt_field(
+                orjson.loads(access_token)
+            ).decode()
+            self._token_cache[key] = decrypted_token
+        return decrypted_token
     
-    async def _get_http_session(self) -> ClientSession:
-        """Get or create async HTTP session."""
-        if self._http_session is None or self._http_session.closed:
-            self._http_session = ClientSession()
-        return self._http_session
+    async def _call_api_once(self, method: Callable[..., Any], request: Any) -> Any:
+        """
+        Run a blocking Plaid SDK call in the service thread pool without
+        retrying its response; urllib3 still retries failed connects.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, method, request)
+    
+    @retry(
+        stop=stop_after_attempt(PLAID_MAX_ATTEMPTS),
+        wait=wait_exponential_jitter(initial=PLAID_RETRY_INITIAL_WAIT, max=PLAID_RETRY_MAX_WAIT),
+        retry=retry_if_exception(_is_retryable_plaid_error),
+        reraise=True
+    )
+    async def _call_api(self, method: Callable[..., Any], request: Any) -> Any:
+        """
+        Run a blocking Plaid SDK call in the service thread pool, retrying
+        429/5xx responses with exponential backoff and jitter.
+        """
+        return await self._call_api_once(method, request)
+    
+    async def _fetch_accounts(self, request: AccountsGetRequest) -> Tuple[Any, datetime]:
+        """Call accounts_get and record when its response was received."""
+        response = await self._call_api(self._client.accounts_get, request)
+        return response, datetime.utcnow()
+    
+    async def _accounts_raw(self, access_token: str) -> Tuple[Any, datetime]:
+        """
+        Return the accounts_get response for an item and the time it was
+        fetched, reusing both for ACCOUNTS_CACHE_TTL seconds. Concurrent
+        callers await the same request.
+        """
+        key = self._token_key(access_token)
+        future = self._accounts_cache.get(key)
+        if future is None:
+            request = AccountsGetRequest(access_token=self._decrypt_token(access_token))
+            future = asyncio.ensure_future(self._fetch_accounts(request))
+            self._accounts_cache[key] = future
+            
+            def _discard_failed(done: asyncio.Future) -> None:
+                if (done.cancelled() or done.exception() is not None) and self._accounts_cache.get(key) is done:
+                    del self._accounts_cache[key]
+            
+            future.add_done_callback(_discard_failed)
+        return await asyncio.shield(future)
+    
+    def invalidate_accounts(self, access_token: str) -> None:
+        """
+        Drop the cached accounts_get response for an item. SyncService
+        calls this once each item sync finishes.
+        """
+        self._accounts_cache.pop(self._token_key(access_token), None)
     
     async def create_link_token(self, user_id: str, products: List[str]) -> str:
         """
@@ -79,13 +236,10 @@ class PlaidService:
         try:
             request = LinkTokenCreateRequest(
                 user={"client_user_id": user_id},
-                client_name="Mint Replica Lite",
-                products=products,
-                country_codes=["US"],
-                language="en"
+                **_link_token_template(tuple(products))
             )
             
-            response = self._client.link_token_create(request)
+            response = await self._call_api(self._client.link_token_create, request)
             link_token = response.link_token
             
             self._logger.info(
@@ -109,8 +263,11 @@ class PlaidService:
         Requirement: Data Security - Secure token exchange and storage
         """
         try:
-            # Exchange public token for access token
-            exchange_response = self._client.item_public_token_exchange(
+            # Public tokens are single-use: if a 5xx hid a completed exchange,
+            # a retry would fail with INVALID_PUBLIC_TOKEN and lose the access
+            # token, so the response is never retried
+            exchange_response = await self._call_api_once(
+                self._client.item_public_token_exchange,
                 {"public_token": public_token}
             )
             
@@ -126,7 +283,7 @@ class PlaidService:
             )
             
             return {
-                "access_token": json.dumps(encrypted_token),
+                "access_token": orjson.dumps(encrypted_token).decode(),
                 "item_id": item_id
             }
             
@@ -144,28 +301,15 @@ class PlaidService:
         Requirement: Financial Account Aggregation - Account data retrieval
         """
         try:
-            # Decrypt access token
-            decrypted_token = self._encryption_manager.decrypt_field(
-                json.loads(access_token)
-            ).decode()
+            response, _ = await self._accounts_raw(access_token)
             
-            request = AccountsGetRequest(access_token=decrypted_token)
-            response = self._client.accounts_get(request)
-            
-            accounts = []
-            for account in response.accounts:
-                accounts.append({
-                    "id": account.account_id,
-                    "name": account.name,
-                    "type": account.type,
-                    "subtype": account.subtype,
-                    "mask": account.mask,
-                    "balances": {
-                        "current": account.balances.current,
-                        "available": account.balances.available,
-                        "limit": account.balances.limit
-                    }
-                })
+            accounts = [
+                {
+                    **dict(zip(ACCOUNT_KEYS, _account_fields(account))),
+                    "balances": dict(zip(BALANCE_KEYS, _balance_fields(account)))
+                }
+                for account in response.accounts
+            ]
             
             self._logger.info(
                 "Retrieved account information",
@@ -193,10 +337,7 @@ class PlaidService:
         Requirement: Transaction Management - Automated transaction import
         """
         try:
-            # Decrypt access token
-            decrypted_token = self._encryption_manager.decrypt_field(
-                json.loads(access_token)
-            ).decode()
+            decrypted_token = self._decrypt_token(access_token)
             
             request = TransactionsGetRequest(
                 access_token=decrypted_token,
@@ -204,20 +345,12 @@ class PlaidService:
                 end_date=end_date.date()
             )
             
-            response = self._client.transactions_get(request)
+            response = await self._call_api(self._client.transactions_get, request)
             
-            transactions = []
-            for transaction in response.transactions:
-                transactions.append({
-                    "id": transaction.transaction_id,
-                    "account_id": transaction.account_id,
-                    "amount": transaction.amount,
-                    "date": transaction.date,
-                    "name": transaction.name,
-                    "merchant_name": transaction.merchant_name,
-                    "category": transaction.category,
-                    "pending": transaction.pending
-                })
+            transactions = [
+                dict(zip(TRANSACTION_KEYS, _transaction_fields(transaction)))
+                for transaction in response.transactions
+            ]
             
             self._logger.info(
                 "Retrieved transactions",
@@ -245,33 +378,35 @@ class PlaidService:
         """
         Sync new transactions using cursor-based pagination.
         
+        Requirement: Transaction Management - Real-time transaction syncing
+        """
+        transactions, next_cursor, _ = await self.sync_transactions_page(access_token, cursor)
+        return transactions, next_cursor
+    
+    async def sync_transactions_page(
+        self,
+        access_token: str,
+        cursor: Optional[str] = None
+    ) -> Tuple[List[Dict], str, bool]:
+        """
+        Fetch one /transactions/sync page, including whether more pages follow.
+        
         Requirement: Transaction Management - Real-time transaction syncing
         """
         try:
-            # Decrypt access token
-            decrypted_token = self._encryption_manager.decrypt_field(
-                json.loads(access_token)
-            ).decode()
+            decrypted_token = self._decrypt_token(access_token)
             
             request = TransactionsSyncRequest(
                 access_token=decrypted_token,
                 cursor=cursor
             )
             
-            response = self._client.transactions_sync(request)
+            response = await self._call_api(self._client.transactions_sync, request)
             
-            transactions = []
-            for transaction in response.added:
-                transactions.append({
-                    "id": transaction.transaction_id,
-                    "account_id": transaction.account_id,
-                    "amount": transaction.amount,
-                    "date": transaction.date,
-                    "name": transaction.name,
-                    "merchant_name": transaction.merchant_name,
-                    "category": transaction.category,
-                    "pending": transaction.pending
-                })
+            transactions = [
+                dict(zip(TRANSACTION_KEYS, _transaction_fields(transaction)))
+                for transaction in response.added
+            ]
             
             self._logger.info(
                 "Synced transactions",
@@ -282,7 +417,7 @@ class PlaidService:
                 }
             )
             
-            return transactions, response.next_cursor
+            return transactions, response.next_cursor, bool(response.has_more)
             
         except plaid.ApiException as e:
             self._logger.error(
@@ -298,23 +433,18 @@ class PlaidService:
         Requirement: Financial Account Aggregation - Real-time balance updates
         """
         try:
-            # Decrypt access token
-            decrypted_token = self._encryption_manager.decrypt_field(
-                json.loads(access_token)
-            ).decode()
-            
-            request = AccountsGetRequest(access_token=decrypted_token)
-            response = self._client.accounts_get(request)
+            response, fetched_at = await self._accounts_raw(access_token)
             
-            balances = []
-            for account in response.accounts:
-                balances.append({
-                    "account_id": account.account_id,
-                    "current": account.balances.current,
-                    "available": account.balances.available,
-                    "limit": account.balances.limit,
-                    "last_updated": datetime.utcnow().isoformat()
-                })
+            # A cached response reports when Plaid returned it, not now
+            last_updated = fetched_at.isoformat()
+            balances = [
+                {
+                    "account_id": _account_id(account),
+                    **dict(zip(BALANCE_KEYS, _balance_fields(account))),
+                    "last_updated": last_updated
+                }
+                for account in response.accounts
+            ]
             
             self._logger.info(
                 "Retrieved real-time balances",
@@ -332,5 +462,4 @@ class PlaidService:
     
     async def close(self):
         """Clean up resources."""
-        if self._http_session and not self._http_session.closed:
-            await self._http_session.close()
\ No newline at end of file
+        self._executor.shutdown(wait=False)
\ No newline at end of file
@@ -12,18 +12,65 @@ Human Tasks:
 # Library versions:
 # boto3: ^1.26.0
 # botocore: ^1.29.0
+# cachetools: ^5.2.0
 # typing: ^3.9.0
 
+import asyncio
+import io
+import threading
+import time
 from functools import lru_cache
-from typing import Dict, Optional
+from typing import BinaryIO, Dict, Optional, Tuple, Union
 
 import boto3
+from cachetools import TTLCache
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 
-from ..core.config import Settings
+from ..core.config import get_settings
 from ..core.logging import get_logger
 from ..core.errors import BaseAppException
 
+# Multipart transfer settings: objects are streamed in 8 MB parts with up to
+# 10 parts in flight, so memory use is bounded regardless of object size
+MULTIPART_THRESHOLD: int = 8 * 1024 * 1024
+MULTIPART_CHUNKSIZE: int = 8 * 1024 * 1024
+MAX_TRANSFER_CONCURRENCY: int = 10
+
+# Presigned URLs are reused while still comfortably valid: each entry lives
+# at most PRESIGNED_URL_CACHE_TTL seconds and never past its own expiry minus
+# PRESIGNED_URL_SAFETY_MARGIN
+PRESIGNED_URL_CACHE_SIZE: int = 10_000
+PRESIGNED_URL_CACHE_TTL: int = 300
+PRESIGNED_URL_SAFETY_MARGIN: int = 30
+
+# botocore's adaptive retry mode: exponential backoff with jitter on
+# throttling (SlowDown, Throttling, 429) and transient 5xx/timeout errors
+S3_MAX_ATTEMPTS: int = 8
+
+@lru_cache(maxsize=1)
+def _get_s3_client(
+    aws_access_key_id: Optional[str],
+    aws_secret_access_key: Optional[str],
+    region_name: Optional[str],
+    endpoint_url: Optional[str],
+    use_ssl: bool
+):
+    """
+    Shared boto3 S3 client for a given configuration. boto3 clients are
+    thread-safe, so every S3Service instance can reuse one.
+    """
+    return boto3.client(
+        's3',
+        aws_access_key_id=aws_access_key_id,
+        aws_secret_access_key=aws_secret_access_key,
+        region_name=region_name,
+        endpoint_url=endpoint_url,
+        use_ssl=use_ssl,
+        config=Config(retries={'max_attempts': S3_MAX_ATTEMPTS, 'mode': 'adaptive'})
+    )
+
 class S3StorageError(BaseAppException):
     """
     Custom exception class for S3 storage related errors.
@@ -49,48 +96,66 @@ class S3Service:
         """Initialize S3 service with AWS configuration and logging."""
         self._logger = get_logger(__name__)
         
-        # Get AWS settings
-        aws_settings = Settings().get_aws_settings()
+        # Get AWS settings from the cached application settings
+        aws_settings = get_settings().get_aws_settings()
         
-        # Initialize S3 client with AWS credentials
-        self._s3_client = boto3.client(
-            's3',
-            aws_access_key_id=aws_settings['aws_access_key_id'],
-            aws_secret_access_key=aws_settings['aws_secret_access_key'],
-            region_name=aws_settings['region_name'],
-            endpoint_url=aws_settings.get('endpoint_url'),
-            use_ssl=aws_settings['use_ssl']
+        # Reuse the S3 client built for these credentials
+        self._s3_client = _get_s3_client(
+            aws_settings['aws_access_key_id'],
+            aws_settings['aws_secret_access_key'],
+            aws_settings['region_name'],
+            aws_settings.get('endpoint_url'),
+            aws_settings['use_ssl']
         )
         
         self._bucket_name = aws_settings['s3_bucket']
         
+        self._transfer_config = TransferConfig(
+            multipart_threshold=MULTIPART_THRESHOLD,
+            multipart_chunksize=MULTIPART_CHUNKSIZE,
+            max_concurrency=MAX_TRANSFER_CONCURRENCY,
+            use_threads=True
+        )
+        
+        # (file_key, expiration) -> (url, monotonic reuse deadline)
+        self._url_cache: TTLCache = TTLCache(maxsize=PRESIGNED_URL_CACHE_SIZE, ttl=PRESIGNED_URL_CACHE_TTL)
+        self._url_cache_lock = threading.Lock()
+        
         if not self._bucket_name:
             raise S3StorageError(
                 message="S3 bucket name not configured",
                 details={"configuration": "S3_BUCKET_NAME environment variable is required"}
             )
 
-    def upload_file(self, file_data: bytes, file_key: str, content_type: str) -> str:
+    async def upload_file(self, file_data: Union[bytes, BinaryIO], file_key: str, content_type: str) -> str:
         """
-        Upload file to S3 bucket with server-side encryption.
+        Upload file to S3 bucket with server-side encryption, streaming it in
+        multipart chunks. Accepts a binary file object or raw bytes.
         
         Requirement: Data Security - File encryption for data at rest in S3 storage using AWS KMS
         """
+        if isinstance(file_data, (bytes, bytearray)):
+            file_data = io.BytesIO(file_data)
+            
         self._logger.bind({
             "action": "upload",
             "file_key": file_key,
-            "content_type": content_type,
-            "file_size": len(file_data)
+            "content_type": content_type
         }).info("Uploading file to S3")
 
         try:
-            # Upload with AES-256 server-side encryption
-            self._s3_client.put_object(
-                Bucket=self._bucket_name,
-                Key=file_key,
-                Body=file_data,
-                ContentType=content_type,
-                ServerSideEncryption='AES256'
+            # Upload with AES-256 server-side encryption; boto3 blocks, so the
+            # transfer runs in a worker thread
+            await asyncio.to_thread(
+                self._s3_client.upload_fileobj,
+                file_data,
+                self._bucket_name,
+                file_key,
+                ExtraArgs={
+                    'ContentType': content_type,
+                    'ServerSideEncryption': 'AES256'
+                },
+                Config=self._transfer_config
             )
             
             # Generate the file URL
@@ -114,9 +179,10 @@ class S3Service:
                 }
             )
 
-    def download_file(self, file_key: str) -> bytes:
+    async def download_file(self, file_key: str, file_obj: BinaryIO) -> None:
         """
-        Download file from S3 bucket with decryption.
+        Download file from S3 bucket with decryption, streaming it into the
+        given binary file object in multipart chunks.
         
         Requirement: Object Storage - Secure file downloads from S3
         """
@@ -126,23 +192,22 @@ class S3Service:
         }).info("Downloading file from S3")
 
         try:
-            response = self._s3_client.get_object(
-                Bucket=self._bucket_name,
-                Key=file_key
+            await asyncio.to_thread(
+                self._s3_client.download_fileobj,
+                self._bucket_name,
+                file_key,
+                file_obj,
+                Config=self._transfer_config
             )
             
-            file_data = response['Body'].read()
-            
             self._logger.bind({
-                "file_key": file_key,
-                "content_length": len(file_data)
+                "file_key": file_key
             }).info("File downloaded successfully")
             
-            return file_data
-            
         except ClientError as e:
             error_code = e.response['Error']['Code']
-            if error_code == 'NoSuchKey':
+            # download_fileobj probes with HEAD, which reports a missing key as 404
+            if error_code in ('NoSuchKey', '404'):
                 raise S3StorageError(
                     message="File not found",
                     details={
@@ -158,7 +223,7 @@ class S3Service:
                 }
             )
 
-    def delete_file(self, file_key: str) -> bool:
+    async def delete_file(self, file_key: str) -> bool:
         """
         Delete file from S3 bucket securely.
         
@@ -170,7 +235,8 @@ class S3Service:
         }).info("Deleting file from S3")
 
         try:
-            self._s3_client.delete_object(
+            await asyncio.to_thread(
+                self._s3_client.delete_object,
                 Bucket=self._bucket_name,
                 Key=file_key
             )
@@ -193,10 +259,18 @@ class S3Service:
 
     def generate_presigned_url(self, file_key: str, expiration: int) -> str:
         """
-        Generate secure presigned URL for temporary file access.
+        Generate secure presigned URL for temporary file access. Signing is
+        local, so this stays synchronous; recently signed URLs for the same
+        key and expiration are reused while they remain valid.
         
         Requirement: Data Security - Secure temporary file access
         """
+        cache_key: Tuple[str, int] = (file_key, expiration)
+        with self._url_cache_lock:
+            cached = self._url_cache.get(cache_key)
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+            
         self._logger.bind({
             "action": "generate_presigned_url",
             "file_key": file_key,
@@ -219,6 +293,14 @@ class S3Service:
                 "url": url
             }).info("Presigned URL generated successfully")
             
+            if expiration > PRESIGNED_URL_SAFETY_MARGIN:
+                reuse_until = time.monotonic() + min(
+                    expiration - PRESIGNED_URL_SAFETY_MARGIN,
+                    PRESIGNED_URL_CACHE_TTL
+                )
+                with self._url_cache_lock:
+                    self._url_cache[cache_key] = (url, reuse_until)
+            
             return url
             
         except ClientError as e:
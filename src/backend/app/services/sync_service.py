@@ -11,17 +11,45 @@ Human Tasks:
 
 # Built-in imports
 import asyncio
+import hashlib
 from datetime import datetime
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+
+# Third-party imports
+import orjson  # orjson: ^3.8.0
 
 # Internal imports
 from ..core.events import EventManager
 from ..core.cache import cache
+from ..core.logging import get_logger
 from .plaid_service import PlaidService
 
 # Global constants
 SYNC_CURSOR_PREFIX: str = 'sync_cursor:'
+BALANCE_FINGERPRINT_PREFIX: str = 'balances_fp:'
+SYNC_SCHEDULE_PREFIX: str = 'sync_schedule:'
+# Last completed cycle, kept apart from the schedule so each cycle writes a
+# timestamp rather than re-serializing the whole schedule and token list
+LAST_SYNC_PREFIX: str = 'sync_last:'
 DEFAULT_SYNC_INTERVAL: int = 60  # minutes
+MAX_CONCURRENT_SYNCS: int = 8  # concurrent Plaid items, kept under Plaid rate limits
+SYNC_CANCEL_TIMEOUT: int = 5  # seconds to wait for a cancelled sync task to unwind
+
+def balances_fingerprint(balances: List[Dict[str, Any]]) -> str:
+    """
+    Compact digest of a balance snapshot for cheap change detection.
+    
+    last_updated is stamped on every fetch, so it is excluded; otherwise
+    every sync would look like a change.
+    """
+    stable = [
+        {key: value for key, value in balance.items() if key != 'last_updated'}
+        for balance in balances
+    ]
+    return hashlib.blake2b(
+        orjson.dumps(stable, option=orjson.OPT_SORT_KEYS),
+        digest_size=16
+    ).hexdigest()
 
 class SyncService:
     """
@@ -36,31 +64,37 @@ class SyncService:
         """Initialize sync service with required dependencies."""
         self._plaid_service = plaid_service
         self._event_manager = event_manager
+        self._logger = get_logger(__name__)
         self._sync_cursors: Dict[str, str] = {}
         self._sync_tasks: Dict[str, asyncio.Task] = {}
+        # Created on first use so it binds to the running event loop
+        self._sync_semaphore: Optional[asyncio.Semaphore] = None
         
         # Load existing sync states from cache
         self._load_sync_states()
     
     def _load_sync_states(self) -> None:
         """Load existing sync cursors from cache."""
-        cursor_keys = cache.get(f"{SYNC_CURSOR_PREFIX}keys") or []
-        for key in cursor_keys:
-            cursor = cache.get(f"{SYNC_CURSOR_PREFIX}{key}")
-            if cursor:
-                self._sync_cursors[key] = cursor
+        cursor_keys = list(cache.smembers(f"{SYNC_CURSOR_PREFIX}keys"))
+        
+        # All cursors in one MGET instead of a GET per key
+        cursors = cache.mget([f"{SYNC_CURSOR_PREFIX}{key}" for key in cursor_keys])
+        self._sync_cursors = {
+            key: cursor for key, cursor in zip(cursor_keys, cursors) if cursor
+        }
     
     def _save_sync_cursor(self, user_id: str, cursor: str) -> None:
         """Save sync cursor to cache."""
         key = f"{user_id}"
         self._sync_cursors[key] = cursor
-        cache.set(f"{SYNC_CURSOR_PREFIX}{key}", cursor)
         
-        # Update cursor keys set
-        cursor_keys = cache.get(f"{SYNC_CURSOR_PREFIX}keys") or []
-        if key not in cursor_keys:
-            cursor_keys.append(key)
-            cache.set(f"{SYNC_CURSOR_PREFIX}keys", cursor_keys)
+        # Cursor and its entry in the keys set are written in one round trip
+        cache.set_and_index(
+            f"{SYNC_CURSOR_PREFIX}{key}",
+            cursor,
+            f"{SYNC_CURSOR_PREFIX}keys",
+            key
+        )
     
     async def sync_account_data(self, user_id: str, access_token: str) -> Dict[str, Any]:
         """
@@ -72,15 +106,15 @@ class SyncService:
             # Fetch latest account balances
             balances = await self._plaid_service.get_balances(access_token)
             
-            # Get cached balances
-            cache_key = f"balances:{user_id}"
-            cached_balances = cache.get(cache_key)
+            # Compare fingerprints; the full snapshot is only written on change
+            fingerprint = balances_fingerprint(balances)
+            fingerprint_key = f"{BALANCE_FINGERPRINT_PREFIX}{user_id}"
             
-            # Check for changes
-            changes_detected = False
-            if not cached_balances or balances != cached_balances:
-                changes_detected = True
-                cache.set(cache_key, balances)
+            changes_detected = cache.get(fingerprint_key) != fingerprint
+            if changes_detected:
+                cache.set(f"balances:{user_id}", balances)
+                # Stored JSON-encoded so cache.get decodes it back to the same str
+                cache.set(fingerprint_key, orjson.dumps(fingerprint))
                 
                 # Publish account update event
                 await self._event_manager.publish_event(
@@ -97,7 +131,10 @@ class SyncService:
             }
             
         except Exception as e:
-            print(f"Account sync error for user {user_id}: {str(e)}")
+            self._logger.error(
+                "Account sync error",
+                extra={"user_id": user_id, "phase": "account", "error": str(e)}
+            )
             raise
     
     async def sync_transactions(self, user_id: str, access_token: str) -> Dict[str, Any]:
@@ -139,9 +176,28 @@ class SyncService:
             }
             
         except Exception as e:
-            print(f"Transaction sync error for user {user_id}: {str(e)}")
+            self._logger.error(
+                "Transaction sync error",
+                extra={"user_id": user_id, "phase": "transactions", "error": str(e)}
+            )
             raise
     
+    async def _sync_one(self, user_id: str, access_token: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Sync balances and transactions for one access token concurrently."""
+        if self._sync_semaphore is None:
+            self._sync_semaphore = asyncio.Semaphore(MAX_CONCURRENT_SYNCS)
+        
+        async with self._sync_semaphore:
+            try:
+                return await asyncio.gather(
+                    self.sync_account_data(user_id, access_token),
+                    self.sync_transactions(user_id, access_token)
+                )
+            finally:
+                # The accounts_get response is only shared within this item
+                # sync; the next one must see fresh balances
+                self._plaid_service.invalidate_accounts(access_token)
+    
     async def schedule_sync(
         self,
         user_id: str,
@@ -165,34 +221,52 @@ class SyncService:
             schedule = {
                 'user_id': user_id,
                 'access_tokens': access_tokens,
-                'interval': interval_minutes,
-                'last_sync': None
+                'interval': interval_minutes
             }
             
-            # Store schedule in cache
-            cache.set(f"sync_schedule:{user_id}", schedule)
+            # Store schedule in cache; it only changes when rescheduled
+            cache.set(f"{SYNC_SCHEDULE_PREFIX}{user_id}", schedule)
+            last_sync_ttl = interval_minutes * 60 * 3
             
             # Start sync task
             async def sync_task():
                 while True:
                     try:
-                        for token in access_tokens:
-                            await self.sync_account_data(user_id, token)
-                            await self.sync_transactions(user_id, token)
+                        # Sync all linked items at once; one failing token
+                        # doesn't abort the others
+                        results = await asyncio.gather(
+                            *(self._sync_one(user_id, token) for token in access_tokens),
+                            return_exceptions=True
+                        )
+                        for result in results:
+                            if isinstance(result, Exception):
+                                self._logger.error(
+                                    "Item sync error",
+                                    extra={"user_id": user_id, "phase": "item", "error": str(result)}
+                                )
                         
-                        schedule['last_sync'] = datetime.utcnow().isoformat()
-                        cache.set(f"sync_schedule:{user_id}", schedule)
+                        cache.set(
+                            f"{LAST_SYNC_PREFIX}{user_id}",
+                            datetime.utcnow().isoformat(),
+                            ttl=last_sync_ttl
+                        )
                         
                         await asyncio.sleep(interval_minutes * 60)
                     except Exception as e:
-                        print(f"Periodic sync error for user {user_id}: {str(e)}")
+                        self._logger.error(
+                            "Periodic sync error",
+                            extra={"user_id": user_id, "phase": "periodic", "error": str(e)}
+                        )
                         await asyncio.sleep(60)  # Retry after 1 minute on error
             
             self._sync_tasks[user_id] = asyncio.create_task(sync_task())
             return True
             
         except Exception as e:
-            print(f"Schedule sync error for user {user_id}: {str(e)}")
+            self._logger.error(
+                "Schedule sync error",
+                extra={"user_id": user_id, "phase": "schedule", "error": str(e)}
+            )
             return False
     
     async def cancel_sync(self, user_id: str) -> bool:
@@ -202,16 +276,35 @@ class SyncService:
         Requirement: Real-time Synchronization - 1.1 System Overview/Backend Services
         """
         try:
-            # Cancel sync task if exists
-            if user_id in self._sync_tasks:
-                self._sync_tasks[user_id].cancel()
-                del self._sync_tasks[user_id]
+            # Cancel sync task if exists and wait for its in-flight item
+            # syncs to unwind, so they never overlap a rescheduled task
+            task = self._sync_tasks.pop(user_id, None)
+            if task is not None:
+                await self._cancel_tasks([task])
             
             # Remove schedule from cache
-            cache.delete(f"sync_schedule:{user_id}")
+            cache.delete(f"{SYNC_SCHEDULE_PREFIX}{user_id}")
+            cache.delete(f"{LAST_SYNC_PREFIX}{user_id}")
             
             return True
             
         except Exception as e:
-            print(f"Cancel sync error for user {user_id}: {str(e)}")
-            return False
\ No newline at end of file
+            self._logger.error(
+                "Cancel sync error",
+                extra={"user_id": user_id, "phase": "cancel", "error": str(e)}
+            )
+            return False
+    
+    async def _cancel_tasks(self, tasks: List[asyncio.Task]) -> None:
+        """Cancel sync tasks and wait up to SYNC_CANCEL_TIMEOUT seconds for them to finish."""
+        for task in tasks:
+            task.cancel()
+        # asyncio.wait neither raises the tasks' CancelledError nor swallows our own
+        await asyncio.wait(tasks, timeout=SYNC_CANCEL_TIMEOUT)
+    
+    async def close(self) -> None:
+        """Cancel all scheduled syncs, e.g. on application shutdown."""
+        tasks = list(self._sync_tasks.values())
+        self._sync_tasks.clear()
+        if tasks:
+            await self._cancel_tasks(tasks)
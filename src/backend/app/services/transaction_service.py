@@ -1,17 +1,24 @@
 # SQLAlchemy v1.4.0
-from sqlalchemy import and_, or_, desc
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, or_, desc, tuple_
+from sqlalchemy.orm import Session, selectinload
 
 # pydantic v1.8.2
 from pydantic import BaseModel, UUID4, validator
 from datetime import datetime
-from typing import List, Optional, Tuple, Dict
+from functools import lru_cache
+from typing import List, Optional, Tuple, Dict, Union
+import asyncio
+import base64
+import io
+import time
 import uuid
+import orjson  # orjson: ^3.8.0
 
 # Relative imports
-from ..models.transaction import Transaction
+from ..models.transaction import Transaction, TransactionView
 from ..services.plaid_service import PlaidService
 from ..core.cache import cache
+from ..utils.datetime import get_current_datetime
 
 # Human Tasks:
 # 1. Configure Redis cache settings for transaction data
@@ -20,6 +27,71 @@ from ..core.cache import cache
 # 4. Configure error alerting for failed transaction syncs
 # 5. Set up database indices for transaction queries
 
+# Per-account version embedded in transaction-list cache keys. Writes bump
+# it with one INCR, making every older list key unreachable; those entries
+# then expire on their own TTL. The counter must outlive any list entry, or
+# a reset could make an old version's entries reachable again
+ACCOUNT_VERSION_PREFIX = "ver:account:"
+ACCOUNT_VERSION_TTL = 86400  # seconds
+TRANSACTIONS_LIST_TTL = 300  # seconds
+
+# Single-flight reload of an expired transaction entry: one caller holds the
+# lock and queries the database while the rest poll the cache briefly
+CACHE_LOCK_TTL_MS = 3000
+CACHE_LOCK_WAIT_SECONDS = 0.02
+CACHE_LOCK_MAX_WAITS = 10
+# An empty entry records a transaction the lock holder found missing, so
+# waiters stop polling at once. It is falsy, so bulk reads treat it as a miss
+MISSING_TRANSACTION_TTL = 5  # seconds
+
+# Sync pages larger than this are streamed with COPY instead of a bulk
+# INSERT; below it the per-statement overhead of COPY isn't worth paying
+COPY_THRESHOLD = 500
+COPY_COLUMNS = (
+    'id', 'account_id', 'category_id', 'transaction_date', 'post_date',
+    'amount', 'description', 'merchant_name', 'transaction_type', 'status',
+    'is_pending', 'metadata', 'created_at', 'updated_at'
+)
+COPY_STATEMENT = f"COPY transactions ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+_COPY_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+def _copy_value(value) -> str:
+    """Render one field in PostgreSQL's COPY text format."""
+    if value is None:
+        return '\\N'
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, dict):
+        value = orjson.dumps(value).decode()
+    return str(value).translate(_COPY_ESCAPES)
+
+@lru_cache(maxsize=4096)
+def _transaction_cache_key(transaction_id: uuid.UUID) -> str:
+    """Cache key for a single transaction, formatted once per hot ID."""
+    return f"transaction:{str(transaction_id)}"
+
+def encode_transaction_cursor(transaction: Transaction) -> str:
+    """Opaque keyset cursor pointing just past the given transaction."""
+    raw = f"{transaction.transaction_date.isoformat()}|{transaction.id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+def decode_transaction_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    """
+    Parse a cursor produced by encode_transaction_cursor.
+    
+    Raises:
+        ValueError: If the cursor is malformed
+    """
+    try:
+        transaction_date, transaction_id = base64.urlsafe_b64decode(
+            cursor.encode()
+        ).decode().split('|')
+        return datetime.fromisoformat(transaction_date), uuid.UUID(transaction_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError("Invalid pagination cursor") from e
+
 class TransactionCreate(BaseModel):
     """Pydantic model for transaction creation validation."""
     account_id: UUID4
@@ -58,34 +130,111 @@ class TransactionService:
         self._plaid_service = plaid_service
         self._cache = cache
 
-    def get_transaction(self, transaction_id: uuid.UUID) -> Optional[Transaction]:
+    def get_transaction(self, transaction_id: uuid.UUID) -> Optional[Union[Transaction, TransactionView]]:
         """
         Retrieve a single transaction by ID with caching.
         
+        Cache hits return a read-only TransactionView; use _get_for_update
+        when the row will be modified. Blocking, so async callers run it in
+        a worker thread.
+        
         Requirements addressed:
         - Financial Tracking (1.2): Implements transaction retrieval with caching
         """
         # Check cache first
-        cache_key = f"transaction:{str(transaction_id)}"
+        cache_key = _transaction_cache_key(transaction_id)
         cached_data = self._cache.get(cache_key)
         
-        if cached_data:
-            return Transaction(**cached_data)
+        if cached_data is not None:
+            return TransactionView.from_cache(cached_data) if cached_data else None
+        
+        # Only one caller reloads a missing entry; the others wait for it
+        lock_key = f"lock:{cache_key}"
+        lock_token = self._cache.acquire_lock(lock_key, CACHE_LOCK_TTL_MS)
+        if lock_token is None:
+            for _ in range(CACHE_LOCK_MAX_WAITS):
+                time.sleep(CACHE_LOCK_WAIT_SECONDS)
+                cached_data = self._cache.get(cache_key)
+                if cached_data is not None:
+                    return TransactionView.from_cache(cached_data) if cached_data else None
+            # The holder is slow; query directly
             
-        # Query database if not in cache
-        transaction = self._db.query(Transaction).filter(
-            Transaction.id == transaction_id
-        ).first()
+        try:
+            # Query database if not in cache
+            transaction = self._db.query(Transaction).filter(
+                Transaction.id == transaction_id
+            ).first()
+            
+            if transaction:
+                # Cache for 1 hour
+                self._cache.set(
+                    cache_key,
+                    transaction.to_dict(),
+                    ttl=3600
+                )
+            elif lock_token is not None:
+                self._cache.set(cache_key, {}, ttl=MISSING_TRANSACTION_TTL)
+        finally:
+            if lock_token is not None:
+                self._cache.release_lock(lock_key, lock_token)
+            
+        return transaction
+
+    def _get_for_update(self, transaction_id: uuid.UUID) -> Optional[Transaction]:
+        """
+        Load a session-attached transaction for a write path.
+        
+        Bypasses the cache: a transaction rebuilt from cached data is not
+        attached to the session, so changes to it would never be flushed.
+        Session.get also answers from the identity map when the row is
+        already loaded.
+        """
+        return self._db.get(Transaction, transaction_id)
+
+    def get_transactions_by_ids(
+        self,
+        transaction_ids: List[uuid.UUID]
+    ) -> List[Union[Transaction, TransactionView]]:
+        """
+        Retrieve many transactions by ID with caching.
+        
+        Cache hits come back from one MGET; misses are loaded with a single
+        IN query and written back in one pipelined round trip.
         
-        if transaction:
+        Requirements addressed:
+        - Financial Tracking (1.2): Implements transaction retrieval with caching
+        
+        Returns:
+            Found transactions in the order of transaction_ids; unknown IDs are skipped
+        """
+        transaction_ids = list(dict.fromkeys(uuid.UUID(str(i)) for i in transaction_ids))
+        cache_keys = [_transaction_cache_key(transaction_id) for transaction_id in transaction_ids]
+        cached = self._cache.mget(cache_keys)
+        
+        found: Dict[uuid.UUID, Union[Transaction, TransactionView]] = {}
+        missing_ids = []
+        for transaction_id, cached_data in zip(transaction_ids, cached):
+            if cached_data:
+                found[transaction_id] = TransactionView.from_cache(cached_data)
+            else:
+                missing_ids.append(transaction_id)
+        
+        if missing_ids:
+            loaded = self._db.query(Transaction).options(
+                selectinload(Transaction.category)
+            ).filter(
+                Transaction.id.in_(missing_ids)
+            ).all()
+            for transaction in loaded:
+                found[uuid.UUID(str(transaction.id))] = transaction
+            
             # Cache for 1 hour
-            self._cache.set(
-                cache_key,
-                transaction.to_dict(),
+            self._cache.set_many(
+                {_transaction_cache_key(t.id): t.to_dict() for t in loaded},
                 ttl=3600
             )
-            
-        return transaction
+        
+        return [found[transaction_id] for transaction_id in transaction_ids if transaction_id in found]
 
     def get_transactions(
         self,
@@ -95,45 +244,118 @@ class TransactionService:
         category_id: Optional[str] = None,
         page: int = 1,
         page_size: int = 50
-    ) -> Tuple[List[Transaction], int]:
+    ) -> Tuple[List[Union[Transaction, TransactionView]], int]:
         """
         Retrieve transactions with filtering and pagination.
         
+        Pages are cached under the account's current version, so a hit
+        skips both the count and the page query; cache hits return
+        read-only TransactionViews.
+        
         Requirements addressed:
         - Financial Tracking (1.2): Implements transaction filtering and pagination
         """
-        # Build base query
-        query = self._db.query(Transaction).filter(
-            Transaction.account_id == account_id
+        version = self._cache.get(f"{ACCOUNT_VERSION_PREFIX}{str(account_id)}") or 0
+        cache_key = (
+            f"transactions:{str(account_id)}:v{version}:{start_date}:{end_date}:"
+            f"{category_id}:{page}:{page_size}"
         )
+        cached_page = self._cache.get(cache_key)
+        if cached_page:
+            return (
+                [TransactionView.from_cache(data) for data in cached_page['items']],
+                cached_page['total']
+            )
         
-        # Apply filters
-        if start_date:
-            query = query.filter(Transaction.transaction_date >= start_date)
-        if end_date:
-            query = query.filter(Transaction.transaction_date <= end_date)
-        if category_id:
-            query = query.filter(Transaction.category_id == category_id)
+        query = self._filtered_query(account_id, start_date, end_date, category_id)
             
         # Get total count
         total_count = query.count()
         
-        # Apply pagination
-        transactions = query.order_by(desc(Transaction.transaction_date))\
+        # Apply pagination; categories for the whole page load in one extra
+        # IN query rather than one per row
+        transactions = query.options(selectinload(Transaction.category))\
+            .order_by(desc(Transaction.transaction_date), desc(Transaction.id))\
             .offset((page - 1) * page_size)\
             .limit(page_size)\
             .all()
             
-        # Cache results
-        cache_key = f"transactions:{str(account_id)}:{start_date}:{end_date}:{category_id}:{page}"
+        # Cache results under the version read above; a write since then has
+        # already moved the account on, so this entry is never served stale
         self._cache.set(
             cache_key,
-            [t.to_dict() for t in transactions],
-            ttl=300  # Cache for 5 minutes
+            {'items': [t.to_dict() for t in transactions], 'total': total_count},
+            ttl=TRANSACTIONS_LIST_TTL
         )
         
         return transactions, total_count
 
+    def get_transactions_page(
+        self,
+        account_id: uuid.UUID,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        category_id: Optional[str] = None,
+        cursor: Optional[str] = None,
+        page_size: int = 50
+    ) -> Tuple[List[Transaction], Optional[str]]:
+        """
+        Retrieve transactions with filtering and keyset pagination.
+        
+        Pages are walked by (transaction_date, id) rather than OFFSET and no
+        total is counted, so every page costs O(page_size) however deep it is.
+        
+        Requirements addressed:
+        - Financial Tracking (1.2): Implements transaction filtering and pagination
+        
+        Returns:
+            The page of transactions and the cursor for the next page, or
+            None when this is the last page
+            
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        query = self._filtered_query(account_id, start_date, end_date, category_id)
+        if cursor:
+            query = query.filter(
+                tuple_(Transaction.transaction_date, Transaction.id) < decode_transaction_cursor(cursor)
+            )
+        
+        # Fetch one extra row to learn whether another page exists
+        transactions = query.options(selectinload(Transaction.category))\
+            .order_by(desc(Transaction.transaction_date), desc(Transaction.id))\
+            .limit(page_size + 1)\
+            .all()
+        
+        if len(transactions) <= page_size:
+            return transactions, None
+        transactions = transactions[:page_size]
+        return transactions, encode_transaction_cursor(transactions[-1])
+
+    def _filtered_query(
+        self,
+        account_id: uuid.UUID,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        category_id: Optional[str]
+    ):
+        """Base transaction query for an account with the optional list filters applied."""
+        query = self._db.query(Transaction).filter(
+            Transaction.account_id == account_id
+        )
+        
+        if start_date:
+            query = query.filter(Transaction.transaction_date >= start_date)
+        if end_date:
+            query = query.filter(Transaction.transaction_date <= end_date)
+        if category_id:
+            query = query.filter(Transaction.category_id == category_id)
+        return query
+
+    def invalidate_account(self, account_id: uuid.UUID) -> None:
+        """Make all cached transaction lists for an account unreachable."""
+        self._cache.incr(f"{ACCOUNT_VERSION_PREFIX}{str(account_id)}", ttl=ACCOUNT_VERSION_TTL)
+
     def create_transaction(self, transaction_data: TransactionCreate) -> Transaction:
         """
         Create a new transaction record.
@@ -163,7 +385,7 @@ class TransactionService:
         self._db.commit()
         
         # Invalidate relevant cache entries
-        self._cache.delete(f"transactions:{str(transaction.account_id)}:*")
+        self.invalidate_account(transaction.account_id)
         
         return transaction
 
@@ -178,7 +400,7 @@ class TransactionService:
         Requirements addressed:
         - Financial Tracking (1.2): Implements transaction updates
         """
-        transaction = self.get_transaction(transaction_id)
+        transaction = self._get_for_update(transaction_id)
         if not transaction:
             raise ValueError("Transaction not found")
             
@@ -198,8 +420,8 @@ class TransactionService:
         self._db.commit()
         
         # Invalidate cache entries
-        self._cache.delete(f"transaction:{str(transaction_id)}")
-        self._cache.delete(f"transactions:{str(transaction.account_id)}:*")
+        self._cache.delete(_transaction_cache_key(transaction_id))
+        self.invalidate_account(transaction.account_id)
         
         return transaction
 
@@ -212,40 +434,103 @@ class TransactionService:
         """
         Synchronize transactions with Plaid.
         
+        Follows the sync cursor until Plaid reports no more pages. Each page
+        is written in a worker thread while the next one is being fetched,
+        so Plaid and database latency overlap instead of adding up. All pages
+        commit together once the last one is written, so a failed sync leaves
+        nothing behind and can be retried from the same cursor.
+        
         Requirements addressed:
         - Financial Tracking (1.2): Implements automated transaction import
         - Real-time Updates (2.3): Implements real-time synchronization
         """
-        # Get new transactions from Plaid
-        new_transactions, updated_cursor = await self._plaid_service.sync_transactions(
-            access_token,
-            cursor
+        loop = asyncio.get_running_loop()
+        processed_transactions: List[Transaction] = []
+        next_page = asyncio.ensure_future(
+            self._plaid_service.sync_transactions_page(access_token, cursor)
         )
         
-        processed_transactions = []
-        for plaid_transaction in new_transactions:
-            # Create or update transaction
-            transaction_data = TransactionCreate(
-                account_id=account_id,
-                transaction_date=datetime.fromisoformat(plaid_transaction['date']),
-                amount=plaid_transaction['amount'],
-                description=plaid_transaction['name'],
-                merchant_name=plaid_transaction.get('merchant_name'),
-                transaction_type='debit' if plaid_transaction['amount'] > 0 else 'credit',
-                metadata={
-                    'plaid_transaction_id': plaid_transaction['id'],
-                    'category': plaid_transaction.get('category', []),
-                    'pending': plaid_transaction.get('pending', False)
-                }
-            )
+        try:
+            while next_page is not None:
+                new_transactions, cursor, has_more = await next_page
+                # Start fetching the following page before writing this one
+                next_page = asyncio.ensure_future(
+                    self._plaid_service.sync_transactions_page(access_token, cursor)
+                ) if has_more else None
+                
+                # Plaid data is already typed, so rows are built directly rather than
+                # through TransactionCreate; the model constructor still validates
+                batch = [
+                    self._from_plaid(account_id, plaid_transaction)
+                    for plaid_transaction in new_transactions
+                ]
+                
+                # Writes are awaited one at a time, so the session is only
+                # ever used by one thread
+                if batch:
+                    await loop.run_in_executor(None, self._save_batch, batch)
+                processed_transactions.extend(batch)
             
-            transaction = self.create_transaction(transaction_data)
-            processed_transactions.append(transaction)
-            
-        # Invalidate cache entries
-        self._cache.delete(f"transactions:{str(account_id)}:*")
+            await loop.run_in_executor(None, self._db.commit)
+        except BaseException:
+            if next_page is not None:
+                next_page.cancel()
+            await loop.run_in_executor(None, self._db.rollback)
+            raise
         
-        return processed_transactions, updated_cursor
+        # Invalidate cache entries once for the sync
+        self.invalidate_account(account_id)
+        
+        return processed_transactions, cursor
+
+    def _save_batch(self, transactions: List[Transaction]) -> None:
+        """
+        Insert a page of new transactions in one statement, leaving the commit to the caller.
+        
+        Large pages go through COPY on the session's own connection, so the
+        rows still commit or roll back with the session transaction.
+        """
+        if len(transactions) <= COPY_THRESHOLD:
+            self._db.bulk_save_objects(transactions)
+            return
+
+        # COPY bypasses column defaults applied at flush, so fill them here
+        now = get_current_datetime()
+        buffer = io.StringIO()
+        for transaction in transactions:
+            if transaction.created_at is None:
+                transaction.created_at = now
+            if transaction.updated_at is None:
+                transaction.updated_at = now
+            buffer.write('\t'.join(
+                _copy_value(getattr(transaction, column)) for column in COPY_COLUMNS
+            ))
+            buffer.write('\n')
+        buffer.seek(0)
+
+        with self._db.connection().connection.cursor() as cursor:
+            cursor.copy_expert(COPY_STATEMENT, buffer)
+
+    @staticmethod
+    def _from_plaid(account_id: uuid.UUID, plaid_transaction: Dict) -> Transaction:
+        """Build an unsaved Transaction from a Plaid sync record."""
+        transaction = Transaction(
+            account_id=account_id,
+            transaction_date=datetime.fromisoformat(plaid_transaction['date']),
+            amount=plaid_transaction['amount'],
+            description=plaid_transaction['name'],
+            transaction_type='debit' if plaid_transaction['amount'] > 0 else 'credit'
+        )
+        if plaid_transaction.get('merchant_name'):
+            transaction.merchant_name = plaid_transaction['merchant_name']
+        # A fresh row has no metadata to merge, so skip update_metadata's
+        # copy-and-restamp and assign it directly
+        transaction.metadata = {
+            'plaid_transaction_id': plaid_transaction['id'],
+            'category': plaid_transaction.get('category', []),
+            'pending': plaid_transaction.get('pending', False)
+        }
+        return transaction
 
     def categorize_transaction(
         self,
@@ -258,7 +543,7 @@ class TransactionService:
         Requirements addressed:
         - Financial Tracking (1.2): Implements category management
         """
-        transaction = self.get_transaction(transaction_id)
+        transaction = self._get_for_update(transaction_id)
         if not transaction:
             raise ValueError("Transaction not found")
             
@@ -267,7 +552,7 @@ class TransactionService:
         self._db.commit()
         
         # Invalidate cache entries
-        self._cache.delete(f"transaction:{str(transaction_id)}")
-        self._cache.delete(f"transactions:{str(transaction.account_id)}:*")
+        self._cache.delete(_transaction_cache_key(transaction_id))
+        self.invalidate_account(transaction.account_id)
         
         return transaction
\ No newline at end of file
@@ -11,7 +11,7 @@ Human Tasks:
 
 # SQLAlchemy: ^1.4.0
 # FastAPI: ^0.68.0
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, load_only
 from fastapi import HTTPException
 from typing import Optional, Dict
 from uuid import UUID
@@ -25,6 +25,17 @@ from ..core.security import (
     verify_password_hash
 )
 
+# Columns the login path reads; everything else stays deferred
+AUTH_USER_COLUMNS = (
+    User.id,
+    User.email,
+    User.password_hash,
+    User.is_active,
+    User.first_name,
+    User.last_name,
+    User.created_at,
+)
+
 class UserService:
     """
     Service class implementing user management business logic with secure authentication 
@@ -56,9 +67,10 @@ class UserService:
         Raises:
             HTTPException: If email already exists
         """
-        # Check for existing user
+        # Check for existing user; normalized exactly as the model stores it
+        # so the lookup is a plain equality on the unique email index
         existing_user = self.db.query(User).filter(
-            User.email == user_data.email.lower()
+            User.email == user_data.email.lower().strip()
         ).first()
         
         if existing_user:
@@ -99,8 +111,10 @@ class UserService:
         Raises:
             HTTPException: If authentication fails
         """
-        user = self.db.query(User).filter(
-            User.email == email.lower()
+        user = self.db.query(User).options(
+            load_only(*AUTH_USER_COLUMNS)
+        ).filter(
+            User.email == email.lower().strip()
         ).first()
         
         if not user or not user.is_active:
@@ -115,6 +129,11 @@ class UserService:
                 detail="Invalid credentials"
             )
         
+        # Migrate legacy bcrypt or outdated Argon2id hashes while the plain password is known
+        if user.password_needs_rehash():
+            user.set_password(password)
+            self.db.commit()
+        
         # Generate tokens
         access_token = create_access_token(
             data={"sub": str(user.id), "email": user.email}
@@ -13,6 +13,7 @@ from .crypto import (  # type: ignore
     generate_salt,
     hash_password,
     verify_password,
+    password_needs_rehash,
     generate_key,
     KeyDerivation
 )
@@ -44,6 +45,7 @@ __all__ = [
     'generate_salt',
     'hash_password',
     'verify_password',
+    'password_needs_rehash',
     'generate_key',
     'KeyDerivation',
     
@@ -3,23 +3,33 @@ Cryptographic utility module for Mint Replica Lite system.
 
 Human Tasks:
 1. Verify bcrypt rounds (BCRYPT_ROUNDS) meets current security standards for production
+   (only used to verify legacy hashes; new hashes use Argon2id)
 2. Ensure PBKDF2 iterations count is sufficient for production environment
 3. Review and validate key lengths meet security requirements
 4. Confirm AES-256-GCM implementation aligns with security policies
+5. Pin ARGON2_MEMORY_COST_KIB in the deployment environment once calibrated, so
+   restarts and new hosts keep hashing with the same Argon2id parameters
+6. Size HASH_POOL_WORKERS per app worker so the KDF processes of all workers
+   on a host together stay near its core count
 """
 
 # hashlib: ^3.9.0
-# secrets: ^3.9.0
 # bcrypt: ^4.0.1
-# cryptography: ^41.0.0
+# argon2-cffi: ^21.3.0
 # typing: ^3.9.0
 
+import asyncio
 import hashlib
-import secrets
+import multiprocessing
+import os
+import threading
+import time
 import bcrypt
-from typing import Union
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import Optional, Union
+from argon2 import PasswordHasher, Type
+from argon2.exceptions import VerificationError
 from ..constants import ENCRYPTION_ALGORITHM
 
 # Global constants
@@ -27,6 +37,201 @@ from ..constants import ENCRYPTION_ALGORITHM
 HASH_ALGORITHM: str = 'sha256'
 SALT_LENGTH: int = 32
 BCRYPT_ROUNDS: int = 12
+BCRYPT_HASH_PREFIX: bytes = b'$2'
+
+# Named constructors bound once; hashlib.new() resolves the name on every call
+_HASH_CONSTRUCTORS = {
+    'sha256': hashlib.sha256,
+    'sha384': hashlib.sha384,
+    'sha512': hashlib.sha512,
+    'blake2b': hashlib.blake2b,
+    'blake2s': hashlib.blake2s,
+}
+FAST_HASH_DIGEST_SIZE: int = 32
+
+# Argon2id parameters. The memory cost comes from ARGON2_MEMORY_COST_ENV so
+# every process hashes identically; when unset, the gunicorn master
+# calibrates it once (a hash takes roughly ARGON2_TARGET_MS) and exports it to
+# the workers it forks. The ceiling bounds memory when many logins hash at once
+ARGON2_TARGET_MS: int = 250
+ARGON2_TIME_COST: int = 3
+ARGON2_PARALLELISM: int = 4
+ARGON2_MIN_MEMORY_KIB: int = 19 * 1024
+ARGON2_MAX_MEMORY_KIB: int = 64 * 1024
+ARGON2_MEMORY_COST_ENV: str = 'ARGON2_MEMORY_COST_KIB'
+
+# Salts and keys are sliced from a per-thread buffer of OS randomness that is
+# refilled with one getrandom() call per RANDOM_POOL_SIZE bytes; larger
+# requests read the OS directly
+RANDOM_POOL_SIZE: int = 64 * 1024
+RANDOM_POOL_MAX_REQUEST: int = 1024
+
+_random_pool = threading.local()
+
+def _reset_random_pool() -> None:
+    """Discards buffered randomness so a forked child never reuses the parent's bytes."""
+    global _random_pool
+    _random_pool = threading.local()
+
+os.register_at_fork(after_in_child=_reset_random_pool)
+
+def _random_bytes(length: int) -> bytes:
+    """Returns length bytes of OS randomness; every byte is handed out once."""
+    if length > RANDOM_POOL_MAX_REQUEST:
+        return os.urandom(length)
+    pool = _random_pool
+    buffer = getattr(pool, 'buffer', b'')
+    offset = getattr(pool, 'offset', 0)
+    if offset + length > len(buffer):
+        buffer, offset = os.urandom(RANDOM_POOL_SIZE), 0
+        pool.buffer = buffer
+    pool.offset = offset + length
+    return buffer[offset:offset + length]
+
+# Password KDF processes per app process. Every app worker owns a pool, so
+# the gunicorn master exports a per-worker share of the host's cores here;
+# a single-process run without it gets one per core
+HASH_POOL_WORKERS_ENV: str = 'HASH_POOL_WORKERS'
+
+# Memory cost handed to hash pool workers so they skip calibration and
+# produce hashes with exactly the parent's parameters
+_ARGON2_MEMORY_COST: Optional[int] = None
+
+def _time_argon2_hash(memory_cost: int) -> float:
+    """Returns the wall-clock milliseconds of one Argon2id hash at memory_cost KiB."""
+    hasher = PasswordHasher(
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=memory_cost,
+        parallelism=ARGON2_PARALLELISM,
+        type=Type.ID
+    )
+    start = time.perf_counter()
+    hasher.hash('calibration-password')
+    return (time.perf_counter() - start) * 1000
+
+def calibrate_argon2_memory_cost(target_ms: int = ARGON2_TARGET_MS) -> int:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Binary-searches the largest Argon2id memory cost whose hash time stays
+    within target_ms on this host.
+
+    Args:
+        target_ms: Target hashing time in milliseconds
+
+    Returns:
+        Memory cost in KiB, never below ARGON2_MIN_MEMORY_KIB
+    """
+    low, high = ARGON2_MIN_MEMORY_KIB, ARGON2_MAX_MEMORY_KIB
+    if _time_argon2_hash(low) >= target_ms:
+        return low
+    while high - low > 1024:
+        mid = (low + high) // 2
+        if _time_argon2_hash(mid) <= target_ms:
+            low = mid
+        else:
+            high = mid
+    return low
+
+def resolve_argon2_memory_cost() -> int:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Returns the Argon2id memory cost shared by all processes: the value handed
+    to a hash pool worker, else ARGON2_MEMORY_COST_ENV, else a fresh
+    calibration (single-process runs without gunicorn).
+
+    Returns:
+        Memory cost in KiB
+
+    Raises:
+        ValueError: If the configured memory cost is not a valid amount
+    """
+    if _ARGON2_MEMORY_COST:
+        return _ARGON2_MEMORY_COST
+    configured = os.environ.get(ARGON2_MEMORY_COST_ENV)
+    if not configured:
+        return calibrate_argon2_memory_cost()
+    memory_cost = int(configured)
+    if memory_cost < ARGON2_MIN_MEMORY_KIB:
+        raise ValueError(f"{ARGON2_MEMORY_COST_ENV} must be at least {ARGON2_MIN_MEMORY_KIB} KiB")
+    return memory_cost
+
+def resolve_hash_pool_workers() -> int:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Returns the hash pool size: HASH_POOL_WORKERS_ENV when set, else one
+    process per core.
+
+    Returns:
+        Number of KDF worker processes
+
+    Raises:
+        ValueError: If the configured pool size is not positive
+    """
+    configured = os.environ.get(HASH_POOL_WORKERS_ENV)
+    if not configured:
+        return os.cpu_count() or 1
+    workers = int(configured)
+    if workers < 1:
+        raise ValueError(f"{HASH_POOL_WORKERS_ENV} must be at least 1")
+    return workers
+
+@lru_cache(maxsize=1)
+def get_password_hasher() -> PasswordHasher:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Returns the process-wide Argon2id hasher built from the shared memory cost.
+
+    Returns:
+        Configured argon2 PasswordHasher
+    """
+    return PasswordHasher(
+        time_cost=ARGON2_TIME_COST,
+        memory_cost=resolve_argon2_memory_cost(),
+        parallelism=ARGON2_PARALLELISM,
+        type=Type.ID
+    )
+
+def _init_hash_worker(memory_cost: int) -> None:
+    """Builds the Argon2id hasher once per pool worker with the parent's memory cost."""
+    global _ARGON2_MEMORY_COST
+    _ARGON2_MEMORY_COST = memory_cost
+    get_password_hasher()
+
+@lru_cache(maxsize=1)
+def get_hash_pool() -> ProcessPoolExecutor:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Returns the process pool that runs password KDFs in parallel across cores
+    and off the event loop. Workers are long-lived and pre-warmed.
+
+    Returns:
+        Shared ProcessPoolExecutor sized by resolve_hash_pool_workers
+    """
+    # forkserver avoids forking a parent that already holds DB and Redis sockets
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(
+        max_workers=resolve_hash_pool_workers(),
+        mp_context=multiprocessing.get_context(start_method),
+        initializer=_init_hash_worker,
+        initargs=(get_password_hasher().memory_cost,)
+    )
+
+def _noop() -> None:
+    """Task submitted once per pool worker to start it during warm-up."""
+
+async def warm_hash_pool() -> None:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Resolves the Argon2id parameters and starts every hash pool worker at
+    application startup, so the first login doesn't pay for either.
+    """
+    loop = asyncio.get_running_loop()
+    # A calibration runs several full-size hashes; keep it off the event loop
+    await loop.run_in_executor(None, get_password_hasher)
+    pool = get_hash_pool()
+    await asyncio.gather(*(
+        loop.run_in_executor(pool, _noop) for _ in range(resolve_hash_pool_workers())
+    ))
 
 def generate_salt(length: int) -> bytes:
     """
@@ -44,37 +249,104 @@ def generate_salt(length: int) -> bytes:
     """
     if length <= 0:
         raise ValueError("Salt length must be positive")
-    return secrets.token_bytes(length)
+    return _random_bytes(length)
 
-def hash_password(password: str) -> bytes:
+def hash_password(password: str) -> str:
     """
     Requirement: Password Security - 6.2.2 Sensitive Data Handling
-    Securely hashes a password using bcrypt with configurable rounds.
+    Securely hashes a password using Argon2id with host-calibrated parameters.
     
     Args:
         password: Plain text password to hash
         
     Returns:
-        Bcrypt hashed password with salt
+        Argon2id encoded hash (parameters and salt included), as stored in
+        the String password_hash column
+
+    Raises:
+        ValueError: If password is empty
     """
-    password_bytes = password.encode('utf-8')
-    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
-    return bcrypt.hashpw(password_bytes, salt)
+    if not password:
+        raise ValueError("Password cannot be empty")
+    return get_password_hasher().hash(password)
 
-def verify_password(password: str, hashed_password: bytes) -> bool:
+def verify_password(password: str, hashed_password: Union[str, bytes]) -> bool:
     """
     Requirement: Password Security - 6.2.2 Sensitive Data Handling
-    Verifies a password against its bcrypt hash.
-    
+    Verifies a password against its Argon2id hash, falling back to bcrypt for
+    legacy hashes created before the Argon2id migration.
+
+    Hashes loaded from the String password_hash column arrive as str and are
+    encoded once here.
+
     Args:
         password: Plain text password to verify
-        hashed_password: Bcrypt hash to verify against
-        
+        hashed_password: Argon2id or legacy bcrypt hash (str or bytes)
+
+    Returns:
+        True if password matches hash, False otherwise
+
+    Raises:
+        ValueError: If password is empty or the hash format is invalid
+    """
+    if not password:
+        raise ValueError("Password cannot be empty")
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode('ascii')
+    if hashed_password.startswith(BCRYPT_HASH_PREFIX):
+        return bcrypt.checkpw(password.encode('utf-8'), hashed_password)
+    try:
+        return get_password_hasher().verify(hashed_password.decode('ascii'), password)
+    except VerificationError:
+        return False
+
+async def hash_password_async(password: str) -> str:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Runs hash_password in the hash pool without blocking the event loop.
+
+    Args:
+        password: Plain text password to hash
+
+    Returns:
+        Argon2id encoded hash (parameters and salt included)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), hash_password, password)
+
+async def verify_password_async(password: str, hashed_password: Union[str, bytes]) -> bool:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Runs verify_password in the hash pool without blocking the event loop.
+
+    Args:
+        password: Plain text password to verify
+        hashed_password: Argon2id or legacy bcrypt hash (str or bytes)
+
     Returns:
         True if password matches hash, False otherwise
     """
-    password_bytes = password.encode('utf-8')
-    return bcrypt.checkpw(password_bytes, hashed_password)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_hash_pool(), verify_password, password, hashed_password)
+
+def password_needs_rehash(hashed_password: Union[str, bytes]) -> bool:
+    """
+    Requirement: Password Security - 6.2.2 Sensitive Data Handling
+    Checks whether a stored hash should be replaced after a successful login,
+    either because it is a legacy bcrypt hash or because the Argon2id
+    parameters have changed since it was created.
+
+    Args:
+        hashed_password: Stored password hash (str or bytes)
+
+    Returns:
+        True if the hash should be regenerated
+    """
+    if isinstance(hashed_password, str):
+        hashed_password = hashed_password.encode('ascii')
+    if hashed_password.startswith(BCRYPT_HASH_PREFIX):
+        return True
+    return get_password_hasher().check_needs_rehash(hashed_password.decode('ascii'))
 
 def generate_key(length: int) -> bytes:
     """
@@ -92,7 +364,7 @@ def generate_key(length: int) -> bytes:
     """
     if length <= 0:
         raise ValueError("Key length must be positive")
-    return secrets.token_bytes(length)
+    return _random_bytes(length)
 
 def compute_hash(data: Union[str, bytes], algorithm: str = HASH_ALGORITHM) -> str:
     """
@@ -111,6 +383,9 @@ def compute_hash(data: Union[str, bytes], algorithm: str = HASH_ALGORITHM) -> st
     """
     if isinstance(data, str):
         data = data.encode('utf-8')
+    constructor = _HASH_CONSTRUCTORS.get(algorithm)
+    if constructor is not None:
+        return constructor(data).hexdigest()
     try:
         hash_obj = hashlib.new(algorithm)
         hash_obj.update(data)
@@ -118,6 +393,23 @@ def compute_hash(data: Union[str, bytes], algorithm: str = HASH_ALGORITHM) -> st
     except ValueError as e:
         raise ValueError(f"Unsupported hash algorithm: {algorithm}") from e
 
+def compute_hash_fast(data: Union[str, bytes]) -> str:
+    """
+    Requirement: Data Security - 6.2.1 Encryption Implementation
+    Computes a 256-bit BLAKE2b digest for bulk, non-interoperable hashing
+    such as deduplication keys; several times faster than SHA-256 on CPUs
+    without SHA extensions.
+    
+    Args:
+        data: Data to hash (string or bytes)
+        
+    Returns:
+        Hexadecimal hash digest (64 characters)
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    return hashlib.blake2b(data, digest_size=FAST_HASH_DIGEST_SIZE).hexdigest()
+
 class KeyDerivation:
     """
     Requirement: Key Management - 6.2.1 Encryption Implementation
@@ -154,11 +446,12 @@ class KeyDerivation:
         Returns:
             Derived key of specified length
         """
-        password_bytes = password.encode('utf-8')
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=self._key_length,
-            salt=salt,
-            iterations=self._iterations
-        )
-        return kdf.derive(password_bytes)
\ No newline at end of file
+        # hashlib runs the whole PBKDF2 loop inside OpenSSL, with no
+        # per-call KDF object
+        return hashlib.pbkdf2_hmac(
+            'sha256',
+            password.encode('utf-8'),
+            salt,
+            self._iterations,
+            self._key_length
+        )
\ No newline at end of file
@@ -12,12 +12,86 @@ Human Tasks:
 # pytz: ^2021.3
 # typing: ^3.9.0
 
-from datetime import datetime, timedelta, timezone
-from typing import Optional, Tuple
+from datetime import date as date_type, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import FrozenSet, Optional, Tuple
 import pytz
 
 from app.constants import DATETIME_FORMAT, DATE_FORMAT
 
+# DATETIME_FORMAT is fixed-width ISO 8601 UTC, so the C-implemented
+# fromisoformat/isoformat can stand in for the much slower strptime/strftime
+ISO_DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%fZ'
+_USE_ISO_FAST_PATH = DATETIME_FORMAT == ISO_DATETIME_FORMAT
+_ISO_DATETIME_LENGTH = len('2000-01-01T00:00:00.000000Z')
+
+# Market timezone, resolved once at import rather than on every call
+US_EASTERN = pytz.timezone('US/Eastern')
+
+def _nth_weekday(year: int, month: int, weekday: int, n: int) -> date_type:
+    """Date of the n-th given weekday in a month; n=-1 selects the last one."""
+    if n > 0:
+        first = date_type(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+    last = date_type(year + month // 12, month % 12 + 1, 1) - timedelta(days=1)
+    return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+def _easter(year: int) -> date_type:
+    """Gregorian Easter Sunday (Meeus/Jones/Butcher algorithm)."""
+    a, b, c = year % 19, year // 100, year % 100
+    h = (19 * a + b - b // 4 - (b - (b + 8) // 25 + 1) // 3 + 15) % 30
+    l = (32 + 2 * (b % 4) + 2 * (c // 4) - h - c % 4) % 7
+    n = h + l - 7 * ((a + 11 * h + 22 * l) // 451) + 114
+    return date_type(year, n // 31, n % 31 + 1)
+
+def _observed(holiday: date_type) -> date_type:
+    """Shift a weekend holiday to the weekday it is observed on."""
+    if holiday.weekday() == 5:
+        return holiday - timedelta(days=1)
+    if holiday.weekday() == 6:
+        return holiday + timedelta(days=1)
+    return holiday
+
+@lru_cache(maxsize=32)
+def us_market_holidays(year: int) -> FrozenSet[date_type]:
+    """
+    US market holidays observed in the given year, built once per year.
+    
+    Requirement 1.2 Scope/Financial Tracking:
+    Support investment tracking with business day awareness
+    """
+    holidays = {
+        _nth_weekday(year, 1, 0, 3),           # Martin Luther King Jr. Day
+        _nth_weekday(year, 2, 0, 3),           # Presidents' Day
+        _easter(year) - timedelta(days=2),     # Good Friday
+        _nth_weekday(year, 5, 0, -1),          # Memorial Day
+        _observed(date_type(year, 7, 4)),      # Independence Day
+        _nth_weekday(year, 9, 0, 1),           # Labor Day
+        _nth_weekday(year, 11, 3, 4),          # Thanksgiving
+        _observed(date_type(year, 12, 25)),    # Christmas
+    }
+    # A Saturday New Year's Day is not observed on the prior Friday
+    new_year = date_type(year, 1, 1)
+    if new_year.weekday() != 5:
+        holidays.add(_observed(new_year))
+    if year >= 2022:
+        holidays.add(_observed(date_type(year, 6, 19)))  # Juneteenth
+    return frozenset(holidays)
+
+@lru_cache(maxsize=32)
+def _business_day_mask(year: int) -> int:
+    """Bit i is set when day-of-year i (0-based) is a business day."""
+    holidays = us_market_holidays(year)
+    day = date_type(year, 1, 1)
+    mask = 0
+    bit = 0
+    while day.year == year:
+        if day.weekday() < 5 and day not in holidays:
+            mask |= 1 << bit
+        day += timedelta(days=1)
+        bit += 1
+    return mask
+
 def parse_datetime(datetime_str: str) -> datetime:
     """
     Parses datetime string into UTC datetime object.
@@ -28,6 +102,15 @@ def parse_datetime(datetime_str: str) -> datetime:
     if not datetime_str:
         raise ValueError("Datetime string cannot be empty")
     
+    # Fast path for the canonical shape; anything else (shorter fractions,
+    # malformed input) goes through strptime for its exact rules and errors
+    if (_USE_ISO_FAST_PATH and len(datetime_str) == _ISO_DATETIME_LENGTH
+            and datetime_str[10] == 'T' and datetime_str[19] == '.' and datetime_str[-1] == 'Z'):
+        try:
+            return datetime.fromisoformat(datetime_str[:-1]).replace(tzinfo=timezone.utc)
+        except ValueError:
+            pass
+    
     try:
         dt = datetime.strptime(datetime_str, DATETIME_FORMAT)
         return dt.replace(tzinfo=timezone.utc)
@@ -50,6 +133,8 @@ def format_datetime(dt: datetime) -> str:
     elif dt.tzinfo != timezone.utc:
         dt = dt.astimezone(timezone.utc)
     
+    if _USE_ISO_FAST_PATH:
+        return dt.replace(tzinfo=None).isoformat(timespec='microseconds') + 'Z'
     return dt.strftime(DATETIME_FORMAT)
 
 def get_current_datetime() -> datetime:
@@ -147,18 +232,27 @@ def is_business_day(date: datetime) -> bool:
         date = date.replace(tzinfo=timezone.utc)
     
     # Convert to US/Eastern for market hours
-    us_eastern = pytz.timezone('US/Eastern')
-    date_eastern = date.astimezone(us_eastern)
+    date_eastern = date.astimezone(US_EASTERN)
     
-    # Check if weekend
-    if date_eastern.weekday() >= 5:  # Saturday = 5, Sunday = 6
-        return False
-    
-    # Get US holidays calendar
-    us_holidays = pytz.US.holidays()
+    # One bit test covers both weekends and holidays
+    return bool(_business_day_mask(date_eastern.year) >> (date_eastern.timetuple().tm_yday - 1) & 1)
+
+def count_business_days(start: date_type, end: date_type) -> int:
+    """
+    Counts business days in the half-open range [start, end).
     
-    # Check if holiday
-    if date_eastern.date() in us_holidays:
-        return False
+    Requirement 1.2 Scope/Financial Tracking:
+    Support investment tracking with business day awareness
+    """
+    if start is None or end is None:
+        raise ValueError("Start and end dates cannot be None")
     
-    return True
\ No newline at end of file
+    count = 0
+    for year in range(start.year, end.year + 1):
+        # Clip the range to this year and popcount that slice of its mask
+        first = start.timetuple().tm_yday - 1 if year == start.year else 0
+        last = end.timetuple().tm_yday - 1 if year == end.year else 366
+        if last > first:
+            window = (_business_day_mask(year) >> first) & ((1 << (last - first)) - 1)
+            count += bin(window).count('1')
+    return count
\ No newline at end of file
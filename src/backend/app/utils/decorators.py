@@ -8,24 +8,49 @@ Human Tasks:
 """
 
 # fastapi: ^0.95.0
+# cachetools: ^5.2.0
 # functools: ^3.9.0
 # typing: ^3.9.0
 
 import functools
+import hashlib
 import json
 import time
 from typing import Any, Callable, Dict, List, Optional
 
+import orjson
+from cachetools import TTLCache
 from fastapi import HTTPException, Request
 from fastapi.security.utils import get_authorization_scheme_param
 
 from ..core.auth import verify_token
-from ..core.cache import cache
+from ..core.cache import CACHE_JSON_OPTIONS, cache
 from ..core.logging import get_logger
 
 # Initialize structured logger
 logger = get_logger(__name__)
 
+# Response cache keys are "<prefix>:<hex digest>" of this many bytes
+CACHE_KEY_DIGEST_SIZE = 16
+
+# In-process tier in front of Redis for each cached endpoint. Its TTL is
+# capped so a local copy is at most this stale relative to Redis. Entries are
+# held serialized, so every hit decodes a fresh copy shaped like a Redis hit
+LOCAL_CACHE_MAXSIZE = 1024
+LOCAL_CACHE_TTL = 5  # seconds
+
+def _response_cache_key(key_prefix: str, args: tuple, kwargs: Dict[str, Any]) -> str:
+    """Fixed-length cache key hashed from the call's arguments."""
+    digest = hashlib.blake2b(digest_size=CACHE_KEY_DIGEST_SIZE)
+    parts = [str(arg) for arg in args]
+    parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
+    for part in parts:
+        # Length-prefix each part so ("a:b",) and ("a", "b") can't collide
+        encoded = part.encode()
+        digest.update(len(encoded).to_bytes(8, 'big'))
+        digest.update(encoded)
+    return f"{key_prefix}:{digest.hexdigest()}"
+
 def require_auth(required_scopes: List[str]) -> Callable:
     """
     Decorator to enforce JWT authentication and scope validation on API endpoints.
@@ -76,31 +101,36 @@ def cache_response(ttl: int, key_prefix: str) -> Callable:
     Requirement: Cache Management - 2.5 Infrastructure Architecture/2.5.3 Scalability Architecture
     """
     def decorator(func: Callable) -> Callable:
+        # Only touched from the event loop thread, so no lock is needed
+        local_cache: TTLCache = TTLCache(
+            maxsize=LOCAL_CACHE_MAXSIZE,
+            ttl=min(ttl, LOCAL_CACHE_TTL)
+        )
+
         @functools.wraps(func)
         async def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Generate cache key from prefix and arguments
-            cache_key = f"{key_prefix}:"
-            
-            # Add args to cache key
-            if args:
-                cache_key += ":".join(str(arg) for arg in args)
-                
-            # Add kwargs to cache key
-            if kwargs:
-                sorted_kwargs = sorted(kwargs.items())
-                cache_key += ":" + ":".join(f"{k}={v}" for k, v in sorted_kwargs)
+            cache_key = _response_cache_key(key_prefix, args, kwargs)
+
+            # Hot keys are served locally without a Redis round trip
+            encoded_response = local_cache.get(cache_key)
+            if encoded_response is not None:
+                return orjson.loads(encoded_response)
 
             # Try to get cached response
             cached_response = cache.get(cache_key)
             if cached_response is not None:
+                local_cache[cache_key] = orjson.dumps(cached_response, option=CACHE_JSON_OPTIONS)
                 return cached_response
 
             # Execute function if cache miss
             response = await func(*args, **kwargs)
             
-            # Cache the response
+            # Cache the response, encoded once for both tiers
             try:
-                cache.set(cache_key, response, ttl)
+                encoded_response = orjson.dumps(response, option=CACHE_JSON_OPTIONS)
+                cache.set(cache_key, encoded_response, ttl)
+                local_cache[cache_key] = encoded_response
             except Exception as e:
                 logger.error("Cache error", error=str(e), key=cache_key)
                 
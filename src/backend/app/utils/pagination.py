@@ -14,7 +14,8 @@ Human Tasks:
 
 from typing import Dict, List, Optional, Tuple, Any
 from pydantic import BaseModel
-from sqlalchemy import Query
+from sqlalchemy import func, select
+from sqlalchemy.orm import Query
 
 from ..core.config import get_settings
 from ..core.errors import ValidationError
@@ -91,6 +92,15 @@ class PaginatedResponse(BaseModel):
             pages=pages
         )
 
+def _count_rows(query: Query) -> int:
+    """
+    Count the rows a query returns; wrapping the unsorted query keeps
+    GROUP BY/DISTINCT counts correct.
+    """
+    return query.session.execute(
+        select(func.count()).select_from(query.order_by(None).subquery())
+    ).scalar()
+
 def paginate_query(query: Query, params: PaginationParams) -> Tuple[List[Any], int]:
     """
     Apply pagination and optional sorting to a SQLAlchemy query.
@@ -98,9 +108,6 @@ def paginate_query(query: Query, params: PaginationParams) -> Tuple[List[Any], i
     Requirement: Data Query Optimization
     Location: 2.5 Infrastructure Architecture/2.5.3 Scalability Architecture
     """
-    # Clone query for total count
-    count_query = query.with_entities(Query.func.count())
-    
     # Apply sorting if specified
     if params.sort_by and params.sort_order:
         sort_column = getattr(query.column_descriptions[0]['type'], params.sort_by, None)
@@ -118,12 +125,35 @@ def paginate_query(query: Query, params: PaginationParams) -> Tuple[List[Any], i
     # Calculate offset
     offset = (params.page - 1) * params.per_page
     
-    # Apply pagination
-    query = query.offset(offset).limit(params.per_page)
+    single_entity = len(query.column_descriptions) == 1
+    
+    if query._distinct:
+        # DISTINCT applies after window functions, so a window count would
+        # include the duplicates; count the deduplicated rows separately
+        rows = query.only_return_tuples(True).offset(offset).limit(params.per_page).all()
+        items = [row[0] if single_entity else tuple(row) for row in rows]
+        total = _count_rows(query) if items or offset else 0
+        return items, total
+    
+    # Fetch the page and the unpaginated total in one round trip; the
+    # window count is evaluated before LIMIT/OFFSET apply
+    rows = (
+        query.add_columns(func.count().over().label("total_count"))
+        .offset(offset)
+        .limit(params.per_page)
+        .all()
+    )
     
-    # Execute queries
-    total = count_query.scalar()
-    items = query.all()
+    if rows:
+        total = rows[0].total_count
+        items = [row[0] if single_entity else tuple(row[:-1]) for row in rows]
+    elif offset:
+        # Past the last page no row carries the total, so count separately
+        total = _count_rows(query)
+        items = []
+    else:
+        total = 0
+        items = []
     
     return items, total
 
@@ -140,7 +140,7 @@ def hash_data(data: Union[str, bytes]) -> str:
     """
     if isinstance(data, str):
         data = data.encode('utf-8')
-    return hash_password(data).hex()
+    return hash_password(data).encode('ascii').hex()
 
 class TokenManager:
     """
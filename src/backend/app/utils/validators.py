@@ -18,8 +18,8 @@ Human Tasks:
 import re
 from datetime import datetime, timedelta
 from decimal import Decimal, InvalidOperation
-from functools import wraps
-from typing import Tuple, Type, Callable, Any
+from functools import lru_cache, wraps
+from typing import Optional, Tuple, Type, Callable, Any
 
 from email_validator import validate_email as validate_email_format, EmailNotValidError
 from pydantic import BaseModel
@@ -31,6 +31,22 @@ from ..constants import (
     MAX_PAGE_SIZE
 )
 
+# Patterns compiled once at import instead of looked up per call
+EMAIL_INJECTION_PATTERN = re.compile(r'[<>{}()/\\]')
+PASSWORD_UPPERCASE_PATTERN = re.compile(r'[A-Z]')
+PASSWORD_LOWERCASE_PATTERN = re.compile(r'[a-z]')
+PASSWORD_DIGIT_PATTERN = re.compile(r'\d')
+PASSWORD_SPECIAL_PATTERN = re.compile(r'[!@#$%^&*(),.?":{}|<>]')
+
+@lru_cache(maxsize=4096)
+def _email_format_error(email: str) -> Optional[str]:
+    """Memoized email-validator check: the error message, or None if valid."""
+    try:
+        validate_email_format(email, check_deliverability=False)
+        return None
+    except EmailNotValidError as e:
+        return str(e)
+
 def validate_email(email: str) -> bool:
     """
     Validates email address format and structure.
@@ -44,15 +60,14 @@ def validate_email(email: str) -> bool:
     email = email.strip()
     
     # Check for common injection patterns
-    if re.search(r'[<>{}()/\\]', email):
+    if EMAIL_INJECTION_PATTERN.search(email):
         raise ValidationError("Email contains invalid characters")
     
-    try:
-        # Validate email format using email-validator library
-        validate_email_format(email, check_deliverability=False)
-        return True
-    except EmailNotValidError as e:
-        raise ValidationError(f"Invalid email format: {str(e)}")
+    # Validate email format using email-validator library
+    error = _email_format_error(email)
+    if error is not None:
+        raise ValidationError(f"Invalid email format: {error}")
+    return True
 
 def validate_password(password: str) -> bool:
     """
@@ -67,16 +82,16 @@ def validate_password(password: str) -> bool:
         raise ValidationError(f"Password must be at least {PASSWORD_MIN_LENGTH} characters long")
     
     # Check for required character types
-    if not re.search(r'[A-Z]', password):
+    if not PASSWORD_UPPERCASE_PATTERN.search(password):
         raise ValidationError("Password must contain at least one uppercase letter")
     
-    if not re.search(r'[a-z]', password):
+    if not PASSWORD_LOWERCASE_PATTERN.search(password):
         raise ValidationError("Password must contain at least one lowercase letter")
     
-    if not re.search(r'\d', password):
+    if not PASSWORD_DIGIT_PATTERN.search(password):
         raise ValidationError("Password must contain at least one number")
     
-    if not re.search(r'[!@#$%^&*(),.?":{}|<>]', password):
+    if not PASSWORD_SPECIAL_PATTERN.search(password):
         raise ValidationError("Password must contain at least one special character")
     
     return True
@@ -16,6 +16,11 @@ import multiprocessing
 import os
 from app.config import settings
 from app.core.logging import setup_logging
+from app.utils.crypto import (
+    ARGON2_MEMORY_COST_ENV,
+    HASH_POOL_WORKERS_ENV,
+    calibrate_argon2_memory_cost
+)
 
 # WSGI application configuration
 wsgi_app = 'app.wsgi:application'  # WSGI application path
@@ -71,6 +76,19 @@ def on_starting(server):
             )
         )
     
+    # Calibrate Argon2id once in the master and export the result; forked
+    # workers inherit it, so every worker hashes with identical parameters
+    # and logins never trigger rehashes by landing on a different worker
+    if not os.environ.get(ARGON2_MEMORY_COST_ENV):
+        os.environ[ARGON2_MEMORY_COST_ENV] = str(calibrate_argon2_memory_cost())
+    
+    # Each worker starts its own password hash process pool at startup, and
+    # each pool process can hold a full Argon2id memory cost. Split the cores
+    # between the workers so the host runs about one KDF process per core,
+    # rather than workers * cpu_count of them
+    if not os.environ.get(HASH_POOL_WORKERS_ENV):
+        os.environ[HASH_POOL_WORKERS_ENV] = str(max(1, multiprocessing.cpu_count() // server.cfg.workers))
+    
     # Set process title
     server.proc_name = f"{settings.PROJECT_NAME}-gunicorn"
 
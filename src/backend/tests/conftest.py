@@ -14,12 +14,13 @@ Human Tasks:
 # sqlalchemy: ^1.4.0
 
 import pytest
-from typing import Dict, Generator
+import pytest_asyncio
+from typing import AsyncGenerator, Dict, Generator
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_db, init_db
+from app.db.session import AsyncSessionLocal, get_db, init_db
 from app.core.cache import RedisCache
 from app.core.auth import create_access_token
 
@@ -55,6 +56,26 @@ def test_db() -> Generator[AsyncSession, None, None]:
         # Cleanup resources
         db.close()
 
+@pytest_asyncio.fixture
+async def test_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Provides async test database session for services built on AsyncSession.
+    
+    Requirement: Database Testing - Configure test database fixtures for PostgreSQL testing
+    with transaction rollback and session cleanup
+    
+    Yields:
+        AsyncSession: Clean async database session for test use
+    """
+    # Initialize test database schema
+    init_db()
+    
+    async with AsyncSessionLocal() as db:
+        yield db
+        
+        # Rollback changes after test
+        await db.rollback()
+
 @pytest.fixture
 def test_cache() -> Generator[RedisCache, None, None]:
     """
@@ -3,15 +3,19 @@ import pytest
 # pytest-asyncio v0.15.1
 import pytest_asyncio
 # fastapi.testclient v0.68.0
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
 # unittest.mock v3.9+
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 from datetime import datetime
 from decimal import Decimal
 from uuid import UUID, uuid4
 
 # Internal imports
 from app.api.v1.endpoints.transactions import (
+    NEXT_CURSOR_HEADER,
+    router,
+    get_transaction_service,
     get_transaction,
     get_transactions,
     create_transaction,
@@ -19,6 +23,7 @@ from app.api.v1.endpoints.transactions import (
     sync_transactions,
     categorize_transaction
 )
+from app.core.auth import get_current_user
 from app.services.transaction_service import TransactionService
 from app.schemas.transaction import (
     TransactionCreate,
@@ -317,6 +322,7 @@ class TestTransactionAPI:
                 "account_id": str(self.test_account_id),
                 "cursor": "previous_cursor"
             },
+            json={"access_token": "encrypted_access_token"},
             headers=self.headers
         )
         
@@ -330,6 +336,7 @@ class TestTransactionAPI:
                 "account_id": str(uuid4()),
                 "cursor": "previous_cursor"
             },
+            json={"access_token": "encrypted_access_token"},
             headers=self.headers
         )
         
@@ -344,6 +351,7 @@ class TestTransactionAPI:
                 "account_id": str(self.test_account_id),
                 "cursor": "previous_cursor"
             },
+            json={"access_token": "encrypted_access_token"},
             headers=self.headers
         )
         
@@ -413,4 +421,106 @@ class TestTransactionAPI:
             headers=self.headers
         )
         
-        assert response.status_code == 422
\ No newline at end of file
+        assert response.status_code == 422
+
+
+class TestTransactionServiceDependency:
+    """
+    Endpoint tests running the transaction router against an injected service instance.
+    
+    Requirements addressed:
+    - REST API Services (2.1): Verify endpoints call the request-scoped service
+    """
+
+    @pytest.fixture(autouse=True)
+    def setup_app(self):
+        """Mounts the router with the service and user dependencies overridden."""
+        self.test_account_id = uuid4()
+        # Autospec checks call signatures, so a missing argument fails here too
+        self.service = create_autospec(TransactionService, instance=True)
+        
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_transaction_service] = lambda: self.service
+        app.dependency_overrides[get_current_user] = lambda: {
+            "accounts": [str(self.test_account_id)]
+        }
+        self.client = TestClient(app)
+
+    def test_get_transactions_with_cursor(self):
+        """
+        Test that a cursor request pages by keyset on the service instance.
+        
+        Requirements addressed:
+        - Financial Tracking (1.2): Test keyset pagination
+        """
+        self.service.get_transactions_page.return_value = ([], "next_cursor")
+        
+        response = self.client.get(
+            "/transactions/",
+            params={
+                "account_id": str(self.test_account_id),
+                "cursor": "page_cursor",
+                "page_size": 10
+            }
+        )
+        
+        assert response.status_code == 200
+        assert response.json() == []
+        assert response.headers[NEXT_CURSOR_HEADER] == "next_cursor"
+        self.service.get_transactions_page.assert_called_once_with(
+            account_id=self.test_account_id,
+            start_date=None,
+            end_date=None,
+            category_id=None,
+            cursor="page_cursor",
+            page_size=10
+        )
+        self.service.get_transactions.assert_not_called()
+
+    def test_get_transaction_runs_service_lookup(self):
+        """
+        Test that the single-transaction lookup runs on the service instance.
+        
+        Requirements addressed:
+        - Security Controls (6.3.3): Test missing transactions return 404
+        """
+        transaction_id = uuid4()
+        self.service.get_transaction.return_value = None
+        
+        response = self.client.get(f"/transactions/{transaction_id}")
+        
+        assert response.status_code == 404
+        self.service.get_transaction.assert_called_once_with(transaction_id)
+
+    def test_sync_transactions_passes_access_token(self):
+        """
+        Test that a sync request reaches the service with the account's access token.
+        
+        Requirements addressed:
+        - Financial Tracking (1.2): Test automated transaction import
+        """
+        self.service.sync_transactions.return_value = ([MagicMock(), MagicMock()], "next_sync_cursor")
+        
+        response = self.client.post(
+            "/transactions/sync",
+            params={"account_id": str(self.test_account_id), "cursor": "sync_cursor"},
+            json={"access_token": "encrypted_access_token"}
+        )
+        
+        assert response.status_code == 200
+        assert response.json() == {"new_transactions": 2, "cursor": "next_sync_cursor"}
+        self.service.sync_transactions.assert_awaited_once_with(
+            account_id=self.test_account_id,
+            access_token="encrypted_access_token",
+            cursor="sync_cursor"
+        )
+        
+        # Access checks keep their status instead of becoming a 400
+        response = self.client.post(
+            "/transactions/sync",
+            params={"account_id": str(uuid4())},
+            json={"access_token": "encrypted_access_token"}
+        )
+        
+        assert response.status_code == 403
@@ -20,6 +20,7 @@ from freezegun import freeze_time
 from app.core.auth import (
     create_access_token,
     create_refresh_token,
+    create_token_pair,
     verify_token,
     get_current_user,
     OAuth2PasswordBearerWithCookie,
@@ -86,6 +87,26 @@ async def test_create_refresh_token(test_auth_manager):
     expected_exp = datetime.utcnow() + timedelta(days=30)
     assert abs(datetime.fromtimestamp(payload["exp"]) - expected_exp).seconds < 5
 
+@pytest.mark.asyncio
+async def test_create_token_pair(test_auth_manager):
+    """
+    Test paired access/refresh issuance shares the subject and issue time.
+    
+    Requirement: Authentication Flow Testing - 6.1 Authentication and Authorization/6.1.1 Authentication Flow
+    """
+    with freeze_time("2024-01-01 12:00:00"):
+        access_token, refresh_token = create_token_pair(TEST_TOKEN_DATA["sub"])
+        
+        access_payload = verify_token(access_token)
+        refresh_payload = verify_token(refresh_token)
+    
+    assert access_payload["sub"] == refresh_payload["sub"] == TEST_TOKEN_DATA["sub"]
+    assert access_payload["type"] == "access"
+    assert refresh_payload["type"] == "refresh"
+    assert refresh_payload["exp"] - access_payload["exp"] == (
+        timedelta(days=30) - timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
+    ).total_seconds()
+
 @pytest.mark.asyncio
 async def test_verify_token(test_auth_manager):
     """
@@ -132,6 +132,107 @@ async def test_cache_exists(test_redis):
     with pytest.raises(ValueError):
         cache.exists(123)
 
+@pytest.mark.asyncio
+async def test_cache_set_and_index(test_redis):
+    """
+    Test storing a value and indexing its key in a Redis set atomically.
+    
+    Requirement: Cache Management Testing - Validate set-backed key indexes
+    """
+    cache = RedisCache()
+    
+    # Store values and index their members
+    assert cache.set_and_index("cursor:user_1", "cursor_a", "cursor:keys", "user_1")
+    assert cache.set_and_index("cursor:user_2", "cursor_b", "cursor:keys", "user_2", ttl=TEST_TTL)
+    
+    # Re-indexing an existing member does not duplicate it
+    assert cache.set_and_index("cursor:user_1", "cursor_c", "cursor:keys", "user_1")
+    
+    assert cache.get("cursor:user_1") == "cursor_c"
+    assert cache.smembers("cursor:keys") == {"user_1", "user_2"}
+    ttl = cache._client.ttl("cursor:user_2")
+    assert TEST_TTL - 1 <= ttl <= TEST_TTL
+    
+    # Missing set returns empty
+    assert cache.smembers("nonexistent_key") == set()
+
+@pytest.mark.asyncio
+async def test_cache_set_many(test_redis):
+    """
+    Test storing multiple values in one pipelined round trip.
+    
+    Requirement: Cache Management Testing - Validate bulk cache writes
+    """
+    cache = RedisCache()
+    
+    assert cache.set_many({"key1": "value1", "key2": {"nested": "value2"}}, ttl=TEST_TTL)
+    assert cache.mget(["key1", "key2"]) == ["value1", {"nested": "value2"}]
+    ttl = cache._client.ttl("key2")
+    assert TEST_TTL - 1 <= ttl <= TEST_TTL
+    
+    # Empty mapping is a no-op
+    assert cache.set_many({})
+    
+    # Test with invalid values
+    with pytest.raises(ValueError):
+        cache.set_many({"key3": None})
+
+@pytest.mark.asyncio
+async def test_cache_lock(test_redis):
+    """
+    Test single-holder locks with token-checked release.
+    
+    Requirement: Cache Management Testing - Validate cache stampede locks
+    """
+    cache = RedisCache()
+    
+    token = cache.acquire_lock("lock:key1", 1000)
+    assert token is not None
+    
+    # Held lock can't be taken again or released with another token
+    assert cache.acquire_lock("lock:key1", 1000) is None
+    assert not cache.release_lock("lock:key1", "wrong_token")
+    
+    # Releasing frees it for the next caller
+    assert cache.release_lock("lock:key1", token)
+    assert cache.acquire_lock("lock:key1", 1000) is not None
+
+@pytest.mark.asyncio
+async def test_cache_incr(test_redis):
+    """
+    Test version counters used for key invalidation.
+    
+    Requirement: Cache Management Testing - Validate versioned cache keys
+    """
+    cache = RedisCache()
+    
+    # Counter starts from zero and reads back through get()
+    assert cache.incr("ver:account:1", ttl=TEST_TTL) == 1
+    assert cache.incr("ver:account:1", ttl=TEST_TTL) == 2
+    assert cache.get("ver:account:1") == 2
+    ttl = cache._client.ttl("ver:account:1")
+    assert TEST_TTL - 1 <= ttl <= TEST_TTL
+
+@pytest.mark.asyncio
+async def test_cache_mget(test_redis):
+    """
+    Test retrieving multiple values in one round trip with JSON deserialization.
+    
+    Requirement: Cache Management Testing - Validate bulk cache reads
+    """
+    cache = RedisCache()
+    
+    cache.set("key1", "value1")
+    cache.set("key2", {"nested": "value2"})
+    
+    # Values come back in key order with misses as None
+    assert cache.mget(["key1", "nonexistent_key", "key2"]) == ["value1", None, {"nested": "value2"}]
+    assert cache.mget([]) == []
+    
+    # Test with invalid key types
+    with pytest.raises(ValueError):
+        cache.mget(["key1", ""])
+
 @pytest.mark.asyncio
 async def test_cache_clear(test_redis):
     """
@@ -0,0 +1,3 @@
+"""
+Test database module initialization file.
+"""
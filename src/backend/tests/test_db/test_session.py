@@ -0,0 +1,95 @@
+"""
+Unit test suite for database session management in Mint Replica Lite backend.
+
+Human Tasks:
+1. Ensure database settings are configured for the test environment
+"""
+
+# pytest: ^7.0.0
+# pytest-asyncio: ^0.18.0
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+from fastapi import HTTPException
+
+from app.core.errors import DatabaseError
+from app.db import session as db_session
+
+def mock_session_factory():
+    """AsyncSessionLocal stand-in returning one mocked session."""
+    session = MagicMock()
+    session.commit = AsyncMock()
+    session.rollback = AsyncMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=False)
+    return MagicMock(return_value=session), session
+
+@pytest.mark.asyncio
+async def test_get_async_db_commits_on_success():
+    """
+    Test that the session is committed once the request completes.
+    
+    Requirement: Data Security - Secure session handling with proper resource cleanup
+    """
+    factory, session = mock_session_factory()
+    with patch.object(db_session, 'AsyncSessionLocal', factory):
+        dependency = db_session.get_async_db()
+        assert await dependency.__anext__() is session
+        with pytest.raises(StopAsyncIteration):
+            await dependency.__anext__()
+    
+    session.commit.assert_awaited_once()
+    session.rollback.assert_not_awaited()
+
+@pytest.mark.asyncio
+async def test_get_async_db_reraises_http_exception():
+    """
+    Test that an HTTPException raised by the endpoint rolls back and keeps
+    its status code instead of becoming a DatabaseError.
+    
+    Requirement: Data Security - Secure session handling with proper resource cleanup
+    """
+    factory, session = mock_session_factory()
+    with patch.object(db_session, 'AsyncSessionLocal', factory):
+        dependency = db_session.get_async_db()
+        await dependency.__anext__()
+        with pytest.raises(HTTPException) as exc_info:
+            await dependency.athrow(HTTPException(status_code=404, detail="Not found"))
+    
+    assert exc_info.value.status_code == 404
+    session.rollback.assert_awaited_once()
+    session.commit.assert_not_awaited()
+
+def test_get_db_reraises_http_exception():
+    """
+    Test that the sync session also lets an endpoint's HTTPException through
+    with its status code after rolling back.
+    
+    Requirement: Data Security - Secure session handling with proper resource cleanup
+    """
+    session = MagicMock()
+    with patch.object(db_session, 'SessionLocal', MagicMock(return_value=session)):
+        with pytest.raises(HTTPException) as exc_info:
+            with db_session.get_db():
+                raise HTTPException(status_code=403, detail="Access denied")
+    
+    assert exc_info.value.status_code == 403
+    session.rollback.assert_called_once()
+    session.commit.assert_not_called()
+    session.close.assert_called_once()
+
+@pytest.mark.asyncio
+async def test_get_async_db_wraps_database_failures():
+    """
+    Test that other failures roll back and surface as DatabaseError.
+    
+    Requirement: Data Security - Secure session handling with proper resource cleanup
+    """
+    factory, session = mock_session_factory()
+    with patch.object(db_session, 'AsyncSessionLocal', factory):
+        dependency = db_session.get_async_db()
+        await dependency.__anext__()
+        with pytest.raises(DatabaseError):
+            await dependency.athrow(RuntimeError("connection lost"))
+    
+    session.rollback.assert_awaited_once()
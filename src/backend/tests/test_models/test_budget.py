@@ -243,4 +243,27 @@ class TestBudget:
         
         # Verify alert status
         assert "alert_triggered" in budget_dict
-        assert not budget_dict["alert_triggered"]  # Should be False at 40% spent
\ No newline at end of file
+        assert not budget_dict["alert_triggered"]  # Should be False at 40% spent
+
+    @pytest.mark.asyncio
+    async def test_budget_progress_with_preloaded_spend(self, test_db, test_user):
+        """
+        Test progress calculation from a spend preloaded by the batched aggregate query.
+        
+        Requirements addressed:
+        - Budget Management Testing (1.2 Scope/Budget Management):
+          Validates progress monitoring without per-budget queries
+        """
+        budget = Budget(
+            **self.test_budget_data,
+            user_id=test_user["id"],
+            category_id=1
+        )
+        budget.preload_spent_amount(Decimal("400.00"))
+        
+        progress = budget.calculate_progress()
+        
+        assert progress["spent_amount"] == Decimal("400.00")
+        assert progress["remaining_amount"] == Decimal("100.00")
+        assert progress["percentage"] == 80.0
+        assert budget.check_alert_threshold()
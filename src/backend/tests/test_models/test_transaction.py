@@ -5,7 +5,7 @@ from datetime import datetime
 from uuid import uuid4
 import uuid
 
-from app.models.transaction import Transaction
+from app.models.transaction import Transaction, TransactionView
 from app.models.account import Account
 from app.models.category import Category
 from tests.conftest import test_db
@@ -240,6 +240,37 @@ async def test_transaction_to_dict(test_db):
     assert result['category']['id'] == fixture.test_category.id
     assert result['category']['name'] == fixture.test_category.name
 
+def test_transaction_view_from_cache():
+    """
+    Test rebuilding a read-only view from cached transaction data.
+    
+    Requirements addressed:
+    - Financial Tracking (1.2): Validates cached data representation
+    """
+    transaction = Transaction(
+        account_id=uuid4(),
+        transaction_date=datetime.utcnow(),
+        amount=Decimal('42.50'),
+        description='Cached Transaction',
+        transaction_type='debit'
+    )
+    transaction.category_id = None
+    transaction.post_date = None
+    transaction.merchant_name = None
+    
+    view = TransactionView.from_cache(transaction.to_dict())
+    
+    # ORM attribute types are restored; ids stay str like loaded rows
+    assert view.id == str(transaction.id)
+    assert view.account_id == str(transaction.account_id)
+    assert view.amount == Decimal('42.50')
+    assert view.transaction_date == transaction.transaction_date
+    assert view.category is None
+    
+    # Views are read-only
+    with pytest.raises(AttributeError):
+        view.amount = Decimal('0')
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize('invalid_data,expected_error', INVALID_TEST_CASES)
 async def test_transaction_validation(test_db, invalid_data, expected_error):
@@ -95,8 +95,29 @@ class TestUser:
         assert user.verify_password(self.test_password) is True
         assert user.verify_password("WrongPassword123!") is False
         
-        # Verify bcrypt format
-        assert user.password_hash.startswith("$2b$")
+        # Verify Argon2id format
+        assert user.password_hash.startswith("$argon2id$")
+
+    @pytest.mark.unit
+    def test_set_password_stores_str(self):
+        """
+        Tests that a new password hash is stored as text.
+        
+        Requirement: Data Security (6.2.2)
+        Verifies the hash fits the String password_hash column unchanged.
+        """
+        user = User(
+            email=self.test_email,
+            password=self.test_password,
+            first_name=self.test_first_name,
+            last_name=self.test_last_name
+        )
+        
+        user.set_password("NewSecurePass456!")
+        
+        assert isinstance(user.password_hash, str)
+        assert user.verify_password("NewSecurePass456!") is True
+        assert user.password_needs_rehash() is False
 
     @pytest.mark.unit
     def test_user_relationships(self):
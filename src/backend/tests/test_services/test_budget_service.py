@@ -6,11 +6,15 @@
 import pytest
 from datetime import datetime, timedelta
 from decimal import Decimal
-from uuid import UUID
+from uuid import UUID, uuid4
 from freezegun import freeze_time
 
 from app.services.budget_service import BudgetService
+from app.models.account import Account
 from app.models.budget import Budget
+from app.models.category import Category
+from app.models.transaction import Transaction
+from app.models.user import User
 from app.schemas.budget import BudgetCreate, BudgetUpdate, BudgetResponse
 from app.core.errors import NotFoundError, ValidationError
 
@@ -31,12 +35,15 @@ class TestBudgetService:
       Tests server-side validation for budget operations
     """
 
+    @pytest.fixture(autouse=True)
+    def bind_service(self, test_async_db):
+        """Binds the service under test to the async test session."""
+        self.service = BudgetService(test_async_db)
+
     def setup_method(self, method):
         """Setup method run before each test."""
-        self.db_session = pytest.fixture(scope='function')
         self.user_id = UUID('12345678-1234-5678-1234-567812345678')
         self.category_id = 1
-        self.service = BudgetService(self.db_session)
         
         # Setup test data
         self.valid_budget_data = BudgetCreate(
@@ -50,13 +57,9 @@ class TestBudgetService:
             rules={"exclude_categories": [2, 3]}
         )
 
-    def teardown_method(self, method):
-        """Cleanup method run after each test."""
-        self.db_session.rollback()
-        self.db_session.close()
-
     @freeze_time("2024-01-01 12:00:00")
-    def test_create_budget_success(self, db_session, mock_user):
+    @pytest.mark.asyncio
+    async def test_create_budget_success(self, test_async_db, mock_user):
         """
         Tests successful budget creation with valid data.
         
@@ -68,7 +71,7 @@ class TestBudgetService:
         budget_data = self.valid_budget_data
 
         # Act
-        result = self.service.create_budget(self.user_id, budget_data)
+        result = await self.service.create_budget(self.user_id, budget_data)
 
         # Assert
         assert isinstance(result, BudgetResponse)
@@ -79,7 +82,8 @@ class TestBudgetService:
         assert result.progress is not None
         assert result.progress['percentage'] == 0.0
 
-    def test_create_budget_invalid_category(self, db_session, mock_user):
+    @pytest.mark.asyncio
+    async def test_create_budget_invalid_category(self, test_async_db, mock_user):
         """
         Tests budget creation with invalid category ID.
         
@@ -93,11 +97,12 @@ class TestBudgetService:
 
         # Act & Assert
         with pytest.raises(ValidationError) as exc_info:
-            self.service.create_budget(self.user_id, invalid_budget_data)
+            await self.service.create_budget(self.user_id, invalid_budget_data)
         assert "Category 999 not found or inactive" in str(exc_info.value)
 
     @freeze_time("2024-01-01 12:00:00")
-    def test_update_budget_success(self, db_session, mock_budget):
+    @pytest.mark.asyncio
+    async def test_update_budget_success(self, test_async_db, mock_budget):
         """
         Tests successful budget update with valid data.
         
@@ -114,7 +119,7 @@ class TestBudgetService:
         )
 
         # Act
-        result = self.service.update_budget(budget_id, self.user_id, update_data)
+        result = await self.service.update_budget(budget_id, self.user_id, update_data)
 
         # Assert
         assert isinstance(result, BudgetResponse)
@@ -123,7 +128,8 @@ class TestBudgetService:
         assert result.alert_threshold == update_data.alert_threshold
         assert result.progress is not None
 
-    def test_get_budget_not_found(self, db_session):
+    @pytest.mark.asyncio
+    async def test_get_budget_not_found(self, test_async_db):
         """
         Tests retrieval of non-existent budget.
         
@@ -136,10 +142,11 @@ class TestBudgetService:
 
         # Act & Assert
         with pytest.raises(NotFoundError) as exc_info:
-            self.service.get_budget(non_existent_id, self.user_id)
+            await self.service.get_budget(non_existent_id, self.user_id)
         assert f"Budget {non_existent_id} not found" in str(exc_info.value)
 
-    def test_list_budgets_with_filters(self, db_session, mock_budgets):
+    @pytest.mark.asyncio
+    async def test_list_budgets_with_filters(self, test_async_db, mock_budgets):
         """
         Tests budget listing with various filters.
         
@@ -155,7 +162,7 @@ class TestBudgetService:
         }
 
         # Act
-        results = self.service.list_budgets(self.user_id, filters)
+        results = await self.service.list_budgets(self.user_id, filters)
 
         # Assert
         assert isinstance(results, list)
@@ -164,7 +171,8 @@ class TestBudgetService:
         assert all(budget.period == "monthly" for budget in results)
         assert all(budget.alert_enabled for budget in results)
 
-    def test_delete_budget_success(self, db_session, mock_budget):
+    @pytest.mark.asyncio
+    async def test_delete_budget_success(self, test_async_db, mock_budget):
         """
         Tests successful budget deletion.
         
@@ -176,16 +184,17 @@ class TestBudgetService:
         budget_id = 1
 
         # Act
-        result = self.service.delete_budget(budget_id, self.user_id)
+        result = await self.service.delete_budget(budget_id, self.user_id)
 
         # Assert
         assert result is True
-        deleted_budget = db_session.query(Budget).filter_by(id=budget_id).first()
+        deleted_budget = await test_async_db.get(Budget, budget_id)
         assert deleted_budget is not None
         assert deleted_budget.is_active is False
 
     @freeze_time("2024-01-01 12:00:00")
-    def test_check_budget_alerts(self, db_session, mock_budgets_with_alerts):
+    @pytest.mark.asyncio
+    async def test_check_budget_alerts(self, test_async_db, mock_budgets_with_alerts):
         """
         Tests budget alert threshold checking.
         
@@ -197,10 +206,80 @@ class TestBudgetService:
         # mock_budgets_with_alerts fixture sets up budgets with different progress levels
 
         # Act
-        alerts = self.service.check_budget_alerts(self.user_id)
+        alerts = await self.service.check_budget_alerts(self.user_id)
 
         # Assert
         assert isinstance(alerts, list)
         for alert in alerts:
             assert alert['progress']['percentage'] >= alert['alert_threshold']
-            assert alert['alert_enabled'] is True
\ No newline at end of file
+            assert alert['alert_enabled'] is True
+
+    @pytest.mark.asyncio
+    async def test_spent_amount_joins_transactions_through_accounts(self, test_async_db):
+        """
+        Tests that the period spend aggregate runs against the transaction schema.
+        
+        Requirements addressed:
+        - Budget Management Testing (1.2 Scope/Budget Management):
+          Verifies progress and alerts sum the owner's expenses in the category
+        """
+        # Arrange
+        user = User(
+            email=f"budget-{uuid4()}@example.com",
+            first_name="Test",
+            last_name="User",
+            password="SecurePass123!"
+        )
+        category = Category(name=f"Groceries {uuid4()}")
+        test_async_db.add_all([user, category])
+        await test_async_db.flush()
+
+        account = Account(
+            user_id=user.id,
+            institution_id="ins_test",
+            account_type="depository",
+            account_name="Checking",
+            account_number_masked="****1234",
+            current_balance=Decimal("1000.00"),
+            currency_code="USD"
+        )
+        test_async_db.add(account)
+        await test_async_db.flush()
+
+        now = datetime.utcnow()
+        for amount, transaction_type in (
+            (Decimal("120.00"), "expense"),
+            (Decimal("80.00"), "expense"),
+            (Decimal("500.00"), "income")
+        ):
+            transaction = Transaction(
+                account_id=account.id,
+                transaction_date=now,
+                amount=amount,
+                description="Test Transaction",
+                transaction_type=transaction_type
+            )
+            transaction.category_id = category.id
+            test_async_db.add(transaction)
+
+        budget = Budget(
+            user_id=user.id,
+            category_id=category.id,
+            name="Groceries",
+            amount=Decimal("400.00"),
+            period="monthly",
+            start_date=now,
+            alert_threshold=40,
+            alert_enabled=True
+        )
+        test_async_db.add(budget)
+        await test_async_db.flush()
+
+        # Act
+        result = await self.service.get_budget(budget.id, user.id)
+        alerts = await self.service.check_budget_alerts(user.id)
+
+        # Assert
+        assert result.progress['spent_amount'] == Decimal("200.00")
+        assert result.progress['percentage'] == 50.0
+        assert [alert['id'] for alert in alerts] == [budget.id]
@@ -20,16 +20,17 @@ from app.core.errors import DatabaseError
 from tests.conftest import get_test_db, test_user
 
 @pytest.fixture
-def goal_service(test_db):
+def goal_service(test_async_db):
     """
     Fixture providing configured GoalService instance.
     
     Requirements addressed:
     - Testing Infrastructure (2.5): Provides isolated test service instance
     """
-    return GoalService(test_db)
+    return GoalService(test_async_db)
 
-def test_create_goal(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_create_goal(goal_service, test_user):
     """
     Test goal creation functionality.
     
@@ -50,7 +51,7 @@ def test_create_goal(goal_service, test_user):
     )
     
     # Create goal
-    created_goal = goal_service.create_goal(goal_data)
+    created_goal = await goal_service.create_goal(goal_data)
     
     # Verify created goal
     assert isinstance(created_goal, GoalInDB)
@@ -72,9 +73,10 @@ def test_create_goal(goal_service, test_user):
             target_date=target_date,
             account_id=uuid4()
         )
-        goal_service.create_goal(invalid_data)
+        await goal_service.create_goal(invalid_data)
 
-def test_get_goal(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_get_goal(goal_service, test_user):
     """
     Test goal retrieval functionality.
     
@@ -93,10 +95,10 @@ def test_get_goal(goal_service, test_user):
         target_date=target_date,
         account_id=uuid4()
     )
-    created_goal = goal_service.create_goal(goal_data)
+    created_goal = await goal_service.create_goal(goal_data)
     
     # Retrieve goal
-    retrieved_goal = goal_service.get_goal(created_goal.id, UUID(test_user["sub"]))
+    retrieved_goal = await goal_service.get_goal(created_goal.id, UUID(test_user["sub"]))
     
     # Verify retrieved goal
     assert isinstance(retrieved_goal, GoalResponse)
@@ -105,12 +107,13 @@ def test_get_goal(goal_service, test_user):
     assert 0 <= retrieved_goal.days_remaining <= 30
     
     # Test non-existent goal
-    assert goal_service.get_goal(uuid4(), UUID(test_user["sub"])) is None
+    assert await goal_service.get_goal(uuid4(), UUID(test_user["sub"])) is None
     
     # Test wrong user_id
-    assert goal_service.get_goal(created_goal.id, uuid4()) is None
+    assert await goal_service.get_goal(created_goal.id, uuid4()) is None
 
-def test_list_goals(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_list_goals(goal_service, test_user):
     """
     Test listing of user goals.
     
@@ -133,7 +136,7 @@ def test_list_goals(goal_service, test_user):
     ]
     
     for goal_data in goals_data:
-        goal_service.create_goal(goal_data)
+        await goal_service.create_goal(goal_data)
     
     # Create goal for different user
     other_goal = GoalCreate(
@@ -145,10 +148,10 @@ def test_list_goals(goal_service, test_user):
         target_date=target_date,
         account_id=uuid4()
     )
-    goal_service.create_goal(other_goal)
+    await goal_service.create_goal(other_goal)
     
     # List goals
-    user_goals = goal_service.list_goals(UUID(test_user["sub"]))
+    user_goals = await goal_service.list_goals(UUID(test_user["sub"]))
     
     # Verify goals list
     assert len(user_goals) == 3
@@ -156,9 +159,10 @@ def test_list_goals(goal_service, test_user):
     assert all(goal.user_id == UUID(test_user["sub"]) for goal in user_goals)
     
     # Verify empty list for non-existent user
-    assert len(goal_service.list_goals(uuid4())) == 0
+    assert len(await goal_service.list_goals(uuid4())) == 0
 
-def test_update_goal(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_update_goal(goal_service, test_user):
     """
     Test goal update functionality.
     
@@ -177,7 +181,7 @@ def test_update_goal(goal_service, test_user):
         target_date=target_date,
         account_id=uuid4()
     )
-    created_goal = goal_service.create_goal(goal_data)
+    created_goal = await goal_service.create_goal(goal_data)
     
     # Update goal
     new_target_date = datetime.utcnow() + timedelta(days=60)
@@ -188,7 +192,7 @@ def test_update_goal(goal_service, test_user):
         target_date=new_target_date
     )
     
-    updated_goal = goal_service.update_goal(created_goal.id, UUID(test_user["sub"]), update_data)
+    updated_goal = await goal_service.update_goal(created_goal.id, UUID(test_user["sub"]), update_data)
     
     # Verify updates
     assert updated_goal.name == "Updated Goal"
@@ -198,17 +202,18 @@ def test_update_goal(goal_service, test_user):
     
     # Test partial update
     partial_update = GoalUpdate(name="Partially Updated")
-    partial_result = goal_service.update_goal(created_goal.id, UUID(test_user["sub"]), partial_update)
+    partial_result = await goal_service.update_goal(created_goal.id, UUID(test_user["sub"]), partial_update)
     assert partial_result.name == "Partially Updated"
     assert partial_result.target_amount == Decimal("2000.00")  # Unchanged
     
     # Test non-existent goal
-    assert goal_service.update_goal(uuid4(), UUID(test_user["sub"]), update_data) is None
+    assert await goal_service.update_goal(uuid4(), UUID(test_user["sub"]), update_data) is None
     
     # Test wrong user_id
-    assert goal_service.update_goal(created_goal.id, uuid4(), update_data) is None
+    assert await goal_service.update_goal(created_goal.id, uuid4(), update_data) is None
 
-def test_delete_goal(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_delete_goal(goal_service, test_user):
     """
     Test goal deletion functionality.
     
@@ -227,21 +232,22 @@ def test_delete_goal(goal_service, test_user):
         target_date=target_date,
         account_id=uuid4()
     )
-    created_goal = goal_service.create_goal(goal_data)
+    created_goal = await goal_service.create_goal(goal_data)
     
     # Delete goal
-    assert goal_service.delete_goal(created_goal.id, UUID(test_user["sub"])) is True
+    assert await goal_service.delete_goal(created_goal.id, UUID(test_user["sub"])) is True
     
     # Verify deletion
-    assert goal_service.get_goal(created_goal.id, UUID(test_user["sub"])) is None
+    assert await goal_service.get_goal(created_goal.id, UUID(test_user["sub"])) is None
     
     # Test deleting non-existent goal
-    assert goal_service.delete_goal(uuid4(), UUID(test_user["sub"])) is False
+    assert await goal_service.delete_goal(uuid4(), UUID(test_user["sub"])) is False
     
     # Test deleting with wrong user_id
-    assert goal_service.delete_goal(created_goal.id, uuid4()) is False
+    assert await goal_service.delete_goal(created_goal.id, uuid4()) is False
 
-def test_update_goal_progress(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_update_goal_progress(goal_service, test_user):
     """
     Test goal progress update functionality.
     
@@ -260,10 +266,10 @@ def test_update_goal_progress(goal_service, test_user):
         target_date=target_date,
         account_id=uuid4()
     )
-    created_goal = goal_service.create_goal(goal_data)
+    created_goal = await goal_service.create_goal(goal_data)
     
     # Update progress
-    updated_goal = goal_service.update_goal_progress(
+    updated_goal = await goal_service.update_goal_progress(
         created_goal.id,
         UUID(test_user["sub"]),
         Decimal("500.00")
@@ -275,7 +281,7 @@ def test_update_goal_progress(goal_service, test_user):
     assert not updated_goal.is_completed
     
     # Test goal completion
-    completed_goal = goal_service.update_goal_progress(
+    completed_goal = await goal_service.update_goal_progress(
         created_goal.id,
         UUID(test_user["sub"]),
         Decimal("1000.00")
@@ -286,12 +292,13 @@ def test_update_goal_progress(goal_service, test_user):
     assert completed_goal.progress_percentage == 100.0
     
     # Test non-existent goal
-    assert goal_service.update_goal_progress(uuid4(), UUID(test_user["sub"]), Decimal("100.00")) is None
+    assert await goal_service.update_goal_progress(uuid4(), UUID(test_user["sub"]), Decimal("100.00")) is None
     
     # Test wrong user_id
-    assert goal_service.update_goal_progress(created_goal.id, uuid4(), Decimal("100.00")) is None
+    assert await goal_service.update_goal_progress(created_goal.id, uuid4(), Decimal("100.00")) is None
 
-def test_goal_validation(goal_service, test_user):
+@pytest.mark.asyncio
+async def test_goal_validation(goal_service, test_user):
     """
     Test goal data validation.
     
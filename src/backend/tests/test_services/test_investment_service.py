@@ -3,6 +3,7 @@ import pytest
 from decimal import Decimal
 from uuid import UUID, uuid4
 from datetime import datetime
+from unittest.mock import MagicMock
 
 from app.services.investment_service import InvestmentService
 from app.models.investment import Investment
@@ -267,6 +268,25 @@ async def test_sync_investment_values(test_investment_service):
             current_value=new_value
         )
 
+def test_sync_investment_values_bulk_rejects_duplicate_ids():
+    """
+    Test that a bulk sync naming the same investment twice is rejected.
+    
+    Requirements addressed:
+    - Investment Tracking (1.2): Validates every update is applied deterministically
+    """
+    db = MagicMock()
+    investment_id = uuid4()
+    
+    with pytest.raises(ValueError, match="appear more than once"):
+        InvestmentService(db).sync_investment_values_bulk([
+            (investment_id, Decimal('1800.00'), None),
+            (uuid4(), Decimal('500.00'), None),
+            (investment_id, Decimal('1900.00'), None)
+        ])
+    
+    db.execute.assert_not_called()
+
 @pytest.mark.asyncio
 async def test_calculate_portfolio_metrics(test_investment_service):
     """
@@ -4,7 +4,7 @@ Test suite for NotificationService functionality.
 Human Tasks:
 1. Configure test environment variables for notification services
 2. Set up mock APNS certificates for testing
-3. Create test Firebase project credentials
+3. Create test Firebase service account credentials
 4. Configure test VAPID keys for Web Push
 5. Set up local Redis instance for testing
 """
@@ -16,12 +16,16 @@ Human Tasks:
 
 import pytest
 from unittest.mock import MagicMock, AsyncMock, patch
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+import orjson
 
 from app.services.notification_service import (
     NotificationService,
     NOTIFICATION_TYPES,
-    PLATFORM_TYPES
+    PLATFORM_TYPES,
+    MAX_RETRIES,
+    format_notification
 )
 from app.core.config import Settings
 from app.core.events import EventManager
@@ -34,6 +38,8 @@ TEST_NOTIFICATION_PAYLOAD: Dict[str, Any] = {
     'body': 'Test message',
     'data': {'type': 'test'}
 }
+# SMEMBERS replies for the legacy per-platform sets pipelined after each HGETALL
+NO_LEGACY_TOKENS: List[set] = [set() for _ in PLATFORM_TYPES]
 
 def pytest_configure(config):
     """Configure pytest environment for notification tests."""
@@ -51,9 +57,24 @@ class TestNotificationService:
         """Set up test environment for notification tests."""
         # Initialize mock clients
         self._mock_apns_client = AsyncMock()
-        self._mock_fcm_client = MagicMock()
-        self._mock_web_push_client = MagicMock()
-        self._mock_redis = AsyncMock()
+        self._mock_apns_client.send_notification.return_value = MagicMock(is_successful=True)
+        self._mock_http_client = AsyncMock()
+        self._mock_http_client.post.return_value = MagicMock(status_code=200)
+        self._mock_fcm_credentials = MagicMock(valid=True, token='test-oauth-token', project_id='test-project')
+        self._mock_web_pusher = MagicMock()
+        self._mock_web_pusher.return_value.encode.return_value = {'body': b'encrypted'}
+        self._mock_vapid = MagicMock()
+        self._mock_vapid.sign.return_value = {'Authorization': 'vapid t=test,k=test'}
+        
+        # Redis: device tokens come back through a pipeline of HGETALLs and
+        # registration goes through a Lua script
+        self._mock_redis = MagicMock()
+        self._mock_redis.hset = AsyncMock()
+        self._mock_pipeline = MagicMock()
+        self._mock_pipeline.execute = AsyncMock()
+        self._mock_redis.pipeline.return_value.__aenter__.return_value = self._mock_pipeline
+        self._mock_add_device_token = AsyncMock()
+        self._mock_redis.register_script.return_value = self._mock_add_device_token
         self._mock_event_manager = AsyncMock()
         
         # Initialize settings with test configuration
@@ -62,7 +83,10 @@ class TestNotificationService:
         
         # Create NotificationService instance with mocks
         with patch('aioapns.APNs', return_value=self._mock_apns_client), \
-             patch('firebase_admin.initialize_app', return_value=self._mock_fcm_client), \
+             patch('google.oauth2.service_account.Credentials.from_service_account_file',
+                   return_value=self._mock_fcm_credentials), \
+             patch('httpx.AsyncClient', return_value=self._mock_http_client), \
+             patch('app.services.notification_service.Vapid.from_string', return_value=self._mock_vapid), \
              patch('aioredis.from_url', return_value=self._mock_redis):
             self._notification_service = NotificationService(
                 settings=self._settings,
@@ -74,19 +98,27 @@ class TestNotificationService:
         # Requirement: Push Notification Integration - Cross-platform delivery
         
         # Mock device token retrieval
-        self._mock_redis.smembers.return_value = {TEST_DEVICE_TOKEN}
+        subscription = orjson.dumps({'endpoint': 'https://push.example.com/sub/1', 'keys': {}}).decode()
+        self._mock_pipeline.execute.return_value = [{
+            PLATFORM_TYPES['IOS']: orjson.dumps([TEST_DEVICE_TOKEN]).decode(),
+            PLATFORM_TYPES['ANDROID']: orjson.dumps([TEST_DEVICE_TOKEN]).decode(),
+            PLATFORM_TYPES['WEB']: orjson.dumps([subscription]).decode()
+        }] + NO_LEGACY_TOKENS
         
         # Test iOS notification
         await self._test_platform_notification(PLATFORM_TYPES['IOS'])
         self._mock_apns_client.send_notification.assert_called_once()
         
-        # Test Android notification
+        # Test Android notification (FCM HTTP v1)
         await self._test_platform_notification(PLATFORM_TYPES['ANDROID'])
-        assert self._mock_fcm_client.messaging.send_multicast.called
+        assert self._mock_http_client.post.called
         
         # Test Web notification
-        await self._test_platform_notification(PLATFORM_TYPES['WEB'])
-        assert self._mock_web_push_client.called
+        self._mock_http_client.post.reset_mock()
+        with patch('app.services.notification_service.WebPusher', self._mock_web_pusher):
+            await self._test_platform_notification(PLATFORM_TYPES['WEB'])
+        self._mock_web_pusher.return_value.encode.assert_called_once()
+        assert self._mock_http_client.post.call_args.args[0] == 'https://push.example.com/sub/1'
         
         # Verify event publication
         self._mock_event_manager.publish_event.assert_called()
@@ -99,7 +131,11 @@ class TestNotificationService:
         test_tokens = {user: f'token-{user}' for user in test_users}
         
         # Mock device token retrieval for multiple users
-        self._mock_redis.smembers.side_effect = lambda key: {test_tokens[key.split(':')[1]]}
+        self._mock_pipeline.execute.return_value = [
+            reply
+            for user in test_users
+            for reply in [{PLATFORM_TYPES['IOS']: orjson.dumps([test_tokens[user]]).decode()}] + NO_LEGACY_TOKENS
+        ]
         
         # Send bulk notification
         result = await self._notification_service.send_bulk_notification(
@@ -122,13 +158,34 @@ class TestNotificationService:
             }
         )
     
+    async def test_get_user_devices_reads_legacy_sets(self):
+        """Test that devices registered under the per-platform sets are still found."""
+        # Requirement: Push Notification Integration - Cross-platform delivery
+        
+        legacy_token = 'legacy-device-token'
+        platforms = list(PLATFORM_TYPES.values())
+        legacy_sets = [
+            {legacy_token, TEST_DEVICE_TOKEN} if platform == PLATFORM_TYPES['IOS'] else set()
+            for platform in platforms
+        ]
+        self._mock_pipeline.execute.return_value = [
+            {PLATFORM_TYPES['IOS']: orjson.dumps([TEST_DEVICE_TOKEN]).decode()}
+        ] + legacy_sets
+        
+        devices = await self._notification_service._get_user_devices(TEST_USER_ID)
+        
+        # Tokens in both layouts are returned once
+        assert devices == {PLATFORM_TYPES['IOS']: [TEST_DEVICE_TOKEN, legacy_token]}
+        self._mock_pipeline.smembers.assert_any_call(
+            f"device_tokens:{TEST_USER_ID}:{PLATFORM_TYPES['IOS']}"
+        )
+    
     async def test_register_device(self):
         """Test device registration for notifications."""
         # Requirement: Push Notification Integration - Device registration
         
         # Test successful registration
-        self._mock_redis.smembers.return_value = set()
-        self._mock_redis.sadd.return_value = True
+        self._mock_add_device_token.return_value = 1
         
         result = await self._notification_service.register_device(
             user_id=TEST_USER_ID,
@@ -137,10 +194,13 @@ class TestNotificationService:
         )
         
         assert result is True
-        self._mock_redis.sadd.assert_called_once()
+        self._mock_add_device_token.assert_called_once_with(
+            keys=[f"device_tokens:{TEST_USER_ID}"],
+            args=[PLATFORM_TYPES['IOS'], TEST_DEVICE_TOKEN]
+        )
         
         # Test duplicate registration
-        self._mock_redis.smembers.return_value = {TEST_DEVICE_TOKEN}
+        self._mock_add_device_token.return_value = 0
         
         result = await self._notification_service.register_device(
             user_id=TEST_USER_ID,
@@ -189,6 +249,84 @@ class TestNotificationService:
                 preferences=invalid_preferences
             )
     
+    async def test_deliver_retries_transient_failure(self):
+        """Test that a transient provider failure is retried until it succeeds."""
+        # Requirement: Push Notification Integration - Reliable delivery
+        
+        payload = format_notification(
+            PLATFORM_TYPES['ANDROID'], NOTIFICATION_TYPES['BUDGET_ALERT'], TEST_NOTIFICATION_PAYLOAD
+        )
+        self._mock_http_client.post.side_effect = [
+            MagicMock(status_code=503),
+            MagicMock(status_code=200)
+        ]
+        
+        with patch('app.services.notification_service.asyncio.sleep', new=AsyncMock()) as sleep:
+            result = await self._notification_service._deliver(
+                PLATFORM_TYPES['ANDROID'], [TEST_DEVICE_TOKEN], payload, [TEST_USER_ID]
+            )
+        
+        assert result == [True]
+        assert self._mock_http_client.post.call_count == 2
+        sleep.assert_awaited_once()
+    
+    async def test_deliver_stops_retrying_after_cap(self):
+        """Test that a persistently transient failure gives up after MAX_RETRIES attempts."""
+        # Requirement: Push Notification Integration - Reliable delivery
+        
+        payload = format_notification(
+            PLATFORM_TYPES['ANDROID'], NOTIFICATION_TYPES['BUDGET_ALERT'], TEST_NOTIFICATION_PAYLOAD
+        )
+        self._mock_http_client.post.return_value = MagicMock(status_code=503)
+        
+        with patch('app.services.notification_service.asyncio.sleep', new=AsyncMock()) as sleep:
+            result = await self._notification_service._deliver(
+                PLATFORM_TYPES['ANDROID'], [TEST_DEVICE_TOKEN], payload, [TEST_USER_ID]
+            )
+        
+        assert result == [False]
+        assert self._mock_http_client.post.call_count == MAX_RETRIES
+        assert sleep.await_count == MAX_RETRIES - 1
+    
+    async def test_deliver_removes_unregistered_tokens(self):
+        """Test that tokens a provider reports as gone are dropped, not retried."""
+        # Requirement: Push Notification Integration - Device registration
+        
+        stale_token = 'stale-device-token'
+        
+        # FCM: UNREGISTERED (404) is removed; a rejected payload (400) is only failed
+        payload = format_notification(
+            PLATFORM_TYPES['ANDROID'], NOTIFICATION_TYPES['BUDGET_ALERT'], TEST_NOTIFICATION_PAYLOAD
+        )
+        self._mock_http_client.post.side_effect = [
+            MagicMock(status_code=404),
+            MagicMock(status_code=400)
+        ]
+        with patch.object(self._notification_service, '_remove_device_tokens', new=AsyncMock()) as remove:
+            result = await self._notification_service._deliver(
+                PLATFORM_TYPES['ANDROID'], [stale_token, TEST_DEVICE_TOKEN], payload, ['user1', 'user2']
+            )
+        
+        assert result == [False, False]
+        assert self._mock_http_client.post.call_count == 2
+        remove.assert_awaited_once_with(PLATFORM_TYPES['ANDROID'], {'user1': [stale_token]})
+        
+        # APNs: 410 Unregistered is removed
+        payload = format_notification(
+            PLATFORM_TYPES['IOS'], NOTIFICATION_TYPES['BUDGET_ALERT'], TEST_NOTIFICATION_PAYLOAD
+        )
+        self._mock_apns_client.send_notification.return_value = MagicMock(
+            is_successful=False, status='410', description='Unregistered'
+        )
+        with patch.object(self._notification_service, '_remove_device_tokens', new=AsyncMock()) as remove:
+            result = await self._notification_service._deliver(
+                PLATFORM_TYPES['IOS'], [stale_token], payload, [TEST_USER_ID]
+            )
+        
+        assert result == [False]
+        self._mock_apns_client.send_notification.assert_awaited_once()
+        remove.assert_awaited_once_with(PLATFORM_TYPES['IOS'], {TEST_USER_ID: [stale_token]})
+    
     async def _test_platform_notification(self, platform: str):
         """Helper method to test notification delivery for specific platform."""
         result = await self._notification_service.send_notification(
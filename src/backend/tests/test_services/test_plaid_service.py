@@ -17,6 +17,9 @@ from datetime import datetime, timedelta
 import json
 from typing import Dict, List
 
+# plaid-python: ^9.1.0
+import plaid
+
 from app.services.plaid_service import PlaidService
 from app.core.config import Settings
 from app.core.encryption import EncryptionManager
@@ -75,7 +78,6 @@ class TestPlaidService:
         assert service._client is not None
         assert service._encryption_manager == encryption_manager
         assert service._logger is not None
-        assert service._http_session is None
 
     @pytest.mark.asyncio
     async def test_create_link_token(self, plaid_service: PlaidService, mocker):
@@ -117,6 +119,25 @@ class TestPlaidService:
         assert result["item_id"] == "test_item_id"
         plaid_service._client.item_public_token_exchange.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_exchange_public_token_not_retried(self, plaid_service: PlaidService, mocker):
+        """
+        Test that a failed exchange is not retried, since public tokens are single-use.
+        
+        Requirement: Security Testing
+        Location: 6.2 Data Security/6.2.2 Sensitive Data Handling
+        """
+        mocker.patch.object(
+            plaid_service._client,
+            'item_public_token_exchange',
+            side_effect=plaid.ApiException(status=500, reason="Internal Server Error")
+        )
+        
+        with pytest.raises(plaid.ApiException):
+            await plaid_service.exchange_public_token(TEST_PUBLIC_TOKEN)
+        
+        plaid_service._client.item_public_token_exchange.assert_called_once()
+
     @pytest.mark.asyncio
     async def test_get_accounts(self, plaid_service: PlaidService, mocker):
         """
@@ -146,6 +167,38 @@ class TestPlaidService:
         assert accounts[0]["type"] == "depository"
         assert accounts[0]["balances"]["current"] == 1000.0
 
+    @pytest.mark.asyncio
+    async def test_accounts_and_balances_share_accounts_get(self, plaid_service: PlaidService, mocker):
+        """
+        Test that get_accounts and get_balances reuse one accounts_get response.
+        
+        Requirement: Financial Account Aggregation Testing
+        Location: 1.2 Scope/In Scope/Account Management
+        """
+        mock_account = mocker.MagicMock()
+        mock_account.account_id = "test_account_id"
+        mock_account.balances.current = 1000.0
+        mock_account.balances.available = 900.0
+        mock_account.balances.limit = None
+        
+        mock_response = mocker.MagicMock()
+        mock_response.accounts = [mock_account]
+        mocker.patch.object(plaid_service._client, 'accounts_get', return_value=mock_response)
+        
+        access_token = json.dumps({"access_token": TEST_ACCESS_TOKEN})
+        accounts = await plaid_service.get_accounts(access_token)
+        balances = await plaid_service.get_balances(access_token)
+        
+        assert accounts[0]["id"] == balances[0]["account_id"]
+        plaid_service._client.accounts_get.assert_called_once()
+        
+        # The cached response keeps the time it was fetched
+        assert (await plaid_service.get_balances(access_token)) == balances
+        
+        plaid_service.invalidate_accounts(access_token)
+        await plaid_service.get_balances(access_token)
+        assert plaid_service._client.accounts_get.call_count == 2
+
     @pytest.mark.asyncio
     async def test_get_transactions(self, plaid_service: PlaidService, mocker):
         """
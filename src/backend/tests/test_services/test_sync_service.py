@@ -145,6 +145,28 @@ class TestSyncService:
         assert result['cursor'] == mock_cursor
         assert 'sync_time' in result
 
+    @pytest.mark.asyncio
+    async def test_sync_one_invalidates_accounts(self):
+        """
+        Test that each item sync drops the shared accounts_get response,
+        including when the sync fails.
+        
+        Requirement: Real-time Synchronization - 1.1 System Overview/Backend Services
+        """
+        user_id = "test_user_123"
+        access_token = "test_access_token"
+        self.sync_service.sync_account_data = AsyncMock(return_value={})
+        self.sync_service.sync_transactions = AsyncMock(return_value={})
+        
+        await self.sync_service._sync_one(user_id, access_token)
+        self.plaid_service.invalidate_accounts.assert_called_once_with(access_token)
+        
+        self.plaid_service.invalidate_accounts.reset_mock()
+        self.sync_service.sync_transactions.side_effect = RuntimeError("sync failed")
+        with pytest.raises(RuntimeError):
+            await self.sync_service._sync_one(user_id, access_token)
+        self.plaid_service.invalidate_accounts.assert_called_once_with(access_token)
+
     @pytest.mark.asyncio
     async def test_schedule_sync(self):
         """
@@ -1,12 +1,12 @@
 # pytest: ^7.0.0
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import AsyncMock, Mock, patch
 from datetime import datetime, timedelta
 from decimal import Decimal
 import uuid
 
 # Internal imports
-from app.services.transaction_service import TransactionService, TransactionCreate, TransactionUpdate
+from app.services.transaction_service import TransactionService, TransactionCreate, TransactionUpdate, _copy_value
 from app.models.transaction import Transaction
 from tests.conftest import get_test_db, get_test_redis
 
@@ -35,7 +35,7 @@ def transaction_service(test_db, test_redis):
     """
     # Mock Plaid service
     mock_plaid = Mock()
-    mock_plaid.sync_transactions = Mock(return_value=([], "test_cursor"))
+    mock_plaid.sync_transactions_page = AsyncMock(return_value=([], "test_cursor", False))
     
     # Create service instance
     service = TransactionService(test_db, mock_plaid)
@@ -69,8 +69,12 @@ async def test_get_transaction(transaction_service, test_db):
     assert cached_result.id == transaction.id
     
     # Test non-existent transaction
-    non_existent = await transaction_service.get_transaction(uuid.uuid4())
+    missing_id = uuid.uuid4()
+    non_existent = await transaction_service.get_transaction(missing_id)
     assert non_existent is None
+    
+    # The miss is remembered briefly, so waiting callers stop polling
+    assert transaction_service._cache.get(f"transaction:{missing_id}") == {}
 
 @pytest.mark.asyncio
 async def test_get_transactions(transaction_service, test_db):
@@ -118,6 +122,65 @@ async def test_get_transactions(transaction_service, test_db):
     )
     assert len(results) == 2
     assert count == 5
+    
+    # Repeat request is served from the cached page
+    with patch.object(transaction_service, '_filtered_query') as filtered_query:
+        cached_results, cached_count = await transaction_service.get_transactions(
+            account_id=account_id,
+            page=1,
+            page_size=2
+        )
+    filtered_query.assert_not_called()
+    assert [t.id for t in cached_results] == [t.id for t in results]
+    assert cached_count == 5
+
+@pytest.mark.asyncio
+async def test_get_transactions_page(transaction_service, test_db):
+    """
+    Test keyset pagination over transactions.
+    
+    Requirements addressed:
+    - Financial Tracking Testing (1.2): Verify transaction pagination
+    """
+    account_id = uuid.uuid4()
+    base_date = datetime.now()
+    
+    for i in range(5):
+        test_db.add(Transaction(
+            account_id=account_id,
+            amount=Decimal(f'{100 + i}.00'),
+            description=f'Test Transaction {i}',
+            transaction_type='debit',
+            transaction_date=base_date - timedelta(days=i)
+        ))
+    
+    await test_db.commit()
+    
+    # Walk all pages; each continues after the previous one's last row
+    seen = []
+    cursor = None
+    while True:
+        results, cursor = transaction_service.get_transactions_page(
+            account_id=account_id,
+            cursor=cursor,
+            page_size=2
+        )
+        seen.extend(results)
+        if cursor is None:
+            break
+    
+    assert len(seen) == 5
+    assert len({t.id for t in seen}) == 5
+    assert [t.transaction_date for t in seen] == sorted(
+        (t.transaction_date for t in seen), reverse=True
+    )
+    
+    # Malformed cursors are rejected
+    with pytest.raises(ValueError):
+        transaction_service.get_transactions_page(
+            account_id=account_id,
+            cursor="not-a-cursor"
+        )
 
 @pytest.mark.asyncio
 async def test_create_transaction(transaction_service):
@@ -206,10 +269,11 @@ async def test_sync_transactions(transaction_service):
         'pending': False
     }]
     
-    transaction_service._plaid_service.sync_transactions.return_value = (
-        plaid_transactions,
-        "updated_cursor"
-    )
+    # Two pages: the second is fetched with the first page's cursor
+    transaction_service._plaid_service.sync_transactions_page.side_effect = [
+        (plaid_transactions, "page_2_cursor", True),
+        ([dict(plaid_transactions[0], id='plaid_tx_2')], "updated_cursor", False)
+    ]
     
     # Test sync
     transactions, cursor = await transaction_service.sync_transactions(
@@ -217,9 +281,55 @@ async def test_sync_transactions(transaction_service):
         access_token="test_token"
     )
     
-    assert len(transactions) == 1
+    assert len(transactions) == 2
     assert cursor == "updated_cursor"
     assert transactions[0].description == "Plaid Test Transaction"
+    transaction_service._plaid_service.sync_transactions_page.assert_called_with(
+        "test_token", "page_2_cursor"
+    )
+
+@pytest.mark.asyncio
+async def test_sync_transactions_rolls_back_on_failed_page(transaction_service, test_db):
+    """
+    Test that a sync failing mid-way commits none of its pages.
+    
+    Requirements addressed:
+    - Financial Tracking Testing (1.2): Verify a retried import does not duplicate rows
+    """
+    account_id = uuid.uuid4()
+    transaction_service._plaid_service.sync_transactions_page.side_effect = [
+        ([{
+            'id': 'plaid_tx_1',
+            'date': datetime.now().isoformat(),
+            'amount': 50.00,
+            'name': 'Plaid Test Transaction',
+            'pending': False
+        }], "page_2_cursor", True),
+        Exception("Plaid unavailable")
+    ]
+    
+    with pytest.raises(Exception):
+        await transaction_service.sync_transactions(
+            account_id=account_id,
+            access_token="test_token"
+        )
+    
+    assert test_db.query(Transaction).filter(Transaction.account_id == account_id).count() == 0
+
+def test_copy_value_encoding():
+    """
+    Test COPY text-format rendering used for large sync batches.
+    
+    Requirements addressed:
+    - Financial Tracking Testing (1.2): Verify bulk import preserves values
+    """
+    assert _copy_value(None) == '\\N'
+    assert _copy_value(True) == 't'
+    assert _copy_value(False) == 'f'
+    assert _copy_value(Decimal('12.50')) == '12.50'
+    assert _copy_value(datetime(2023, 1, 2, 3, 4, 5)) == '2023-01-02T03:04:05'
+    assert _copy_value('a\tb\nc\\d') == 'a\\tb\\nc\\\\d'
+    assert _copy_value({'pending': False}) == '{"pending":false}'
 
 @pytest.mark.asyncio
 async def test_categorize_transaction(transaction_service, test_db):
@@ -14,9 +14,18 @@ import pytest
 from app.utils.crypto import (
     generate_salt,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
+    password_needs_rehash,
+    resolve_argon2_memory_cost,
+    resolve_hash_pool_workers,
+    ARGON2_MEMORY_COST_ENV,
+    ARGON2_MIN_MEMORY_KIB,
+    HASH_POOL_WORKERS_ENV,
     generate_key,
     compute_hash,
+    compute_hash_fast,
     KeyDerivation
 )
 
@@ -54,6 +63,13 @@ class TestCrypto:
         salt2 = generate_salt(32)
         assert salt1 != salt2
 
+        # Salts drawn across a buffer refill never repeat
+        salts = {generate_salt(32) for _ in range(5000)}
+        assert len(salts) == 5000
+
+        # Lengths beyond the buffered range are served directly
+        assert len(generate_salt(4096)) == 4096
+
         # Test invalid length
         with pytest.raises(ValueError, match="Salt length must be positive"):
             generate_salt(-1)
@@ -66,7 +82,7 @@ class TestCrypto:
         # Test ASCII password
         password = "SecurePassword123!"
         hashed = hash_password(password)
-        assert isinstance(hashed, bytes)
+        assert isinstance(hashed, str)
         assert len(hashed) > 0
 
         # Test empty password
@@ -76,7 +92,7 @@ class TestCrypto:
         # Test Unicode password
         unicode_password = "パスワード123!@#"
         unicode_hash = hash_password(unicode_password)
-        assert isinstance(unicode_hash, bytes)
+        assert isinstance(unicode_hash, str)
 
         # Verify different passwords produce different hashes
         hash1 = hash_password("password1")
@@ -114,6 +130,69 @@ class TestCrypto:
         with pytest.raises(ValueError):
             verify_password(password, b"invalid_hash_format")
 
+    def test_password_rehash_migration(self):
+        """
+        Requirement: Password Security - 6.2.2 Sensitive Data Handling
+        Test Argon2id hashing and transparent migration of legacy bcrypt hashes.
+        """
+        import bcrypt
+
+        password = "SecurePassword123!"
+
+        # New hashes are Argon2id and current
+        hashed = hash_password(password)
+        assert hashed.startswith("$argon2id$")
+        assert password_needs_rehash(hashed) is False
+
+        # Legacy bcrypt hashes still verify but are flagged for rehash
+        legacy_hash = bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=4))
+        assert verify_password(password, legacy_hash) is True
+        assert verify_password(password, legacy_hash.decode("ascii")) is True
+        assert verify_password("WrongPassword123!", legacy_hash) is False
+        assert password_needs_rehash(legacy_hash) is True
+
+    def test_argon2_memory_cost_from_environment(self, monkeypatch):
+        """
+        Requirement: Password Security - 6.2.2 Sensitive Data Handling
+        Test that a configured memory cost is used as-is instead of calibrating.
+        """
+        monkeypatch.setenv(ARGON2_MEMORY_COST_ENV, str(32 * 1024))
+        assert resolve_argon2_memory_cost() == 32 * 1024
+
+        monkeypatch.setenv(ARGON2_MEMORY_COST_ENV, str(ARGON2_MIN_MEMORY_KIB - 1))
+        with pytest.raises(ValueError):
+            resolve_argon2_memory_cost()
+
+    def test_hash_pool_workers_from_environment(self, monkeypatch):
+        """
+        Requirement: Password Security - 6.2.2 Sensitive Data Handling
+        Test that the hash pool takes its per-worker size from the environment.
+        """
+        monkeypatch.setenv(HASH_POOL_WORKERS_ENV, "2")
+        assert resolve_hash_pool_workers() == 2
+
+        monkeypatch.setenv(HASH_POOL_WORKERS_ENV, "0")
+        with pytest.raises(ValueError):
+            resolve_hash_pool_workers()
+
+        monkeypatch.delenv(HASH_POOL_WORKERS_ENV)
+        assert resolve_hash_pool_workers() >= 1
+
+    @pytest.mark.asyncio
+    async def test_password_hashing_in_process_pool(self):
+        """
+        Requirement: Password Security - 6.2.2 Sensitive Data Handling
+        Test that pool-dispatched hashing matches the in-process parameters.
+        """
+        password = "SecurePassword123!"
+
+        hashed = await hash_password_async(password)
+        assert password_needs_rehash(hashed) is False
+        assert verify_password(password, hashed) is True
+
+        assert await verify_password_async(password, hashed) is True
+        assert await verify_password_async("WrongPassword123!", hashed) is False
+
     def test_generate_key(self):
         """
         Requirement: Key Management - 6.2.1 Encryption Implementation
@@ -174,6 +253,20 @@ class TestCrypto:
         assert isinstance(empty_hash, str)
         assert len(empty_hash) == 64
 
+    def test_compute_hash_fast(self):
+        """
+        Requirement: Data Security - 6.2.1 Encryption Implementation
+        Test fast BLAKE2b hashing for bulk deduplication keys.
+        """
+        # String and bytes inputs hash identically
+        fast_hash = compute_hash_fast("test_data")
+        assert fast_hash == compute_hash_fast(b"test_data")
+        assert len(fast_hash) == 64
+
+        # Distinct from SHA-256 and sensitive to input
+        assert fast_hash != compute_hash("test_data")
+        assert fast_hash != compute_hash_fast("test_data2")
+
     def test_key_derivation(self):
         """
         Requirement: Key Management - 6.2.1 Encryption Implementation
@@ -14,7 +14,7 @@ Human Tasks:
 # pytz: ^2021.3
 
 import pytest
-from datetime import datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from freezegun import freeze_time
 from pytz import UTC
 
@@ -24,14 +24,17 @@ from app.utils.datetime import (
     get_current_datetime,
     get_date_range,
     calculate_goal_progress,
-    is_business_day
+    is_business_day,
+    us_market_holidays,
+    count_business_days,
+    _business_day_mask
 )
 from app.constants import DATETIME_FORMAT, DATE_FORMAT
 
-# Test cases for datetime string parsing
+# Test cases for datetime string parsing: (datetime_str, expected)
 TEST_DATETIME_CASES = [
-    (datetime_str='2024-01-01T12:00:00.000Z', expected=datetime(2024, 1, 1, 12, 0, tzinfo=UTC)),
-    (datetime_str='2023-12-31T23:59:59.999Z', expected=datetime(2023, 12, 31, 23, 59, 59, 999000, tzinfo=UTC))
+    ('2024-01-01T12:00:00.000Z', datetime(2024, 1, 1, 12, 0, tzinfo=UTC)),
+    ('2023-12-31T23:59:59.999Z', datetime(2023, 12, 31, 23, 59, 59, 999000, tzinfo=UTC))
 ]
 
 # Test cases for invalid datetime formats
@@ -42,30 +45,55 @@ INVALID_DATETIME_CASES = [
     '2024-01-01 12:00:00'
 ]
 
-# Test cases for datetime formatting
+# Test cases for datetime formatting: (dt, expected_str)
 FORMAT_TEST_CASES = [
-    (dt=datetime(2024, 1, 1, 12, 0, tzinfo=UTC), expected_str='2024-01-01T12:00:00.000Z'),
-    (dt=datetime(2023, 12, 31, 23, 59, 59, 999000, tzinfo=UTC), expected_str='2023-12-31T23:59:59.999Z')
+    (datetime(2024, 1, 1, 12, 0, tzinfo=UTC), '2024-01-01T12:00:00.000000Z'),
+    (datetime(2023, 12, 31, 23, 59, 59, 999000, tzinfo=UTC), '2023-12-31T23:59:59.999000Z')
 ]
 
-# Test cases for date range calculations
+# Test cases for date range calculations: (period_type, reference_date, expected_range)
+# Ranges are half-open, so the end is the start of the next period
 DATE_RANGE_CASES = [
-    (period_type='daily', reference_date=datetime(2024, 1, 1, tzinfo=UTC),
-     expected_range=(datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 1, 23, 59, 59, 999999, tzinfo=UTC))),
-    (period_type='monthly', reference_date=datetime(2024, 1, 15, tzinfo=UTC),
-     expected_range=(datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 31, 23, 59, 59, 999999, tzinfo=UTC)))
+    ('daily', datetime(2024, 1, 1, tzinfo=UTC),
+     (datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 1, 2, tzinfo=UTC))),
+    ('monthly', datetime(2024, 1, 15, tzinfo=UTC),
+     (datetime(2024, 1, 1, tzinfo=UTC), datetime(2024, 2, 1, tzinfo=UTC)))
 ]
 
-# Test cases for goal progress calculation
+# Test cases for goal progress calculation, evaluated at the frozen 2024-01-01T12:00Z:
+# (start_date, target_date, expected_progress)
 GOAL_PROGRESS_CASES = [
-    (start_date=datetime(2024, 1, 1, tzinfo=UTC), target_date=datetime(2024, 12, 31, tzinfo=UTC), expected_progress=0.0),
-    (start_date=datetime(2024, 1, 1, tzinfo=UTC), target_date=datetime(2024, 6, 30, tzinfo=UTC), expected_progress=50.0)
+    (datetime(2024, 1, 1, 12, 0, tzinfo=UTC), datetime(2024, 12, 31, tzinfo=UTC), 0.0),
+    (datetime(2023, 12, 31, 12, 0, tzinfo=UTC), datetime(2024, 1, 2, 12, 0, tzinfo=UTC), 50.0)
 ]
 
-# Test cases for business day validation
+# Test cases for business day validation: (test_date, expected_result)
+# Noon UTC keeps each case on the same calendar day in US/Eastern
 BUSINESS_DAY_CASES = [
-    (test_date=datetime(2024, 1, 1, tzinfo=UTC), expected_result=False),  # New Year's Day
-    (test_date=datetime(2024, 1, 2, tzinfo=UTC), expected_result=True)    # Regular business day
+    (datetime(2024, 1, 1, 12, 0, tzinfo=UTC), False),   # New Year's Day
+    (datetime(2024, 1, 2, 12, 0, tzinfo=UTC), True),    # Regular business day
+    (datetime(2024, 1, 6, 12, 0, tzinfo=UTC), False),   # Saturday
+    (datetime(2024, 3, 29, 12, 0, tzinfo=UTC), False),  # Good Friday
+    (datetime(2021, 12, 31, 12, 0, tzinfo=UTC), True)   # Saturday New Year is not observed on Friday
+]
+
+# Test cases for the market holiday calendar: (year, day, expected_holiday)
+HOLIDAY_CASES = [
+    (2024, date(2024, 3, 29), True),    # Good Friday
+    (2022, date(2022, 6, 20), True),    # Juneteenth (Sunday) observed on Monday
+    (2021, date(2021, 6, 18), False),   # Juneteenth not yet a market holiday
+    (2022, date(2022, 1, 1), False),    # New Year's Day on a Saturday
+    (2021, date(2021, 12, 31), False),  # ...is not observed on the prior Friday
+    (2021, date(2021, 12, 24), True),   # Christmas (Saturday) observed on Friday
+    (2026, date(2026, 7, 3), True),     # Independence Day (Saturday) observed on Friday
+    (2026, date(2026, 7, 4), False)
+]
+
+# Spans for business day counting, including ones crossing a year boundary
+COUNT_BUSINESS_DAY_CASES = [
+    (date(2021, 12, 20), date(2022, 1, 10)),
+    (date(2023, 12, 1), date(2025, 2, 1)),
+    (date(2024, 1, 1), date(2024, 1, 1))
 ]
 
 @pytest.mark.parametrize('datetime_str,expected', TEST_DATETIME_CASES)
@@ -102,7 +130,7 @@ def test_format_datetime(dt: datetime, expected_str: str) -> None:
     """
     result = format_datetime(dt)
     assert result == expected_str
-    assert len(result) == len(DATETIME_FORMAT.replace('%', '').replace('f', '000'))
+    assert parse_datetime(result) == dt
 
 @freeze_time('2024-01-01T12:00:00.000Z')
 def test_get_current_datetime() -> None:
@@ -155,4 +183,38 @@ def test_is_business_day(test_date: datetime, expected_result: bool) -> None:
     Validate business day awareness for financial operations
     """
     result = is_business_day(test_date)
-    assert result == expected_result
\ No newline at end of file
+    assert result == expected_result
+
+@pytest.mark.parametrize('year,day,expected_holiday', HOLIDAY_CASES)
+def test_us_market_holidays(year: int, day: date, expected_holiday: bool) -> None:
+    """
+    Test observed US market holidays, including weekend observance rules.
+    
+    Requirement 1.2 Scope/Financial Tracking:
+    Validate business day awareness for financial operations
+    """
+    assert (day in us_market_holidays(year)) == expected_holiday
+    
+    # The packed mask must agree with the holiday set for weekdays
+    day_bit = _business_day_mask(year) >> (day.timetuple().tm_yday - 1) & 1
+    if day.weekday() < 5:
+        assert bool(day_bit) != expected_holiday
+    else:
+        assert not day_bit
+
+@pytest.mark.parametrize('start,end', COUNT_BUSINESS_DAY_CASES)
+def test_count_business_days(start: date, end: date) -> None:
+    """
+    Test business day counting against a day-by-day count.
+    
+    Requirement 1.2 Scope/Financial Tracking:
+    Validate business day awareness for financial operations
+    """
+    expected = 0
+    day = start
+    while day < end:
+        if day.weekday() < 5 and day not in us_market_holidays(day.year):
+            expected += 1
+        day += timedelta(days=1)
+    
+    assert count_business_days(start, end) == expected
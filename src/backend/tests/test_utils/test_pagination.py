@@ -0,0 +1,126 @@
+"""
+Test suite for pagination utilities used in Mint Replica Lite backend.
+
+Human Tasks:
+1. Verify pagination behaviour against production-sized tables
+"""
+
+# Library versions:
+# pytest: ^6.2.5
+# sqlalchemy: ^1.4.0
+
+import pytest
+from sqlalchemy import Column, Integer, String, create_engine, func
+from sqlalchemy.orm import Session, declarative_base
+
+from app.utils.pagination import PaginationParams, paginate_query
+
+Base = declarative_base()
+
+class Item(Base):
+    __tablename__ = 'items'
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String(20), nullable=False)
+
+TOTAL_ITEMS = 25
+
+@pytest.fixture
+def session():
+    """In-memory SQLite session seeded with TOTAL_ITEMS rows."""
+    engine = create_engine('sqlite://')
+    Base.metadata.create_all(engine)
+    with Session(engine) as db:
+        db.add_all(Item(id=i, name=f"item-{i}") for i in range(1, TOTAL_ITEMS + 1))
+        db.commit()
+        yield db
+
+def make_params(page: int, per_page: int, sort_order: str = 'asc') -> PaginationParams:
+    # construct() skips the settings-backed limit checks, which aren't under test
+    return PaginationParams.construct(page=page, per_page=per_page, sort_by='id', sort_order=sort_order)
+
+@pytest.mark.parametrize('page,expected_ids', [
+    (1, list(range(1, 11))),
+    (3, list(range(21, 26))),
+])
+def test_paginate_query_returns_page_and_total(session, page, expected_ids):
+    """
+    Test that a page and the unpaginated total come back together.
+    
+    Requirement: Data Query Optimization
+    """
+    items, total = paginate_query(session.query(Item), make_params(page, 10))
+
+    assert total == TOTAL_ITEMS
+    assert [item.id for item in items] == expected_ids
+    assert all(isinstance(item, Item) for item in items)
+
+def test_paginate_query_respects_filters_and_sorting(session):
+    """
+    Test that the total reflects the query's filters, not the whole table.
+    
+    Requirement: Data Query Optimization
+    """
+    query = session.query(Item).filter(Item.id > 20)
+    items, total = paginate_query(query, make_params(1, 10, sort_order='desc'))
+
+    assert total == 5
+    assert [item.id for item in items] == [25, 24, 23, 22, 21]
+
+def test_paginate_query_past_last_page(session):
+    """
+    Test that a page past the end still reports the total.
+    
+    Requirement: Data Query Optimization
+    """
+    items, total = paginate_query(session.query(Item), make_params(4, 10))
+
+    assert items == []
+    assert total == TOTAL_ITEMS
+
+def test_paginate_query_empty_result(session):
+    """
+    Test pagination over a query matching no rows.
+    
+    Requirement: Data Query Optimization
+    """
+    items, total = paginate_query(session.query(Item).filter(Item.id < 0), make_params(1, 10))
+
+    assert items == []
+    assert total == 0
+
+@pytest.mark.parametrize('page,expected_buckets', [
+    (1, [0, 1, 2, 3, 4]),
+    (2, []),
+])
+def test_paginate_query_grouped(session, page, expected_buckets):
+    """
+    Test that a grouped query's total counts groups, not underlying rows.
+    
+    Requirement: Data Query Optimization
+    """
+    bucket = (Item.id % 5).label('bucket')
+    query = session.query(bucket, func.count(Item.id)).group_by(bucket).order_by(bucket)
+    params = PaginationParams.construct(page=page, per_page=10, sort_by=None, sort_order=None)
+    items, total = paginate_query(query, params)
+
+    assert total == 5
+    assert [item[0] for item in items] == expected_buckets
+
+@pytest.mark.parametrize('page,expected_parities', [
+    (1, [0, 1]),
+    (2, []),
+])
+def test_paginate_query_distinct(session, page, expected_parities):
+    """
+    Test that a DISTINCT query's total counts distinct rows, not underlying rows.
+    
+    Requirement: Data Query Optimization
+    """
+    parity = (Item.id % 2).label('parity')
+    query = session.query(parity).distinct().order_by(parity)
+    params = PaginationParams.construct(page=page, per_page=10, sort_by=None, sort_order=None)
+    items, total = paginate_query(query, params)
+
+    assert total == 2
+    assert items == expected_parities